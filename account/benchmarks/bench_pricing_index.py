@@ -0,0 +1,110 @@
+"""Measures `PricingIndex` lookups, which probe a flat table once per digit of the
+number, against binary-searching the sorted prefix array once per digit, and the memory
+and load time the table costs in each process.
+
+The pricing data is synthetic, shaped like the full SMS pricing response: countries with
+3-digit dialing prefixes, and networks with several number ranges each.
+
+Run with: `python account/benchmarks/bench_pricing_index.py`
+"""
+
+import os
+import random
+import tempfile
+import tracemalloc
+from bisect import bisect_left
+from time import perf_counter
+
+from vonage_account.pricing_index import PricingIndex, _digits
+from vonage_account.requests import ServiceType
+from vonage_account.responses import GetPricingResponse
+
+COUNTRIES = 250
+NETWORKS = 40
+RANGES = 10
+LOOKUPS = 200000
+
+
+def countries() -> list[GetPricingResponse]:
+    generator = random.Random(1)
+    result = []
+    for country in range(COUNTRIES):
+        prefix = 200 + country
+        networks = [
+            {
+                'networkCode': f'{prefix}{network:02d}',
+                'networkName': f'Network {network}',
+                'price': '0.05000000',
+                'ranges': [
+                    int(f'{prefix}{generator.randrange(10, 10**5)}')
+                    for _ in range(RANGES)
+                ],
+            }
+            for network in range(NETWORKS)
+        ]
+        result.append(
+            GetPricingResponse(
+                countryCode=f'C{country}',
+                dialingPrefix=str(prefix),
+                defaultPrice='0.08000000',
+                networks=networks,
+            )
+        )
+    return result
+
+
+def bisect_lookup(index: PricingIndex, number: str):
+    digits = _digits(number)
+    prefixes, count = index._prefixes, len(index._prefixes)
+    for length in range(min(len(digits), index._max_prefix_digits), 0, -1):
+        prefix = int(digits[:length])
+        position = bisect_left(prefixes, prefix)
+        if position < count and prefixes[position] == prefix:
+            return index._entries[index._entry_indexes[position]]
+    return None
+
+
+def rate(function, numbers: list[str]) -> float:
+    start = perf_counter()
+    for number in numbers:
+        function(number)
+    return len(numbers) / (perf_counter() - start)
+
+
+def main():
+    data = countries()
+    index = PricingIndex.from_countries(ServiceType.SMS, data)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sms.idx')
+        index.save(path)
+
+        load_start = perf_counter()
+        loaded = PricingIndex.load(path)
+        load_time = (perf_counter() - load_start) * 1000
+        del loaded
+
+        tracemalloc.start()
+        loaded = PricingIndex.load(path)
+        loaded_size = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        generator = random.Random(2)
+        numbers = [
+            f'{200 + generator.randrange(COUNTRIES)}{generator.randrange(10**9):09d}'
+            for _ in range(LOOKUPS)
+        ]
+        assert all(
+            bisect_lookup(index, number) == loaded.lookup(number)
+            for number in numbers[:1000]
+        )
+
+        print(f'{len(index)} prefixes, {LOOKUPS} lookups of 12-digit numbers')
+        print(f'load: {load_time:.0f}ms, {loaded_size:.1f} MiB per process')
+        print(f'{"table, O(digits)":<24} {rate(loaded.lookup, numbers):>10.0f} lookups/s')
+        bisect_rate = rate(lambda number: bisect_lookup(index, number), numbers)
+        print(f'{"bisect per digit":<24} {bisect_rate:>10.0f} lookups/s')
+        del loaded
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 from .account import Account
-from .errors import InvalidSecretError
+from .errors import InvalidSecretError, PricingIndexError
+from .pricing_index import PrefixPricing, PricingIndex, RefreshingPricingIndex
 from .requests import GetCountryPricingRequest, GetPrefixPricingRequest, ServiceType
 from .responses import (
     Balance,
@@ -14,6 +15,10 @@ from .responses import (
 __all__ = [
     'Account',
     'InvalidSecretError',
+    'PricingIndexError',
+    'PricingIndex',
+    'PrefixPricing',
+    'RefreshingPricingIndex',
     'GetCountryPricingRequest',
     'GetPrefixPricingRequest',
     'ServiceType',
@@ -1,7 +1,9 @@
 import re
+from typing import Iterator
 
 from pydantic import validate_call
 from vonage_account.errors import InvalidSecretError
+from vonage_account.pricing_index import PricingIndex
 from vonage_account.requests import (
     GetCountryPricingRequest,
     GetPrefixPricingRequest,
@@ -143,6 +145,47 @@ class Account:
 
         return GetMultiplePricingResponse(**response)
 
+    @validate_call
+    def stream_all_countries_pricing(
+        self, service_type: ServiceType
+    ) -> Iterator[GetPricingResponse]:
+        """Get the pricing for all countries one country at a time, while the response is
+        still being downloaded.
+
+        Unlike `get_all_countries_pricing`, the full response is never held in memory, so
+        memory use stays flat however many countries and networks are returned.
+
+        Args:
+            service_type (ServiceType): The type of service to retrieve pricing data about.
+
+        Yields:
+            GetPricingResponse: The pricing data for each country.
+        """
+        for country in self._http_client.stream_json_items(
+            self._http_client.rest_host,
+            f'/account/get-full-pricing/outbound/{service_type.value}',
+            'countries',
+            auth_type=self._auth_type,
+        ):
+            yield GetPricingResponse(**country)
+
+    @validate_call
+    def build_pricing_index(self, service_type: ServiceType) -> PricingIndex:
+        """Build an index of the prices for all countries, to look up the price of sending
+        to any number without an API request per lookup.
+
+        The pricing data is streamed, so the full response is never held in memory.
+
+        Args:
+            service_type (ServiceType): The type of service to index pricing data for.
+
+        Returns:
+            PricingIndex: The index, which can be saved to a snapshot file with `save`.
+        """
+        return PricingIndex.from_countries(
+            service_type, self.stream_all_countries_pricing(service_type)
+        )
+
     @validate_call
     def get_prefix_pricing(
         self, options: GetPrefixPricingRequest
@@ -3,3 +3,7 @@ from vonage_utils.errors import VonageError
 
 class InvalidSecretError(VonageError):
     """Indicates that the secret provided was invalid."""
+
+
+class PricingIndexError(VonageError):
+    """Indicates an error with a pricing index, e.g. an invalid snapshot file."""
@@ -0,0 +1,411 @@
+import json
+import os
+import struct
+import sys
+from array import array
+from logging import getLogger
+from mmap import ACCESS_READ, mmap
+from threading import Event, Lock, Thread
+from time import time
+from typing import Callable, Iterable, Optional, Sequence
+
+from pydantic import BaseModel, ConfigDict
+from vonage_account.errors import PricingIndexError
+from vonage_account.requests import ServiceType
+from vonage_account.responses import GetPricingResponse
+
+logger = getLogger('vonage_account')
+
+_MAGIC = b'VPIX'
+_FORMAT_VERSION = 1
+# Magic, format version, prefix count, metadata length
+_HEADER = struct.Struct('<4sHxxIQ')
+
+
+class PrefixPricing(BaseModel):
+    """Model for the price of sending to numbers that start with a prefix.
+
+    Args:
+        country_code (str, Optional): The two-letter country code.
+        country_name (str, Optional): The name of the country.
+        network_code (str, Optional): The network code, or None if the price is the
+            country's default price.
+        network_name (str, Optional): The network name.
+        type (str, Optional): The type of network, e.g. 'mobile'.
+        price (str, Optional): The price for the service.
+        currency (str, Optional): The currency code for the price.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    country_code: Optional[str] = None
+    country_name: Optional[str] = None
+    network_code: Optional[str] = None
+    network_name: Optional[str] = None
+    type: Optional[str] = None
+    price: Optional[str] = None
+    currency: Optional[str] = None
+
+
+_NUMBER_PUNCTUATION = str.maketrans('', '', '+ -().')
+
+
+def _digits(number: str) -> str:
+    return number.translate(_NUMBER_PUNCTUATION)
+
+
+class PricingIndex:
+    """An in-memory index of outbound prices by number prefix, for pricing numbers
+    without an API request per lookup.
+
+    Prefixes are held in a flat longest-prefix table keyed by their digits, so a lookup
+    costs one hash probe per digit of the number, O(digits). Network number ranges take
+    precedence over a country's dialing prefix, and the longest matching prefix wins.
+
+    Create an index with `from_countries` or `Account.build_pricing_index`, and save and
+    load it with `save` and `load`. Snapshots hold the prefixes as fixed-width arrays,
+    which `load` memory-maps and builds the table from without parsing them. The table
+    itself is built in each process, taking about 100 bytes per prefix.
+
+    Args:
+        service_type (ServiceType): The service the prices are for.
+        prefixes (Sequence[int]): The sorted prefixes.
+        entry_indexes (Sequence[int]): The index in `entries` of each prefix's pricing.
+        entries (list[PrefixPricing]): The pricing data the prefixes refer to.
+        built_at (float): When the pricing data was fetched, as a Unix timestamp.
+    """
+
+    def __init__(
+        self,
+        service_type: ServiceType,
+        prefixes: Sequence[int],
+        entry_indexes: Sequence[int],
+        entries: list[PrefixPricing],
+        built_at: float,
+    ):
+        self._service_type = ServiceType(service_type)
+        self._prefixes = prefixes
+        self._entry_indexes = entry_indexes
+        self._entries = entries
+        self._built_at = built_at
+        self._table = {
+            str(prefix): entries[entry_index]
+            for prefix, entry_index in zip(prefixes, entry_indexes)
+        }
+        self._max_prefix_digits = max(map(len, self._table), default=0)
+
+    @classmethod
+    def from_countries(
+        cls,
+        service_type: ServiceType,
+        countries: Iterable[GetPricingResponse],
+        built_at: Optional[float] = None,
+    ) -> 'PricingIndex':
+        """Builds an index from the pricing data for each country.
+
+        Args:
+            service_type (ServiceType): The service the prices are for.
+            countries (Iterable[GetPricingResponse]): The pricing data, e.g. the countries
+                from `Account.get_all_countries_pricing`.
+            built_at (float, optional): When the pricing data was fetched, as a Unix
+                timestamp. Defaults to now.
+
+        Returns:
+            PricingIndex: The index.
+        """
+        entries: list[PrefixPricing] = []
+        network_prefixes: dict[int, int] = {}
+        country_prefixes: dict[int, int] = {}
+
+        for country in countries:
+            if country.dialing_prefix and country.dialing_prefix.isdigit():
+                prefix = int(country.dialing_prefix)
+                existing = country_prefixes.get(prefix)
+                # Several countries can share a dialing prefix: prefer one with a price
+                if existing is None or (
+                    entries[existing].price is None and country.default_price is not None
+                ):
+                    country_prefixes[prefix] = len(entries)
+                entries.append(
+                    PrefixPricing(
+                        country_code=country.country_code,
+                        country_name=country.country_name,
+                        price=country.default_price,
+                        currency=country.currency,
+                    )
+                )
+            for network in country.networks or []:
+                if not network.ranges:
+                    continue
+                entry_index = len(entries)
+                entries.append(
+                    PrefixPricing(
+                        country_code=country.country_code,
+                        country_name=country.country_name,
+                        network_code=network.network_code,
+                        network_name=network.network_name,
+                        type=network.type,
+                        price=network.price or country.default_price,
+                        currency=network.currency or country.currency,
+                    )
+                )
+                for prefix in network.ranges:
+                    network_prefixes.setdefault(prefix, entry_index)
+
+        merged = {**country_prefixes, **network_prefixes}
+        prefixes = array('Q', sorted(merged))
+        entry_indexes = array('I', (merged[prefix] for prefix in prefixes))
+        return cls(
+            service_type,
+            prefixes,
+            entry_indexes,
+            entries,
+            time() if built_at is None else built_at,
+        )
+
+    @property
+    def service_type(self) -> ServiceType:
+        """The service the prices are for."""
+        return self._service_type
+
+    @property
+    def built_at(self) -> float:
+        """When the pricing data was fetched, as a Unix timestamp."""
+        return self._built_at
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
+
+    def lookup(self, number: str) -> Optional[PrefixPricing]:
+        """Gets the pricing for the longest prefix of a number.
+
+        Args:
+            number (str): The number in E.164 format. A leading '+', spaces, dashes,
+                dots and brackets are ignored.
+
+        Returns:
+            PrefixPricing: The pricing, or None if no prefix matches the number.
+        """
+        digits = _digits(number)
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        table = self._table
+        for length in range(min(len(digits), self._max_prefix_digits), 0, -1):
+            entry = table.get(digits[:length])
+            if entry is not None:
+                return entry
+        return None
+
+    def lookup_many(self, numbers: Iterable[str]) -> list[Optional[PrefixPricing]]:
+        """Gets the pricing for each of many numbers. Numbers are looked up one at a time
+        with `lookup`, not vectorised, but repeated numbers are only looked up once.
+
+        Args:
+            numbers (Iterable[str]): The numbers in E.164 format, e.g. a list or a NumPy
+                array of strings.
+
+        Returns:
+            list[Optional[PrefixPricing]]: The pricing for each number, in order, or None
+                for numbers no prefix matches.
+        """
+        seen: dict[str, Optional[PrefixPricing]] = {}
+        results = []
+        for number in numbers:
+            number = str(number)
+            if number not in seen:
+                seen[number] = self.lookup(number)
+            results.append(seen[number])
+        return results
+
+    def save(self, path: str) -> None:
+        """Saves the index to a snapshot file that can be memory-mapped with `load`.
+
+        The file is written next to `path` and then moved into place, so processes
+        loading the snapshot never see a partly-written file.
+
+        Args:
+            path (str): The path of the snapshot file.
+        """
+        metadata = json.dumps(
+            {
+                'service_type': self._service_type.value,
+                'built_at': self._built_at,
+                'entries': [
+                    entry.model_dump(exclude_none=True) for entry in self._entries
+                ],
+            }
+        ).encode()
+        prefixes = array('Q', self._prefixes)
+        entry_indexes = array('I', self._entry_indexes)
+        if sys.byteorder == 'big':
+            prefixes.byteswap()
+            entry_indexes.byteswap()
+
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(
+                _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(prefixes), len(metadata))
+            )
+            file.write(prefixes.tobytes())
+            file.write(entry_indexes.tobytes())
+            file.write(metadata)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'PricingIndex':
+        """Loads an index from a snapshot file written by `save`. The prefix arrays are
+        memory-mapped, and the lookup table is built from them.
+
+        Args:
+            path (str): The path of the snapshot file.
+
+        Returns:
+            PricingIndex: The index.
+
+        Raises:
+            PricingIndexError: If the file isn't a valid snapshot.
+        """
+        with open(path, 'rb') as file:
+            try:
+                buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+            except ValueError as err:
+                raise PricingIndexError(
+                    f'"{path}" is not a pricing index snapshot.'
+                ) from err
+
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise PricingIndexError(f'"{path}" is not a pricing index snapshot.')
+        magic, version, count, metadata_size = _HEADER.unpack_from(view)
+        prefixes_end = _HEADER.size + count * 8
+        indexes_end = prefixes_end + count * 4
+        if magic != _MAGIC or len(view) != indexes_end + metadata_size:
+            raise PricingIndexError(f'"{path}" is not a pricing index snapshot.')
+        if version != _FORMAT_VERSION:
+            raise PricingIndexError(
+                f'Pricing index snapshot "{path}" has unsupported format version '
+                f'{version}.'
+            )
+
+        prefixes = view[_HEADER.size : prefixes_end].cast('Q')
+        entry_indexes = view[prefixes_end:indexes_end].cast('I')
+        if sys.byteorder == 'big':
+            prefixes, entry_indexes = array('Q', prefixes), array('I', entry_indexes)
+            prefixes.byteswap()
+            entry_indexes.byteswap()
+        metadata = json.loads(bytes(view[indexes_end:]))
+        return cls(
+            ServiceType(metadata['service_type']),
+            prefixes,
+            entry_indexes,
+            [PrefixPricing(**entry) for entry in metadata['entries']],
+            metadata['built_at'],
+        )
+
+
+class RefreshingPricingIndex:
+    """A `PricingIndex` that is rebuilt on a schedule, and optionally kept in a snapshot
+    file so it doesn't need to be rebuilt every time a process starts.
+
+    Lookups use the current index, which is replaced in one step when a refresh
+    completes, so they never see a partly-built index. If a refresh fails, the error is
+    logged and the previous index is kept.
+
+    Args:
+        build (Callable[[], PricingIndex]): Builds a new index, e.g.
+            `lambda: account.build_pricing_index('sms')`.
+        refresh_interval (float): The number of seconds after which the index is
+            rebuilt.
+        snapshot_path (str, optional): The path of a snapshot file. If it exists and is
+            newer than `refresh_interval`, the index is loaded from it instead of being
+            built, and each new index is saved to it.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], PricingIndex],
+        refresh_interval: float,
+        snapshot_path: Optional[str] = None,
+    ):
+        self._build = build
+        self._refresh_interval = refresh_interval
+        self._snapshot_path = snapshot_path
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+        self._index = self._load_snapshot() or self._rebuild()
+
+    @property
+    def index(self) -> PricingIndex:
+        """The current index."""
+        return self._index
+
+    def lookup(self, number: str) -> Optional[PrefixPricing]:
+        """Gets the pricing for a number from the current index. See
+        `PricingIndex.lookup`."""
+        return self._index.lookup(number)
+
+    def lookup_many(self, numbers: Iterable[str]) -> list[Optional[PrefixPricing]]:
+        """Gets the pricing for many numbers from the current index. See
+        `PricingIndex.lookup_many`."""
+        return self._index.lookup_many(numbers)
+
+    def refresh(self) -> PricingIndex:
+        """Rebuilds the index now.
+
+        Returns:
+            PricingIndex: The new index.
+        """
+        with self._lock:
+            self._index = self._rebuild()
+            return self._index
+
+    def start(self) -> None:
+        """Starts refreshing the index in a background thread whenever it becomes older
+        than the refresh interval."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = Thread(
+            target=self._run, name='vonage-pricing-index-refresh', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops refreshing the index in the background."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            age = time() - self._index.built_at
+            if self._stop.wait(max(self._refresh_interval - age, 0)):
+                return
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('Failed to refresh the pricing index.')
+                if self._stop.wait(min(self._refresh_interval, 60)):
+                    return
+
+    def _load_snapshot(self) -> Optional[PricingIndex]:
+        if self._snapshot_path is None or not os.path.exists(self._snapshot_path):
+            return None
+        try:
+            index = PricingIndex.load(self._snapshot_path)
+        except (PricingIndexError, OSError, ValueError, KeyError) as err:
+            logger.warning(
+                'Ignoring pricing index snapshot "%s": %s', self._snapshot_path, err
+            )
+            return None
+        if time() - index.built_at >= self._refresh_interval:
+            return None
+        return index
+
+    def _rebuild(self) -> PricingIndex:
+        index = self._build()
+        if self._snapshot_path is not None:
+            index.save(self._snapshot_path)
+        return index
@@ -112,6 +112,41 @@ def test_get_all_countries_pricing():
     assert response.countries[0].networks[0].price == '0.08270000'
 
 
+@responses.activate
+def test_stream_all_countries_pricing():
+    build_response(
+        path,
+        'GET',
+        'https://rest.nexmo.com/account/get-full-pricing/outbound/sms',
+        'get_multiple_countries_pricing.json',
+    )
+
+    countries = account.stream_all_countries_pricing(ServiceType.SMS)
+    assert len(responses.calls) == 0
+
+    countries = list(countries)
+    assert len(countries) == 2
+    assert countries[0].country_name == 'Italy'
+    assert countries[1].country_name == 'Vatican City'
+    assert countries[0].networks[0].price == '0.08270000'
+
+
+@responses.activate
+def test_build_pricing_index():
+    build_response(
+        path,
+        'GET',
+        'https://rest.nexmo.com/account/get-full-pricing/outbound/sms',
+        'get_multiple_countries_pricing.json',
+    )
+
+    index = account.build_pricing_index(ServiceType.SMS)
+    assert index.service_type == ServiceType.SMS
+    assert len(index) == 1
+    assert index.lookup('+39 312 345 6789').country_code == 'IT'
+    assert index.lookup('12025550123') is None
+
+
 @responses.activate
 def test_get_prefix_pricing():
     build_response(
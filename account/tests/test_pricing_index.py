@@ -0,0 +1,148 @@
+import json
+from os.path import abspath, dirname, join
+from time import sleep, time
+
+from pytest import raises
+from vonage_account.errors import PricingIndexError
+from vonage_account.pricing_index import PricingIndex, RefreshingPricingIndex
+from vonage_account.requests import ServiceType
+from vonage_account.responses import GetMultiplePricingResponse, GetPricingResponse
+
+data_path = join(dirname(abspath(__file__)), 'data')
+
+
+def load_countries() -> list[GetPricingResponse]:
+    with open(join(data_path, 'get_country_pricing.json')) as file:
+        zambia = GetPricingResponse(**json.load(file))
+    with open(join(data_path, 'get_multiple_countries_pricing.json')) as file:
+        italy_and_vatican = GetMultiplePricingResponse(**json.load(file)).countries
+    return [zambia, *italy_and_vatican]
+
+
+def build_index(built_at=None) -> PricingIndex:
+    return PricingIndex.from_countries(ServiceType.SMS, load_countries(), built_at)
+
+
+def test_lookup_longest_prefix():
+    index = build_index()
+    assert index.service_type == ServiceType.SMS
+
+    airtel = index.lookup('+260 977 123456')
+    assert airtel.network_code == '64501'
+    assert airtel.network_name == 'Airtel'
+    assert airtel.price == '0.28725000'
+    assert airtel.country_code == 'ZM'
+
+    assert index.lookup('260761234567').network_code == '64502'
+    assert index.lookup('260711234567').network_code == '64502'
+    assert index.lookup('260901234567').network_code == 'ZM-PREMIUM'
+
+
+def test_lookup_country_default():
+    index = build_index()
+    zambia = index.lookup('260511234567')
+    assert zambia.network_code is None
+    assert zambia.country_code == 'ZM'
+
+    italy = index.lookup('393123456789')
+    assert italy.country_code == 'IT'
+    assert italy.price == '0.08270000'
+
+
+def test_lookup_no_match():
+    index = build_index()
+    assert index.lookup('12025550123') is None
+    assert index.lookup('not a number') is None
+    assert index.lookup('') is None
+
+
+def test_lookup_many():
+    index = build_index()
+    results = index.lookup_many(['260977123456', '393123456789', '12025550123'] * 2)
+    assert [result and result.country_code for result in results] == [
+        'ZM',
+        'IT',
+        None,
+    ] * 2
+    assert results[0] is results[3]
+
+
+def test_save_and_load(tmp_path):
+    index = build_index(built_at=1700000000.0)
+    snapshot_path = str(tmp_path / 'sms.idx')
+    index.save(snapshot_path)
+
+    loaded = PricingIndex.load(snapshot_path)
+    assert len(loaded) == len(index)
+    assert loaded.service_type == ServiceType.SMS
+    assert loaded.built_at == 1700000000.0
+    for number in ('260977123456', '260761234567', '393123456789', '12025550123'):
+        assert loaded.lookup(number) == index.lookup(number)
+
+
+def test_load_invalid_snapshot(tmp_path):
+    snapshot_path = tmp_path / 'invalid.idx'
+    snapshot_path.write_bytes(b'not a snapshot')
+    with raises(PricingIndexError):
+        PricingIndex.load(str(snapshot_path))
+
+    empty_path = tmp_path / 'empty.idx'
+    empty_path.write_bytes(b'')
+    with raises(PricingIndexError):
+        PricingIndex.load(str(empty_path))
+
+
+def test_refreshing_index_uses_fresh_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / 'sms.idx')
+    builds = []
+
+    def build():
+        builds.append(1)
+        return build_index()
+
+    index = RefreshingPricingIndex(
+        build, refresh_interval=3600, snapshot_path=snapshot_path
+    )
+    assert len(builds) == 1
+    assert index.lookup('260977123456').network_code == '64501'
+
+    index = RefreshingPricingIndex(
+        build, refresh_interval=3600, snapshot_path=snapshot_path
+    )
+    assert len(builds) == 1
+    assert index.lookup_many(['393123456789'])[0].country_code == 'IT'
+
+    index.refresh()
+    assert len(builds) == 2
+
+
+def test_refreshing_index_rebuilds_stale_snapshot(tmp_path):
+    snapshot_path = str(tmp_path / 'sms.idx')
+    build_index(built_at=time() - 7200).save(snapshot_path)
+
+    index = RefreshingPricingIndex(
+        build_index, refresh_interval=3600, snapshot_path=snapshot_path
+    )
+    assert index.index.built_at > time() - 60
+    assert PricingIndex.load(snapshot_path).built_at == index.index.built_at
+
+
+def test_refreshing_index_background_refresh():
+    builds = []
+
+    def build():
+        builds.append(1)
+        if len(builds) == 2:
+            raise RuntimeError('Pricing API unavailable')
+        return build_index()
+
+    index = RefreshingPricingIndex(build, refresh_interval=0.01)
+    index.start()
+    try:
+        deadline = time() + 5
+        while len(builds) < 3 and time() < deadline:
+            sleep(0.01)
+    finally:
+        index.stop()
+    assert len(builds) >= 3
+    assert index.lookup('260977123456').network_code == '64501'
@@ -2,6 +2,7 @@ from typing import Optional
 
 from pydantic import validate_call
 from vonage_http_client.http_client import HttpClient
+from vonage_utils.response_modes import ResponseMode, build_models, detach_items
 
 from .requests import ApplicationConfig, ListApplicationsFilter
 from .responses import ApplicationData, ListApplicationsResponse
@@ -25,7 +26,9 @@ class Application:
 
     @validate_call
     def list_applications(
-        self, filter: ListApplicationsFilter = ListApplicationsFilter()
+        self,
+        filter: ListApplicationsFilter = ListApplicationsFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[ApplicationData], Optional[str]]:
         """List applications.
 
@@ -34,6 +37,8 @@ class Application:
 
         Args:
             filter (ListApplicationsFilter): The filter object.
+            response_mode (ResponseMode, optional): How the applications are returned:
+                'model' (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[ApplicationData], Optional[str]]: A tuple containing a
@@ -46,13 +51,19 @@ class Application:
             self._auth_type,
         )
 
-        applications_response = ListApplicationsResponse(**response)
+        if response_mode == 'model':
+            applications_response = ListApplicationsResponse(**response)
+            applications = applications_response.embedded.applications
+        else:
+            items = detach_items(response, '_embedded', 'applications')
+            applications_response = ListApplicationsResponse(**response)
+            applications = build_models(items, ApplicationData, response_mode)
 
         if applications_response.page == applications_response.total_pages:
-            return applications_response.embedded.applications, None
+            return applications, None
 
         next_page = applications_response.page + 1
-        return applications_response.embedded.applications, next_page
+        return applications, next_page
 
     @validate_call
     def create_application(
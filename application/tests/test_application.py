@@ -24,6 +24,7 @@ from vonage_application.enums import Region
 from vonage_application.errors import ApplicationError
 from vonage_application.requests import ApplicationConfig, ListApplicationsFilter
 from vonage_http_client.http_client import HttpClient
+from vonage_utils import LazyModelList
 
 path = abspath(__file__)
 
@@ -278,6 +279,29 @@ def test_list_applications_basic():
     assert next_page is None
 
 
+@responses.activate
+def test_list_applications_lazy_and_raw():
+    build_response(
+        path,
+        'GET',
+        'https://api.nexmo.com/v2/applications',
+        'list_applications_basic.json',
+    )
+    applications, next_page = application.list_applications(response_mode='lazy')
+    assert isinstance(applications, LazyModelList)
+    assert applications[0].name == 'dev-application'
+    assert next_page is None
+
+    build_response(
+        path,
+        'GET',
+        'https://api.nexmo.com/v2/applications',
+        'list_applications_basic.json',
+    )
+    applications, _ = application.list_applications(response_mode='raw')
+    assert applications[0]['id'] == '1b1b1b1b-1b1b-1b1b-1b1b-1b1b1b1b1b1b'
+
+
 @responses.activate
 def test_list_applications_multiple_pages():
     build_response(
@@ -0,0 +1,86 @@
+"""Compares the ways a request model can be turned into a JSON request body.
+
+The baseline reproduces the previous path: `model_dump` to a dict of Python objects,
+which `requests` then encodes with the standard library `json` module. The current
+path serializes the model straight to bytes with pydantic's Rust serializer. Decoding a
+list response with `json` and `orjson` (if installed) is also compared.
+
+Run with: `python http_client/benchmarks/bench_json_encoding.py`
+"""
+
+from json import dumps, loads
+from timeit import timeit
+
+from pydantic_core import to_json
+from vonage_messages import Sms
+from vonage_voice import CreateCallRequest, Talk
+
+NUMBER = 20000
+
+SMS = Sms(
+    to='447700900000',
+    from_='Vonage APIs',
+    text='Hello from Vonage! ' * 20,
+    client_ref='benchmark',
+)
+CALL = CreateCallRequest(
+    to=[{'type': 'phone', 'number': '447700900000'}],
+    from_={'type': 'phone', 'number': '447700900001'},
+    ncco=[Talk(text='Hello from Vonage!', language='en-GB', loop=2) for _ in range(5)],
+    event_url=['https://example.com/event'],
+)
+LIST_RESPONSE = dumps(
+    {
+        'count': 100,
+        '_embedded': {
+            'calls': [
+                {
+                    'uuid': f'{i:032x}',
+                    'status': 'completed',
+                    'direction': 'outbound',
+                    'to': {'type': 'phone', 'number': '447700900000'},
+                    'from': {'type': 'phone', 'number': '447700900001'},
+                    'rate': '0.01',
+                    'duration': '60',
+                }
+                for i in range(100)
+            ]
+        },
+    }
+).encode()
+
+
+def dump_then_encode(model):
+    # What `requests` does with a `json=` argument
+    data = model.model_dump(by_alias=True, exclude_none=True)
+    return dumps(data, allow_nan=False).encode('utf-8')
+
+
+def encode_directly(model):
+    return to_json(model, by_alias=True, exclude_none=True)
+
+
+def main():
+    for name, model in (('Sms', SMS), ('CreateCallRequest', CALL)):
+        assert loads(dump_then_encode(model)) == loads(encode_directly(model))
+        baseline = timeit(lambda: dump_then_encode(model), number=NUMBER)
+        direct = timeit(lambda: encode_directly(model), number=NUMBER)
+        print(f'{name}:')
+        print(f'  model_dump + json.dumps: {baseline / NUMBER * 1e6:.2f} us/call')
+        print(f'  pydantic to_json:        {direct / NUMBER * 1e6:.2f} us/call')
+
+    number = NUMBER // 10
+    print(f'Decoding a {len(LIST_RESPONSE)} byte list response:')
+    stdlib = timeit(lambda: loads(LIST_RESPONSE), number=number)
+    print(f'  json.loads:   {stdlib / number * 1e6:.2f} us/call')
+    try:
+        import orjson
+    except ImportError:
+        print('  orjson.loads: orjson not installed')
+    else:
+        fast = timeit(lambda: orjson.loads(LIST_RESPONSE), number=number)
+        print(f'  orjson.loads: {fast / number * 1e6:.2f} us/call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""Compares the peak memory and time of loading a large JSON list response in one go with
+streaming its items using `iter_json_items`.
+
+The document mimics the full pricing response of `Account.get_all_countries_pricing`.
+Chunks are generated on the fly to stand in for a response still being downloaded; the
+eager path first joins them, as `requests` does when reading `response.content`. The
+last row has items several times larger than a chunk. Times are measured without
+memory tracing, which would slow both paths down.
+
+Run with: `python http_client/benchmarks/bench_json_stream.py`
+"""
+
+import tracemalloc
+from json import dumps, loads
+from time import perf_counter
+
+from vonage_http_client.json_stream import iter_json_items
+
+CHUNK_SIZE = 65536
+
+
+def country(index: int, networks: int) -> dict:
+    return {
+        'countryCode': f'{index:03d}',
+        'countryName': f'Country {index}',
+        'currency': 'EUR',
+        'defaultPrice': '0.08270000',
+        'dialingPrefix': str(index),
+        'networks': [
+            {
+                'type': 'mobile',
+                'price': '0.08270000',
+                'currency': 'EUR',
+                'mcc': '222',
+                'mnc': f'{network:03d}',
+                'networkCode': f'222{network:03d}',
+                'networkName': f'Network {network} of country {index}',
+            }
+            for network in range(networks)
+        ],
+    }
+
+
+def chunks(countries: int, networks: int):
+    yield f'{{"count": {countries}, "countries": ['.encode()
+    for index in range(countries):
+        separator = ', ' if index else ''
+        yield (separator + dumps(country(index, networks))).encode()
+    yield b']}'
+
+
+def rechunk(parts):
+    buffer = b''
+    for part in parts:
+        buffer += part
+        while len(buffer) >= CHUNK_SIZE:
+            yield buffer[:CHUNK_SIZE]
+            buffer = buffer[CHUNK_SIZE:]
+    if buffer:
+        yield buffer
+
+
+def eager(countries: int, networks: int) -> int:
+    body = b''.join(rechunk(chunks(countries, networks)))
+    return sum(len(c['networks']) for c in loads(body)['countries'])
+
+
+def streamed(countries: int, networks: int) -> int:
+    items = iter_json_items(rechunk(chunks(countries, networks)), 'countries')
+    return sum(len(c['networks']) for c in items)
+
+
+def measure(function, countries: int, networks: int) -> tuple[float, float]:
+    start = perf_counter()
+    function(countries, networks)
+    elapsed = perf_counter() - start
+    tracemalloc.start()
+    function(countries, networks)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    print(f'{"countries":>9} {"networks":>8} {"eager":>22} {"streamed":>22}')
+    for countries, networks in ((100, 50), (400, 50), (1600, 50), (40, 2000)):
+        assert eager(countries, networks) == streamed(countries, networks)
+        eager_time, eager_peak = measure(eager, countries, networks)
+        stream_time, stream_peak = measure(streamed, countries, networks)
+        print(
+            f'{countries:>9} {networks:>8} '
+            f'{eager_time * 1e3:>8.0f} ms {eager_peak:>7.1f} MiB '
+            f'{stream_time * 1e3:>8.0f} ms {stream_peak:>7.1f} MiB'
+        )
+
+
+if __name__ == '__main__':
+    main()
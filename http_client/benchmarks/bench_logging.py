@@ -0,0 +1,90 @@
+"""Compares the cost of request/response logging with the `vonage` logger at WARNING.
+
+The baseline reproduces the eager f-string logging previously used in `make_request`
+and `_parse_response`; the current path uses `HttpClient`'s guarded, lazy records.
+
+Run with: `python http_client/benchmarks/bench_logging.py`
+"""
+
+from logging import DEBUG, WARNING, getLogger
+from timeit import timeit
+
+import responses
+from vonage_http_client import Auth, HttpClient
+from vonage_http_client.http_logging import LazyRedacted
+
+logger = getLogger('vonage')
+
+NUMBER = 20000
+PARAMS = {
+    'to': '447700900000',
+    'from': 'Vonage APIs',
+    'text': 'Hello from Vonage! ' * 20,
+    'client-ref': 'benchmark',
+}
+HEADERS = {
+    'User-Agent': 'vonage-python-sdk/4.0.0 python/3.13',
+    'Accept': 'application/json',
+    'Content-Type': 'application/json',
+    'Authorization': 'Bearer ' + 'a' * 600,
+}
+
+
+class FakeResponse:
+    url = 'https://api.nexmo.com/v1/messages'
+    status_code = 200
+    headers = {f'X-Header-{i}': 'value' * 4 for i in range(15)}
+
+
+def eager_logging():
+    response = FakeResponse()
+    logger.debug(
+        f'POST request to {response.url}, with data: {PARAMS}; headers: {HEADERS}'
+    )
+    logger.debug(
+        f'Response received from {response.url} with status code: {response.status_code}; headers: {response.headers}'
+    )
+
+
+def lazy_logging():
+    response = FakeResponse()
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            '%s request to %s, with data: %s; headers: %s',
+            'POST',
+            response.url,
+            LazyRedacted(PARAMS),
+            LazyRedacted(HEADERS),
+        )
+    if logger.isEnabledFor(DEBUG):
+        logger.debug(
+            'Response received from %s with status code: %d; headers: %s',
+            response.url,
+            response.status_code,
+            LazyRedacted(response.headers),
+        )
+
+
+def make_request(client: HttpClient):
+    client.post('api.nexmo.com', '/v1/messages', dict(PARAMS), auth_type='basic')
+
+
+def main():
+    logger.setLevel(WARNING)
+    eager = timeit(eager_logging, number=NUMBER)
+    lazy = timeit(lazy_logging, number=NUMBER)
+    print(f'eager f-string logging: {eager / NUMBER * 1e6:.2f} us/call')
+    print(f'lazy guarded logging:   {lazy / NUMBER * 1e6:.2f} us/call')
+
+    client = HttpClient(Auth(api_key='key', api_secret='secret'))
+    with responses.RequestsMock() as mock:
+        mock.add('POST', 'https://api.nexmo.com/v1/messages', json={'ok': True})
+        total = timeit(lambda: make_request(client), number=NUMBER // 10)
+    per_call = total / (NUMBER // 10) * 1e6
+    print(f'make_request (lazy logging, mocked transport): {per_call:.2f} us/call')
+    share = eager / NUMBER * 1e6 / per_call
+    print(f'eager logging overhead as a share of a mocked call: {share:.1%}')
+
+
+if __name__ == '__main__':
+    main()
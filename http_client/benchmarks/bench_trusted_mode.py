@@ -0,0 +1,91 @@
+"""Measures the per-call overhead saved by the `trusted` HTTP client option.
+
+The transport is replaced with a stub that returns a canned response, so the timings
+only include SDK-side work: argument validation, request serialisation and response
+model construction.
+
+Run with: `python http_client/benchmarks/bench_trusted_mode.py`
+"""
+
+from json import dumps
+from os.path import dirname, join
+from timeit import repeat
+
+from requests import Response
+from vonage_http_client import ApplicationKeyring, HttpClient
+from vonage_messages import Messages, Sms
+from vonage_voice import CreateCallRequest, Talk, Voice
+
+NUMBER = 20000
+PRIVATE_KEY = join(
+    dirname(__file__), '..', '..', 'testutils', 'data', 'fake_private_key.txt'
+)
+# JWTs are cached by the keyring, so signing doesn't dominate the timings
+KEYRING = ApplicationKeyring({'app-id': PRIVATE_KEY})
+
+
+class StubSession:
+    """Stands in for `requests.Session`, returning the same response for every request."""
+
+    def __init__(self, body: dict):
+        self._content = dumps(body).encode()
+
+    def request(self, **kwargs) -> Response:
+        response = Response()
+        response.status_code = 200
+        response._content = self._content
+        response.url = kwargs['url']
+        return response
+
+
+def build_client(trusted: bool, body: dict) -> HttpClient:
+    client = HttpClient(
+        KEYRING.auth('app-id', api_key='key', api_secret='secret'), {'trusted': trusted}
+    )
+    client.connection_pool._session = StubSession(body)
+    return client
+
+
+def time_per_call(default_func, trusted_func) -> tuple[float, float]:
+    """Alternates between the two functions and keeps the best run of each, to reduce
+    the effect of noise on the comparison."""
+    default, trusted = [], []
+    for _ in range(7):
+        default.extend(repeat(default_func, number=NUMBER // 10, repeat=1))
+        trusted.extend(repeat(trusted_func, number=NUMBER // 10, repeat=1))
+    return min(default) / NUMBER * 1e7, min(trusted) / NUMBER * 1e7
+
+
+def main():
+    message = Sms(from_='Vonage APIs', to='447700900000', text='Hello, World!')
+    message_body = {'message_uuid': 'd8f86df1-dec6-442f-870a-2241be27d721'}
+
+    call = CreateCallRequest(
+        ncco=[Talk(text='Hello world')],
+        to=[{'type': 'phone', 'number': '447700900000'}],
+        random_from_number=True,
+    )
+    call_body = {
+        'uuid': '106a581a-34d0-432a-a625-220221fd434f',
+        'status': 'started',
+        'direction': 'outbound',
+        'conversation_uuid': 'CON-2be039b2-d0a4-4274-afc8-d7b241c7c044',
+    }
+
+    for name, build_api, method, arg, body in (
+        ('Messages.send', Messages, 'send', message, message_body),
+        ('Voice.create_call', Voice, 'create_call', call, call_body),
+    ):
+        default_method = getattr(build_api(build_client(False, body)), method)
+        trusted_method = getattr(build_api(build_client(True, body)), method)
+        default, trusted = time_per_call(
+            lambda: default_method(arg), lambda: trusted_method(arg)
+        )
+        print(
+            f'{name}: default {default:.1f} us/call, trusted {trusted:.1f} us/call, '
+            f'saved {default - trusted:.1f} us/call ({(default - trusted) / default:.0%})'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
+from .application_keyring import ApplicationKeyring
 from .auth import Auth
+from .connection_pool import ConnectionPool
 from .errors import (
     AuthenticationError,
     FileStreamingError,
@@ -11,11 +13,16 @@ from .errors import (
     RateLimitedError,
     ServerError,
 )
+from .exchange_history import ExchangeHistory, HttpExchange, correlation_id
 from .http_client import HttpClient, HttpClientOptions
+from .rate_limiter import RateLimiter
+from .stats import RequestStats
 
 __all__ = [
+    'ApplicationKeyring',
     'Auth',
     'AuthenticationError',
+    'ConnectionPool',
     'FileStreamingError',
     'ForbiddenError',
     'HttpRequestError',
@@ -25,6 +32,11 @@ __all__ = [
     'NotFoundError',
     'RateLimitedError',
     'ServerError',
+    'ExchangeHistory',
     'HttpClient',
     'HttpClientOptions',
+    'HttpExchange',
+    'RateLimiter',
+    'RequestStats',
+    'correlation_id',
 ]
@@ -0,0 +1,158 @@
+from threading import Lock
+from time import time
+from typing import Literal, Optional
+
+from vonage_jwt.jwt import JwtClient
+
+from .auth import Auth
+from .errors import InvalidAuthError, JWTGenerationError
+
+
+class CachingJwtClient:
+    """Wraps a `JwtClient` and reuses the JWT generated with default claims until it is
+    close to expiry.
+
+    JWTs generated with custom claims are never cached.
+
+    Args:
+        jwt_client (JwtClient): The JWT client to wrap.
+        refresh_margin (int, optional): How many seconds before expiry a cached JWT is
+            replaced.
+    """
+
+    def __init__(self, jwt_client: JwtClient, refresh_margin: int = 60):
+        self._jwt_client = jwt_client
+        self._refresh_margin = refresh_margin
+        self._token: Optional[bytes] = None
+        self._refresh_at = 0.0
+        self._lock = Lock()
+
+    def generate_application_jwt(self, claims: Optional[dict] = None) -> bytes:
+        if claims:
+            return self._jwt_client.generate_application_jwt(claims)
+        with self._lock:
+            now = time()
+            if self._token is None or now >= self._refresh_at:
+                iat = int(now)
+                exp = iat + 15 * 60
+                self._token = self._jwt_client.generate_application_jwt(
+                    {'iat': iat, 'exp': exp}
+                )
+                self._refresh_at = exp - self._refresh_margin
+            return self._token
+
+
+class ApplicationKeyring:
+    """Holds JWT credentials for many Vonage applications.
+
+    Each private key is parsed once when it's added, and each application has its own
+    cache of JWTs, so switching between applications doesn't re-parse a key or create a
+    new HTTP client. Use `ApplicationKeyring.auth` to get an `Auth` object for one
+    application, e.g. to pass to `Vonage.with_auth`.
+
+    Args:
+        applications (dict, optional): A mapping of application IDs to private keys. A
+            private key can be the key itself or a path to a key file.
+        cache_tokens (bool, optional): Whether to reuse JWTs generated with default claims
+            until they are close to expiry.
+        refresh_margin (int, optional): How many seconds before expiry a cached JWT is
+            replaced.
+    """
+
+    def __init__(
+        self,
+        applications: Optional[dict[str, str]] = None,
+        cache_tokens: bool = True,
+        refresh_margin: int = 60,
+    ):
+        self._cache_tokens = cache_tokens
+        self._refresh_margin = refresh_margin
+        self._jwt_clients = {}
+        for application_id, private_key in (applications or {}).items():
+            self.add(application_id, private_key)
+
+    def __contains__(self, application_id: str) -> bool:
+        return application_id in self._jwt_clients
+
+    def __len__(self) -> int:
+        return len(self._jwt_clients)
+
+    @property
+    def application_ids(self) -> list[str]:
+        return list(self._jwt_clients)
+
+    def add(self, application_id: str, private_key: str) -> None:
+        """Adds or replaces the credentials for an application.
+
+        Args:
+            application_id (str): The application ID.
+            private_key (str): The application's private key, or a path to a key file.
+        """
+        jwt_client = JwtClient(application_id, private_key)
+        if self._cache_tokens:
+            jwt_client = CachingJwtClient(jwt_client, self._refresh_margin)
+        self._jwt_clients[application_id] = jwt_client
+
+    def remove(self, application_id: str) -> None:
+        """Removes the credentials for an application.
+
+        Args:
+            application_id (str): The application ID.
+        """
+        self._jwt_clients.pop(application_id, None)
+
+    def generate_application_jwt(
+        self, application_id: str, claims: Optional[dict] = None
+    ) -> bytes:
+        """Generates a JWT for an application in the keyring.
+
+        Args:
+            application_id (str): The application ID.
+            claims (dict, optional): The claims to include in the JWT.
+
+        Returns:
+            bytes: The JWT token.
+        """
+        try:
+            jwt_client = self._jwt_clients[application_id]
+        except KeyError as err:
+            raise JWTGenerationError(
+                f'Application "{application_id}" is not in the keyring.'
+            ) from err
+        return jwt_client.generate_application_jwt(claims)
+
+    def auth(
+        self,
+        application_id: str,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        signature_secret: Optional[str] = None,
+        signature_method: Optional[Literal['md5', 'sha1', 'sha256', 'sha512']] = 'md5',
+    ) -> Auth:
+        """Creates an `Auth` object for one application in the keyring. The `Auth` object
+        shares the application's parsed key and JWT cache.
+
+        Args:
+            application_id (str): The application ID.
+            api_key (str, optional): The API key to include in the `Auth` object.
+            api_secret (str, optional): The API secret to include in the `Auth` object.
+            signature_secret (str, optional): The signature secret to include.
+            signature_method (str, optional): The signature method to use.
+
+        Returns:
+            Auth: An `Auth` object using the application's credentials.
+        """
+        try:
+            jwt_client = self._jwt_clients[application_id]
+        except KeyError as err:
+            raise InvalidAuthError(
+                f'Application "{application_id}" is not in the keyring.'
+            ) from err
+        return Auth.from_jwt_client(
+            application_id,
+            jwt_client,
+            api_key=api_key,
+            api_secret=api_secret,
+            signature_secret=signature_secret,
+            signature_method=signature_method,
+        )
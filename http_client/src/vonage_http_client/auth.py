@@ -53,6 +53,41 @@ class Auth:
         self._signature_secret = signature_secret
         self._signature_method = getattr(hashlib, signature_method)
 
+    @classmethod
+    def from_jwt_client(
+        cls,
+        application_id: str,
+        jwt_client: JwtClient,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        signature_secret: Optional[str] = None,
+        signature_method: Optional[Literal['md5', 'sha1', 'sha256', 'sha512']] = 'md5',
+    ) -> 'Auth':
+        """Creates an `Auth` object that generates JWTs with an existing JWT client, so
+        that its parsed private key can be shared by many `Auth` objects.
+
+        Args:
+            application_id (str): The application ID the JWT client generates JWTs for.
+            jwt_client (JwtClient): The JWT client, or a wrapper of one with the same
+                `generate_application_jwt` method.
+            api_key (str, optional): The API key for authentication.
+            api_secret (str, optional): The API secret for authentication.
+            signature_secret (str, optional): The signature secret for authentication.
+            signature_method (str, optional): The signature method for authentication.
+
+        Returns:
+            Auth: An `Auth` object using the JWT client.
+        """
+        auth = cls(
+            api_key=api_key,
+            api_secret=api_secret,
+            signature_secret=signature_secret,
+            signature_method=signature_method,
+        )
+        auth._application_id = application_id
+        auth._jwt_client = jwt_client
+        return auth
+
     @property
     def api_key(self):
         return self._api_key
@@ -0,0 +1,72 @@
+from gzip import compress
+from typing import Iterable, Iterator, Optional
+
+from requests import Response
+from urllib3.util import make_headers
+
+_PREFERRED_ENCODINGS = ('br', 'zstd', 'gzip', 'deflate')
+
+
+def accept_encoding() -> str:
+    """The value of the `Accept-Encoding` header: every content encoding urllib3 can
+    decode in this environment, most compact first. Brotli ('br') is only included if the
+    `brotli` or `brotlicffi` package is installed."""
+    available = make_headers(accept_encoding=True)['accept-encoding'].split(',')
+    return ', '.join(
+        encoding for encoding in _PREFERRED_ENCODINGS if encoding in available
+    )
+
+
+def gzip_body(body: bytes, min_bytes: Optional[int]) -> Optional[bytes]:
+    """Gzips a request body if it's at least `min_bytes` long and compressing it makes it
+    smaller.
+
+    Args:
+        body (bytes): The encoded request body.
+        min_bytes (int, optional): The size from which bodies are compressed. If None,
+            bodies are never compressed.
+
+    Returns:
+        bytes: The compressed body, or None if the body should be sent as-is.
+    """
+    if min_bytes is None or len(body) < min_bytes:
+        return None
+    compressed = compress(body, compresslevel=6)
+    if len(compressed) >= len(body):
+        return None
+    return compressed
+
+
+def response_bytes_saved(response: Response, decoded_size: int) -> int:
+    """The number of bytes content encoding saved on the wire for a fully-read response.
+
+    Args:
+        response (requests.Response): The response, after its body has been read.
+        decoded_size (int): The size of the decoded body in bytes.
+
+    Returns:
+        int: The decoded size minus the number of bytes received, or 0 if the response
+            wasn't encoded.
+    """
+    if not response.headers.get('Content-Encoding'):
+        return 0
+    try:
+        received = response.raw.tell()
+    except (AttributeError, OSError):
+        return 0
+    return max(decoded_size - received, 0)
+
+
+class CountingChunks:
+    """Wraps an iterable of chunks and counts the bytes that pass through it."""
+
+    __slots__ = ('_chunks', 'size')
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = chunks
+        self.size = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self.size += len(chunk)
+            yield chunk
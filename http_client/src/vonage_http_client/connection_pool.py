@@ -0,0 +1,61 @@
+import os
+
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+from urllib3 import Retry
+
+
+class ConnectionPool:
+    """The HTTP transport used by an `HttpClient`: a `requests` session with a pooled
+    HTTPS adapter.
+
+    A single pool can be shared by many `HttpClient` instances, e.g. one per set of
+    credentials, so that connections and TLS sessions are reused across all of them.
+
+    Args:
+        pool_connections (int, optional): The number of hosts to keep connection pools for.
+        pool_maxsize (int, optional): The maximum number of connections kept per host.
+        max_retries (int, optional): The maximum number of retries for HTTP requests.
+    """
+
+    def __init__(
+        self, pool_connections: int = 10, pool_maxsize: int = 10, max_retries: int = 3
+    ):
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._max_retries = max_retries
+        self._create_session()
+
+    @property
+    def session(self) -> Session:
+        return self._session
+
+    @property
+    def adapter(self) -> HTTPAdapter:
+        return self._adapter
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        self._session.close()
+
+    def _create_session(self) -> None:
+        self._pid = os.getpid()
+        self._session = Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=Retry(total=self._max_retries, backoff_factor=0.1),
+        )
+        self._session.mount('https://', self._adapter)
+
+    def _reset_after_fork(self) -> None:
+        """Replaces the session inherited from the parent process. Safe to call once per
+        client sharing this pool, as the session is only replaced once per process. The
+        parent's session is dropped rather than closed, as its sockets are still in use
+        by the parent."""
+        if self._pid != os.getpid():
+            self._create_session()
@@ -0,0 +1,225 @@
+import re
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from gzip import BadGzipFile, decompress
+from threading import Lock, get_ident
+from typing import Iterator, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import Response
+from vonage_http_client.http_logging import REDACTED, SENSITIVE_KEYS, redact
+
+_UNREADABLE_BODY = b'<unreadable body redacted>'
+
+# The string or scalar value of a sensitive key at any depth of a JSON document. A
+# string cut short by truncation has no closing quote.
+_SENSITIVE_JSON_VALUE = re.compile(
+    rb'("(?:'
+    + b'|'.join(re.escape(key.encode()) for key in sorted(SENSITIVE_KEYS))
+    + rb')"\s*:\s*)(?:"(?:[^"\\]|\\.)*"?|[-+.\w]+)',
+    re.IGNORECASE,
+)
+
+_correlation_id: ContextVar[Optional[str]] = ContextVar(
+    'vonage_correlation_id', default=None
+)
+
+
+@contextmanager
+def correlation_id(value: str) -> Iterator[str]:
+    """Tags every HTTP exchange made inside the block with a correlation ID, so it can be
+    found later with `ExchangeHistory.find(correlation_id=...)`.
+
+    Args:
+        value (str): The correlation ID to use.
+    """
+    token = _correlation_id.set(value)
+    try:
+        yield value
+    finally:
+        _correlation_id.reset(token)
+
+
+def current_correlation_id() -> Optional[str]:
+    """The correlation ID set by the innermost active `correlation_id` block, if any."""
+    return _correlation_id.get()
+
+
+@dataclass(frozen=True)
+class HttpExchange:
+    """A snapshot of a request sent and the response received, with credentials redacted
+    and bodies truncated.
+
+    Credentials are redacted from the headers and JSON or form bodies of both the request
+    and the response. Bodies are truncated before they're redacted, so recording a large
+    body costs no more than recording a small one. JSON bodies that aren't an object or
+    an array are replaced with a placeholder rather than stored unredacted. Gzipped
+    request bodies are stored decompressed, so they can be redacted too.
+
+    Args:
+        method (str): The HTTP method used.
+        url (str): The URL requested.
+        status_code (int): The status code of the response.
+        request_headers (dict): The request headers.
+        request_body (bytes): The first bytes of the request body.
+        request_size (int): The full size of the request body in bytes, as sent.
+        response_headers (dict): The response headers.
+        response_body (bytes): The first bytes of the response body.
+        response_size (int): The full size of the response body in bytes.
+        started_at (float): The time the request was sent, as a Unix timestamp.
+        duration (float): The time taken to receive the response, in seconds.
+        thread_id (int): The identifier of the thread that made the request.
+        correlation_id (str, Optional): The correlation ID active when the request was made.
+    """
+
+    method: str
+    url: str
+    status_code: int
+    request_headers: dict
+    request_body: bytes
+    request_size: int
+    response_headers: dict
+    response_body: bytes
+    response_size: int
+    started_at: float
+    duration: float
+    thread_id: int
+    correlation_id: Optional[str] = None
+
+
+class ExchangeHistory:
+    """A thread-safe ring buffer holding the most recent HTTP exchanges.
+
+    Args:
+        max_exchanges (int): The number of exchanges to keep.
+        max_body_bytes (int): The maximum number of bytes kept from each request and
+            response body.
+    """
+
+    def __init__(self, max_exchanges: int, max_body_bytes: int = 1024):
+        self._exchanges = deque(maxlen=max_exchanges)
+        self._max_body_bytes = max_body_bytes
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._exchanges)
+
+    def record(self, response: Response, started_at: float, duration: float) -> None:
+        """Adds a snapshot of a response and the request that produced it."""
+        request = response.request
+        request_body = _to_bytes(request.body)
+        # Requests has already decoded any content encoding of the response body
+        response_body = response.content or b''
+        redacted_request_body = _redact_body(
+            _decode_body(request_body, request.headers)[: self._max_body_bytes],
+            request.headers.get('Content-Type', ''),
+        )
+        redacted_response_body = _redact_body(
+            response_body[: self._max_body_bytes],
+            response.headers.get('Content-Type', ''),
+        )
+        exchange = HttpExchange(
+            method=request.method,
+            url=_redact_url(request.url),
+            status_code=response.status_code,
+            request_headers=redact(request.headers),
+            request_body=redacted_request_body,
+            request_size=len(request_body),
+            response_headers=redact(response.headers),
+            response_body=redacted_response_body,
+            response_size=len(response_body),
+            started_at=started_at,
+            duration=duration,
+            thread_id=get_ident(),
+            correlation_id=current_correlation_id(),
+        )
+        with self._lock:
+            self._exchanges.append(exchange)
+
+    def find(
+        self,
+        thread_id: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+    ) -> list[HttpExchange]:
+        """Gets the recorded exchanges, oldest first, optionally filtered.
+
+        Args:
+            thread_id (int, optional): Only return exchanges made by this thread.
+            correlation_id (str, optional): Only return exchanges with this correlation ID.
+
+        Returns:
+            list[HttpExchange]: The matching exchanges.
+        """
+        with self._lock:
+            exchanges = list(self._exchanges)
+        return [
+            exchange
+            for exchange in exchanges
+            if (thread_id is None or exchange.thread_id == thread_id)
+            and (correlation_id is None or exchange.correlation_id == correlation_id)
+        ]
+
+    def clear(self) -> None:
+        """Removes all recorded exchanges."""
+        with self._lock:
+            self._exchanges.clear()
+
+    def _reset_lock(self) -> None:
+        """Replaces the lock, which may have been held by another thread when the
+        process forked."""
+        self._lock = Lock()
+
+
+def _to_bytes(body: Union[str, bytes, None]) -> bytes:
+    if body is None:
+        return b''
+    if isinstance(body, str):
+        return body.encode('utf-8')
+    if isinstance(body, bytes):
+        return body
+    return b''
+
+
+def _redact_url(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    return urlunsplit(parts._replace(query=_redact_query(parts.query)))
+
+
+def _redact_query(query: str) -> str:
+    return urlencode(
+        [
+            (key, REDACTED if key.lower() in SENSITIVE_KEYS else value)
+            for key, value in parse_qsl(query, keep_blank_values=True)
+        ]
+    )
+
+
+def _decode_body(body: bytes, headers: Mapping) -> bytes:
+    encoding = headers.get('Content-Encoding', 'identity')
+    if not body or encoding == 'identity':
+        return body
+    if encoding == 'gzip':
+        try:
+            return decompress(body)
+        except (BadGzipFile, EOFError, OSError):
+            pass
+    # A body that can't be read can't be redacted, so it isn't kept
+    return b''
+
+
+def _redact_body(body: bytes, content_type: str) -> bytes:
+    """Redacts a body that may have been truncated, so can't be parsed."""
+    if not body:
+        return body
+    if 'json' in content_type:
+        if body.lstrip()[:1] not in (b'{', b'['):
+            # Not a JSON object or array, so it can't be redacted by key
+            return _UNREADABLE_BODY
+        return _SENSITIVE_JSON_VALUE.sub(rb'\1"' + REDACTED.encode() + b'"', body)
+    if 'x-www-form-urlencoded' in content_type:
+        return _redact_query(body.decode('utf-8', errors='replace')).encode('utf-8')
+    return body
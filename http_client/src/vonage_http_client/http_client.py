@@ -1,15 +1,24 @@
-from json import JSONDecodeError
-from logging import getLogger
+import os
+from json import JSONDecodeError, dumps
+from logging import DEBUG, WARNING, getLogger
 from platform import python_version
-from typing import Annotated, Literal, Optional, Union
+from threading import local
+from time import perf_counter, time
+from types import MethodType
+from typing import Annotated, Any, Iterator, Literal, Optional, Union
+from weakref import WeakSet
 
 from pydantic import BaseModel, Field, ValidationError, validate_call
 from requests import PreparedRequest, Response
-from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
-from requests.sessions import Session
-from urllib3 import Retry
 from vonage_http_client.auth import Auth
+from vonage_http_client.compression import (
+    CountingChunks,
+    accept_encoding,
+    gzip_body,
+    response_bytes_saved,
+)
+from vonage_http_client.connection_pool import ConnectionPool
 from vonage_http_client.errors import (
     AuthenticationError,
     FileStreamingError,
@@ -20,9 +29,27 @@ from vonage_http_client.errors import (
     RateLimitedError,
     ServerError,
 )
+from vonage_http_client.exchange_history import ExchangeHistory
+from vonage_http_client.http_logging import LazyRedacted, LazyResponseText, LogSampler
+from vonage_http_client.json_stream import iter_json_items
+from vonage_http_client.rate_limiter import RateLimiter
+from vonage_http_client.stats import RequestStats
 
 logger = getLogger('vonage')
 
+_clients = WeakSet()
+
+
+def _reset_clients_after_fork():
+    """Gives every live `HttpClient` fresh connection pools in a forked child process,
+    so the child never reads from or writes to sockets owned by its parent."""
+    for client in list(_clients):
+        client._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
 
 class HttpClientOptions(BaseModel):
     """Options for customizing the HTTP Client.
@@ -35,6 +62,22 @@ class HttpClientOptions(BaseModel):
         pool_connections (int, optional): The number of pool connections.
         pool_maxsize (int, optional): The maximum size of the connection pool.
         max_retries (int, optional): The maximum number of retries for HTTP requests.
+        log_sample_rate (float, optional): The fraction of requests whose debug log
+            records (and rate-limit warnings) are emitted, between 0 and 1.
+        exchange_history_size (int, optional): The number of recent HTTP exchanges to keep
+            in the client's exchange history. 0 disables the history.
+        exchange_history_body_bytes (int, optional): The maximum number of bytes of each
+            request and response body kept in the exchange history.
+        max_requests_per_second (float, optional): If set, the client paces its requests
+            so that no more than this many are sent per second.
+        trusted (bool, optional): Skip redundant runtime validation of internal calls
+            and of already-constructed request models.
+        json_library (str, optional): The library used to encode JSON request bodies
+            passed as dicts and to decode JSON responses. 'orjson' requires the `orjson`
+            package to be installed.
+        request_compression_min_bytes (int, optional): If set, JSON request bodies of at
+            least this many bytes are gzipped. Only set this for APIs that accept
+            gzip-encoded request bodies.
     """
 
     api_host: str = 'api.nexmo.com'
@@ -44,6 +87,13 @@ class HttpClientOptions(BaseModel):
     pool_connections: Optional[Annotated[int, Field(ge=1)]] = 10
     pool_maxsize: Optional[Annotated[int, Field(ge=1)]] = 10
     max_retries: Optional[Annotated[int, Field(ge=0)]] = 3
+    log_sample_rate: Optional[Annotated[float, Field(ge=0, le=1)]] = 1.0
+    exchange_history_size: Optional[Annotated[int, Field(ge=0)]] = 0
+    exchange_history_body_bytes: Optional[Annotated[int, Field(ge=0)]] = 1024
+    max_requests_per_second: Optional[Annotated[float, Field(gt=0)]] = None
+    trusted: bool = False
+    json_library: Literal['json', 'orjson'] = 'json'
+    request_compression_min_bytes: Optional[Annotated[int, Field(ge=0)]] = None
 
 
 class HttpClient:
@@ -53,6 +103,9 @@ class HttpClient:
         auth (Auth): An instance of the Auth class containing credentials to use when making HTTP requests.
         http_client_options (dict, optional): Customization options for the HTTP Client.
         sdk_version (str, optional): The SDK version used.
+        connection_pool (ConnectionPool, optional): A connection pool to share with other
+            clients. If not provided, the client creates its own pool from the
+            `pool_connections`, `pool_maxsize` and `max_retries` options.
 
         The http_client_options dict can have any of the following fields:
             api_host (str, optional): The API host to use for HTTP requests. Defaults to 'api.nexmo.com'.
@@ -62,6 +115,13 @@ class HttpClient:
             pool_connections (int, optional): The number of pool connections. Must be > 0. Default is 10.
             pool_maxsize (int, optional): The maximum size of the connection pool. Must be > 0. Default is 10.
             max_retries (int, optional): The maximum number of retries for HTTP requests. Must be >= 0. Default is 3.
+            log_sample_rate (float, optional): The fraction of requests whose debug log records and rate-limit warnings are emitted. Must be between 0 and 1. Default is 1.
+            exchange_history_size (int, optional): The number of recent HTTP exchanges to keep in `exchange_history`. Default is 0 (disabled).
+            exchange_history_body_bytes (int, optional): The maximum number of bytes of each body kept in the exchange history. Default is 1024.
+            max_requests_per_second (float, optional): The maximum number of requests this client sends per second. Default is None (no limit).
+            trusted (bool, optional): Skip redundant runtime validation of internal calls and of already-constructed request models. Default is False.
+            json_library (str, optional): The library used to encode and decode JSON, 'json' or 'orjson'. Default is 'json'.
+            request_compression_min_bytes (int, optional): The size from which JSON request bodies are gzipped. Default is None (never).
     """
 
     def __init__(
@@ -69,6 +129,7 @@ class HttpClient:
         auth: Auth,
         http_client_options: HttpClientOptions = None,
         sdk_version: str = None,
+        connection_pool: Optional[ConnectionPool] = None,
     ):
         self._auth = auth
         try:
@@ -88,21 +149,63 @@ class HttpClient:
         self._video_host = self._http_client_options.video_host
 
         self._timeout = self._http_client_options.timeout
-        self._session = Session()
-        self._adapter = HTTPAdapter(
-            pool_connections=self._http_client_options.pool_connections,
-            pool_maxsize=self._http_client_options.pool_maxsize,
-            max_retries=Retry(
-                total=self._http_client_options.max_retries, backoff_factor=0.1
-            ),
+        if connection_pool is None:
+            connection_pool = ConnectionPool(
+                pool_connections=self._http_client_options.pool_connections,
+                pool_maxsize=self._http_client_options.pool_maxsize,
+                max_retries=self._http_client_options.max_retries,
+            )
+        self._connection_pool = connection_pool
+
+        self._rate_limiter = None
+        if self._http_client_options.max_requests_per_second is not None:
+            self._rate_limiter = RateLimiter(
+                self._http_client_options.max_requests_per_second
+            )
+        self._stats = RequestStats()
+
+        self._trusted = self._http_client_options.trusted
+        if self._trusted:
+            self._request = MethodType(HttpClient.make_request.raw_function, self)
+        else:
+            self._request = self.make_request
+
+        self._json_dumps = None
+        self._json_loads = None
+        if self._http_client_options.json_library == 'orjson':
+            try:
+                import orjson
+            except ImportError as err:
+                raise InvalidHttpClientOptionsError(
+                    'The "orjson" JSON library was requested but orjson is not installed. '
+                    'Install it with `pip install vonage-http-client[orjson]`.'
+                ) from err
+            self._json_dumps = orjson.dumps
+            self._json_loads = orjson.loads
+
+        self._request_compression_min_bytes = (
+            self._http_client_options.request_compression_min_bytes
         )
-        self._session.mount('https://', self._adapter)
 
+        self._log_sampler = LogSampler(self._http_client_options.log_sample_rate)
+
+        self._sdk_version = sdk_version
         self._user_agent = f'vonage-python-sdk/{sdk_version} python/{python_version()}'
-        self._headers = {'User-Agent': self._user_agent, 'Accept': 'application/json'}
+        self._headers = {
+            'User-Agent': self._user_agent,
+            'Accept': 'application/json',
+            'Accept-Encoding': accept_encoding(),
+        }
+
+        self._local = local()
+        self._exchange_history = None
+        if self._http_client_options.exchange_history_size:
+            self._exchange_history = ExchangeHistory(
+                self._http_client_options.exchange_history_size,
+                self._http_client_options.exchange_history_body_bytes,
+            )
 
-        self._last_request = None
-        self._last_response = None
+        _clients.add(self)
 
     @property
     def auth(self):
@@ -128,36 +231,96 @@ class HttpClient:
     def user_agent(self):
         return self._user_agent
 
+    @property
+    def trusted(self) -> bool:
+        """Whether the client was created with the `trusted` option, which skips
+        redundant runtime validation."""
+        return self._trusted
+
+    @property
+    def connection_pool(self) -> ConnectionPool:
+        """The connection pool used to send requests, which may be shared with other
+        clients."""
+        return self._connection_pool
+
+    @property
+    def stats(self) -> RequestStats:
+        """Counters for the requests made by this client. Clients sharing a connection
+        pool keep separate stats."""
+        return self._stats
+
+    def with_auth(
+        self, auth: Auth, http_client_options: Optional[HttpClientOptions] = None
+    ) -> 'HttpClient':
+        """Creates a client that uses different credentials but shares this client's
+        connection pool. This is cheap, so it can be used to make requests on behalf of
+        many accounts or subaccounts without opening new connections for each one.
+
+        The new client has its own headers, rate limit, stats and exchange history.
+
+        Args:
+            auth (Auth): The credentials for the new client to use.
+            http_client_options (HttpClientOptions, optional): Options for the new
+                client. Defaults to this client's options. Connection pool options are
+                ignored, as the pool is shared.
+
+        Returns:
+            HttpClient: A client using `auth` and this client's connection pool.
+        """
+        client = HttpClient(
+            auth,
+            http_client_options or self._http_client_options,
+            self._sdk_version,
+            self._connection_pool,
+        )
+        client._user_agent = self._user_agent
+        client._headers['User-Agent'] = self._headers['User-Agent']
+        return client
+
     @property
     def last_request(self) -> Optional[PreparedRequest]:
-        """The last request sent to the server.
+        """The last request sent to the server by the current thread.
 
         Returns:
             Optional[PreparedRequest]: The exact bytes of the request sent to the server,
                 or None if no request has been sent.
         """
-        return self._last_response.request
+        response = self.last_response
+        if response is None:
+            return None
+        return response.request
 
     @property
     def last_response(self) -> Optional[Response]:
-        """The last response received from the server.
+        """The last response received from the server by the current thread.
 
         Returns:
             Optional[Response]: The response object received from the server,
                 or None if no response has been received.
         """
-        return self._last_response
+        return getattr(self._local, 'last_response', None)
+
+    @property
+    def exchange_history(self) -> Optional[ExchangeHistory]:
+        """The most recent HTTP exchanges made by this client, with credentials redacted
+        and bodies truncated.
+
+        Returns:
+            Optional[ExchangeHistory]: The exchange history, or None if the
+                `exchange_history_size` option is 0.
+        """
+        return self._exchange_history
 
     def post(
         self,
         host: str,
         request_path: str = '',
-        params: dict = None,
+        params: Union[dict, bytes] = None,
         auth_type: Literal['jwt', 'basic', 'body', 'signature', 'oauth2'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query-params'] = 'json',
         token: Optional[str] = None,
     ) -> Union[dict, None]:
-        return self.make_request(
+        return self._request(
             'POST', host, request_path, params, auth_type, sent_data_type, token
         )
 
@@ -169,19 +332,17 @@ class HttpClient:
         auth_type: Literal['jwt', 'basic', 'body', 'signature'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query_params'] = 'query_params',
     ) -> Union[dict, None]:
-        return self.make_request(
-            'GET', host, request_path, params, auth_type, sent_data_type
-        )
+        return self._request('GET', host, request_path, params, auth_type, sent_data_type)
 
     def patch(
         self,
         host: str,
         request_path: str = '',
-        params: dict = None,
+        params: Union[dict, bytes] = None,
         auth_type: Literal['jwt', 'basic', 'body', 'signature'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query_params'] = 'json',
     ) -> Union[dict, None]:
-        return self.make_request(
+        return self._request(
             'PATCH', host, request_path, params, auth_type, sent_data_type
         )
 
@@ -189,23 +350,21 @@ class HttpClient:
         self,
         host: str,
         request_path: str = '',
-        params: dict = None,
+        params: Union[dict, bytes] = None,
         auth_type: Literal['jwt', 'basic', 'body', 'signature'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query_params'] = 'json',
     ) -> Union[dict, None]:
-        return self.make_request(
-            'PUT', host, request_path, params, auth_type, sent_data_type
-        )
+        return self._request('PUT', host, request_path, params, auth_type, sent_data_type)
 
     def delete(
         self,
         host: str,
         request_path: str = '',
-        params: dict = None,
+        params: Union[dict, bytes] = None,
         auth_type: Literal['jwt', 'basic', 'body', 'signature'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query_params'] = 'json',
     ) -> Union[dict, None]:
-        return self.make_request(
+        return self._request(
             'DELETE', host, request_path, params, auth_type, sent_data_type
         )
 
@@ -215,7 +374,7 @@ class HttpClient:
         request_type: Literal['GET', 'POST', 'PATCH', 'PUT', 'DELETE'],
         host: str,
         request_path: str = '',
-        params: Optional[dict] = None,
+        params: Optional[Union[dict, bytes]] = None,
         auth_type: Literal['jwt', 'basic', 'body', 'signature', 'oauth2'] = 'jwt',
         sent_data_type: Literal['json', 'form', 'query_params'] = 'json',
         token: Optional[str] = None,
@@ -233,7 +392,10 @@ class HttpClient:
             request_type (str): The type of request to make (GET, POST, PATCH, PUT, DELETE).
             host (str): The host to make the request to.
             request_path (str, optional): The path to make the request to.
-            params (dict, optional): The parameters to send with the request.
+            params (dict | bytes, optional): The parameters to send with the request. A
+                JSON body can also be passed already encoded, as bytes, in which case
+                it is sent as-is. Pre-encoded bodies can't be used with the 'body' or
+                'signature' auth types, which add credentials to the parameters.
             auth_type (str, optional): The type of authentication to use with the request.
             sent_data_type (str, optional): The type of data being sent with the request.
             token (str, optional): The token to use for OAuth2 authentication.
@@ -244,56 +406,135 @@ class HttpClient:
         Raises:
             ConnectionError: If the request fails after the maximum number of retries.
         """
-        url = f'https://{host}{request_path}'
-        logger.debug(
-            f'{request_type} request to {url}, with data: {params}; headers: {self._headers}'
+        # Wait for the rate limit before creating credentials that could expire
+        self._throttle()
+        request_params = self._prepare_request(
+            request_type, host, request_path, params, auth_type, sent_data_type, token
         )
-        if auth_type == 'jwt':
-            self._headers['Authorization'] = self._auth.create_jwt_auth_string()
-        elif auth_type == 'basic':
-            self._headers['Authorization'] = self._auth.create_basic_auth_string()
-        elif auth_type == 'body':
-            params['api_key'] = self._auth.api_key
-            params['api_secret'] = self._auth.api_secret
-        elif auth_type == 'oauth2':
-            self._headers['Authorization'] = f'Bearer {token}'
-        elif auth_type == 'signature':
-            params['api_key'] = self._auth.api_key
-            params['sig'] = self._auth.sign_params(params)
-
-        request_params = {
-            'method': request_type,
-            'url': url,
-            'headers': self._headers,
-            'timeout': self._timeout,
-        }
-
-        if sent_data_type == 'json':
-            self._headers['Content-Type'] = 'application/json'
-            request_params['json'] = params
-        elif sent_data_type == 'query_params':
-            request_params['params'] = params
-        elif sent_data_type == 'form':
-            request_params['data'] = params
+        url = request_params['url']
+        # The request and response records of an exchange are sampled together
+        log_sampled = self._log_sampler.sample()
+
+        if log_sampled and logger.isEnabledFor(DEBUG):
+            logger.debug(
+                '%s request to %s, with data: %s; headers: %s',
+                request_type,
+                url,
+                LazyRedacted(params),
+                LazyRedacted(request_params['headers']),
+                extra={
+                    'vonage_http': {
+                        'event': 'request',
+                        'method': request_type,
+                        'url': url,
+                        'auth_type': auth_type,
+                        'sent_data_type': sent_data_type,
+                    }
+                },
+            )
 
-        max_retries = self._http_client_options.pool_maxsize or 10
+        max_retries = self._connection_pool.pool_maxsize or 10
         attempt = 0
         while attempt < max_retries:
             try:
-                with self._session.request(**request_params) as response:
-                    return self._parse_response(response)
+                started_at, start = time(), perf_counter()
+                with self._connection_pool.session.request(**request_params) as response:
+                    self._stats.record_response(
+                        response.status_code, perf_counter() - start
+                    )
+                    saved = response_bytes_saved(response, len(response.content))
+                    if saved:
+                        self._stats.increment('response_bytes_saved', saved)
+                    if self._exchange_history is not None:
+                        self._exchange_history.record(
+                            response, started_at, perf_counter() - start
+                        )
+                    return self._parse_response(response, log_sampled)
             except ConnectionError as e:
-                logger.debug(f'Connection Error: {e}')
+                self._stats.increment('connection_errors')
+                logger.debug('Connection Error: %s', e)
                 if 'RemoteDisconnected' in str(e.args):
                     attempt += 1
                     if attempt >= max_retries:
                         raise e
                     logger.debug(
-                        f'ConnectionError caused by RemoteDisconnected exception. Retrying request, attempt {attempt + 1} of {max_retries}'
+                        'ConnectionError caused by RemoteDisconnected exception. Retrying request, attempt %d of %d',
+                        attempt + 1,
+                        max_retries,
                     )
+                    self._throttle()
                 else:
                     raise e
 
+    def stream_json_items(
+        self,
+        host: str,
+        request_path: str,
+        item_path: str,
+        params: Optional[dict] = None,
+        auth_type: Literal['jwt', 'basic', 'body', 'signature', 'oauth2'] = 'jwt',
+        sent_data_type: Literal['json', 'form', 'query_params'] = 'query_params',
+        request_type: Literal['GET', 'POST'] = 'GET',
+        token: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """Make an HTTP request and yield the items of a JSON array in the response while
+        the body is still being downloaded, so that the whole response is never held in
+        memory.
+
+        The request is sent when iteration starts. Error responses raise the same
+        exceptions as `make_request`.
+
+        Args:
+            host (str): The host to make the request to.
+            request_path (str): The path to make the request to.
+            item_path (str): Dot-separated keys leading to the array in the response, e.g.
+                'countries' or '_embedded.calls'.
+            params (dict, optional): The parameters to send with the request.
+            auth_type (str, optional): The type of authentication to use with the request.
+            sent_data_type (str, optional): The type of data being sent with the request.
+            request_type (str, optional): The type of request to make (GET or POST).
+            token (str, optional): The token to use for OAuth2 authentication.
+            chunk_size (int, optional): The number of bytes read from the connection at a
+                time.
+
+        Yields:
+            The decoded items of the array, usually dicts.
+        """
+        self._throttle()
+        request_params = self._prepare_request(
+            request_type, host, request_path, params, auth_type, sent_data_type, token
+        )
+        log_sampled = self._log_sampler.sample()
+        if log_sampled and logger.isEnabledFor(DEBUG):
+            logger.debug(
+                '%s streaming request to %s, with data: %s; headers: %s',
+                request_type,
+                request_params['url'],
+                LazyRedacted(params),
+                LazyRedacted(request_params['headers']),
+            )
+
+        start = perf_counter()
+        try:
+            response = self._connection_pool.session.request(
+                **request_params, stream=True
+            )
+        except ConnectionError:
+            self._stats.increment('connection_errors')
+            raise
+        with response:
+            self._stats.record_response(response.status_code, perf_counter() - start)
+            if not 200 <= response.status_code < 300 or response.status_code == 204:
+                self._parse_response(response, log_sampled)
+                return
+            self._local.last_response = response
+            chunks = CountingChunks(response.iter_content(chunk_size))
+            yield from iter_json_items(chunks, item_path)
+            saved = response_bytes_saved(response, chunks.size)
+            if saved:
+                self._stats.increment('response_bytes_saved', saved)
+
     def download_file_stream(self, url: str, file_path: str) -> bytes:
         """Download a file from a URL and save it to a local file. This method streams the
         file to disk.
@@ -311,17 +552,22 @@ class HttpClient:
         }
 
         logger.debug(
-            f'Downloading file by streaming from {url} to local location: {file_path}, with headers: {self._headers}'
+            'Downloading file by streaming from %s to local location: %s, with headers: %s',
+            url,
+            file_path,
+            LazyRedacted(headers),
         )
         try:
-            with self._session.get(url, headers=headers, stream=True) as response:
+            with self._connection_pool.session.get(
+                url, headers=headers, stream=True
+            ) as response:
                 if response.status_code >= 400:
                     self._parse_response(response)
                 with open(file_path, 'wb') as f:
                     for chunk in response.iter_content(chunk_size=4096):
                         f.write(chunk)
         except Exception as e:
-            logger.error(f'Error downloading file from {url}: {e}')
+            logger.error('Error downloading file from %s: %s', url, e)
             raise FileStreamingError(f'Error downloading file from {url}: {e}') from e
 
     def append_to_user_agent(self, string: str):
@@ -332,20 +578,137 @@ class HttpClient:
         """
         self._user_agent += f' {string}'
 
-    def _parse_response(self, response: Response) -> Union[dict, None]:
-        logger.debug(
-            f'Response received from {response.url} with status code: {response.status_code}; headers: {response.headers}'
-        )
-        self._last_response = response
+    def _prepare_request(
+        self,
+        request_type: str,
+        host: str,
+        request_path: str,
+        params: Optional[Union[dict, bytes]],
+        auth_type: str,
+        sent_data_type: str,
+        token: Optional[str] = None,
+    ) -> dict:
+        """Applies authentication and builds the keyword arguments for
+        `requests.Session.request`.
+
+        The headers are a new dict for each request, as a client can be used by many
+        threads at once.
+        """
+        url = f'https://{host}{request_path}'
+        headers = self._headers.copy()
+        if auth_type == 'jwt':
+            headers['Authorization'] = self._auth.create_jwt_auth_string()
+        elif auth_type == 'basic':
+            headers['Authorization'] = self._auth.create_basic_auth_string()
+        elif auth_type == 'body':
+            params['api_key'] = self._auth.api_key
+            params['api_secret'] = self._auth.api_secret
+        elif auth_type == 'oauth2':
+            headers['Authorization'] = f'Bearer {token}'
+        elif auth_type == 'signature':
+            params['api_key'] = self._auth.api_key
+            params['sig'] = self._auth.sign_params(params)
+
+        request_params = {
+            'method': request_type,
+            'url': url,
+            'headers': headers,
+            'timeout': self._timeout,
+        }
+
+        if sent_data_type == 'json':
+            headers['Content-Type'] = 'application/json'
+            if isinstance(params, bytes):
+                request_params['data'] = params
+            elif self._json_dumps is not None and params is not None:
+                request_params['data'] = self._json_dumps(params)
+            else:
+                request_params['json'] = params
+            if self._request_compression_min_bytes is not None:
+                self._compress_body(request_params)
+        elif sent_data_type == 'query_params':
+            request_params['params'] = params
+        elif sent_data_type == 'form':
+            request_params['data'] = params
+
+        return request_params
+
+    def _compress_body(self, request_params: dict) -> None:
+        """Gzips a JSON request body if it's over the configured size."""
+        if request_params.get('json') is not None:
+            request_params['data'] = dumps(
+                request_params.pop('json'), allow_nan=False
+            ).encode('utf-8')
+        body = request_params.get('data')
+        if body is None:
+            return
+        compressed = gzip_body(body, self._request_compression_min_bytes)
+        if compressed is None:
+            return
+        request_params['data'] = compressed
+        request_params['headers']['Content-Encoding'] = 'gzip'
+        self._stats.increment('request_bytes_saved', len(body) - len(compressed))
+
+    def _throttle(self) -> None:
+        """Waits until a request can be sent within the client's rate limit."""
+        if self._rate_limiter is not None:
+            self._stats.increment('throttled_time', self._rate_limiter.acquire())
+
+    def _reset_after_fork(self) -> None:
+        """Replaces the connection pools inherited from the parent process and any locks
+        that may have been held when it forked. Auth, options, headers, stats and the
+        exchange history carry over."""
+        self._connection_pool._reset_after_fork()
+        self._local = local()
+        self._stats._reset_lock()
+        if self._rate_limiter is not None:
+            self._rate_limiter._reset_lock()
+        if self._exchange_history is not None:
+            self._exchange_history._reset_lock()
+
+    def _parse_response(
+        self, response: Response, log_sampled: bool = True
+    ) -> Union[dict, None]:
+        if log_sampled and logger.isEnabledFor(DEBUG):
+            logger.debug(
+                'Response received from %s with status code: %d; headers: %s',
+                response.url,
+                response.status_code,
+                LazyRedacted(response.headers),
+                extra={
+                    'vonage_http': {
+                        'event': 'response',
+                        'url': response.url,
+                        'status_code': response.status_code,
+                        'elapsed': response.elapsed.total_seconds(),
+                    }
+                },
+            )
+        self._local.last_response = response
         if 200 <= response.status_code < 300:
             try:
+                if self._json_loads is not None:
+                    return self._json_loads(response.content)
                 return response.json()
             except JSONDecodeError:
                 return None
         if response.status_code >= 400:
-            logger.warning(
-                f'Http Response Error! Status code: {response.status_code}; content: {repr(response.text)}; from url: {response.url}'
-            )
+            if logger.isEnabledFor(WARNING) and (
+                response.status_code != 429 or log_sampled
+            ):
+                logger.warning(
+                    'Http Response Error! Status code: %d; content: %s; from url: %s',
+                    response.status_code,
+                    LazyResponseText(response),
+                    response.url,
+                    extra={
+                        'vonage_http': {
+                            'event': 'error_response',
+                            'url': response.url,
+                            'status_code': response.status_code,
+                        }
+                    },
+                )
             if response.status_code == 401:
                 raise AuthenticationError(response)
             if response.status_code == 403:
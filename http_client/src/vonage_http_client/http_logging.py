@@ -0,0 +1,119 @@
+from json import loads
+from random import random
+from typing import Any, Mapping, Optional, Union
+
+REDACTED = '***'
+
+SENSITIVE_KEYS = frozenset(
+    {
+        'access_token',
+        'api_secret',
+        'authorization',
+        'client_secret',
+        'cookie',
+        'password',
+        'private_key',
+        'refresh_token',
+        'secret',
+        'set-cookie',
+        'sig',
+        'token',
+    }
+)
+
+
+def redact(data: Optional[Mapping]) -> Optional[dict]:
+    """Returns a copy of a params or headers mapping with credential values masked.
+
+    Keys are matched case-insensitively against `SENSITIVE_KEYS`. Nested mappings, and
+    mappings inside lists, are redacted recursively.
+
+    Args:
+        data (Mapping, optional): The params or headers to redact.
+
+    Returns:
+        dict: A redacted copy of the data, or None if no data was provided.
+    """
+    if data is None:
+        return None
+    return {
+        key: REDACTED if str(key).lower() in SENSITIVE_KEYS else _redact_value(value)
+        for key, value in data.items()
+    }
+
+
+def _redact_value(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return redact(value)
+    if isinstance(value, (list, tuple)):
+        return [_redact_value(item) for item in value]
+    return value
+
+
+class LazyRedacted:
+    """Wraps a params or headers mapping, or a pre-encoded JSON body, so that it is only
+    decoded, copied, redacted and formatted if a log record using it is actually
+    emitted."""
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Union[Mapping, bytes, None]):
+        self._data = data
+
+    def __str__(self) -> str:
+        data = self._data
+        if isinstance(data, bytes):
+            try:
+                data = loads(data)
+            except ValueError:
+                return f'<{len(self._data)} bytes>'
+        return str(_redact_value(data))
+
+    __repr__ = __str__
+
+
+class LazyResponseText:
+    """Wraps a response so that its body is only decoded and truncated if a log record
+    using it is actually emitted.
+
+    Args:
+        response (requests.Response): The response whose body should be logged.
+        max_length (int, optional): The maximum number of characters of the body to log.
+    """
+
+    __slots__ = ('_response', '_max_length')
+
+    def __init__(self, response: Any, max_length: int = 1000):
+        self._response = response
+        self._max_length = max_length
+
+    def __str__(self) -> str:
+        text = self._response.text
+        if len(text) > self._max_length:
+            return f'{text[:self._max_length]!r}... ({len(text)} characters)'
+        return repr(text)
+
+    __repr__ = __str__
+
+
+class LogSampler:
+    """Decides whether the log records of a sampled exchange should be emitted.
+
+    One decision is made per request and applies to both its request and response
+    records, so a response is never logged without its request.
+
+    Args:
+        rate (float): The fraction of records to emit, between 0 and 1.
+    """
+
+    __slots__ = ('rate',)
+
+    def __init__(self, rate: float = 1.0):
+        self.rate = rate
+
+    def sample(self) -> bool:
+        if self.rate >= 1:
+            return True
+        if self.rate <= 0:
+            return False
+        return random() < self.rate
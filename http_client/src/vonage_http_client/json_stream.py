@@ -0,0 +1,140 @@
+from codecs import getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Iterable, Iterator
+
+_decoder = JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]}'
+
+
+class _Buffer:
+    """Text decoded so far from a stream of byte chunks, with a read position."""
+
+    __slots__ = ('_chunks', '_decoder', 'text', 'pos', 'exhausted')
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self, min_length: int = 0) -> bool:
+        """Reads chunks until at least `min_length` characters are buffered, or at least
+        one chunk if that many already are, dropping the text already consumed. Returns
+        False if the stream has ended."""
+        parts = [self.text[self.pos :]]
+        length = len(parts[0])
+        read = False
+        for chunk in self._chunks:
+            if chunk:
+                text = self._decoder.decode(chunk)
+                parts.append(text)
+                length += len(text)
+                read = True
+                if length >= min_length:
+                    break
+        else:
+            if not self.exhausted:
+                parts.append(self._decoder.decode(b'', final=True))
+                self.exhausted = True
+        # Joined once, so text isn't copied again for every chunk read
+        self.text = ''.join(parts)
+        self.pos = 0
+        return read
+
+    def next_char(self) -> str:
+        """Skips whitespace and returns the next character without consuming it, or an
+        empty string at the end of the stream."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char: str) -> None:
+        found = self.next_char()
+        if found != char:
+            raise JSONDecodeError(f'Expecting {char!r}', self.text, self.pos)
+        self.pos += 1
+
+    def decode_value(self) -> Any:
+        """Decodes the next complete JSON value, reading more chunks as needed."""
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except JSONDecodeError:
+                # Wait for the pending text to double before decoding the value again,
+                # so a value spanning many chunks is decoded a logarithmic number of
+                # times and each byte is parsed a constant number of times overall
+                if self.fill(2 * (len(self.text) - self.pos)):
+                    continue
+                raise
+            # A number is only complete once the character after it has been received
+            if (
+                isinstance(value, (int, float))
+                and not self.exhausted
+                and (end == len(self.text) or self.text[end] not in _DELIMITERS)
+            ):
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(chunks: Iterable[bytes], path: str) -> Iterator[Any]:
+    """Incrementally parses a JSON document from a stream of byte chunks and yields the
+    items of the array at `path`, one at a time, as soon as each has been received.
+
+    Only one item (and the chunk it is in) is held in memory at a time. Values of other
+    keys that come before the array are decoded and discarded; anything after the array is
+    not read.
+
+    Args:
+        chunks (Iterable[bytes]): The document, e.g. `response.iter_content(...)`.
+        path (str): Dot-separated keys leading from the top-level object to the array,
+            e.g. `'countries'` or `'_embedded.calls'`. An empty string means the document
+            itself is the array.
+
+    Yields:
+        The decoded items of the array. Nothing is yielded if the path isn't found.
+
+    Raises:
+        JSONDecodeError: If the document isn't valid JSON.
+    """
+    buffer = _Buffer(chunks)
+    for key in path.split('.') if path else []:
+        if not _seek_key(buffer, key):
+            return
+    if buffer.next_char() != '[':
+        return
+    buffer.pos += 1
+    if buffer.next_char() == ']':
+        return
+    while True:
+        yield buffer.decode_value()
+        char = buffer.next_char()
+        if char == ']':
+            return
+        buffer.expect(',')
+
+
+def _seek_key(buffer: _Buffer, key: str) -> bool:
+    """Moves the buffer to the value of `key` in the object at the current position."""
+    if buffer.next_char() != '{':
+        return False
+    buffer.pos += 1
+    if buffer.next_char() == '}':
+        return False
+    while True:
+        name = buffer.decode_value()
+        buffer.expect(':')
+        if name == key:
+            return True
+        buffer.decode_value()
+        if buffer.next_char() == '}':
+            return False
+        buffer.expect(',')
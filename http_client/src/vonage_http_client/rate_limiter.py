@@ -0,0 +1,48 @@
+from threading import Lock
+from time import monotonic, sleep
+from typing import Optional
+
+
+class RateLimiter:
+    """A thread-safe token bucket that paces calls to a maximum rate.
+
+    Callers that exceed the rate reserve a slot in the future and sleep until it, so
+    concurrent callers are spaced evenly rather than released in bursts.
+
+    Args:
+        rate (float): The maximum number of calls per second.
+        burst (int, optional): The number of calls that can be made back-to-back before
+            pacing starts. Defaults to 1.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self._rate = rate
+        self._burst = burst or 1
+        self._tokens = float(self._burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def acquire(self) -> float:
+        """Waits until a call can be made.
+
+        Returns:
+            float: The time spent waiting, in seconds.
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            sleep(wait)
+        return wait
+
+    def _reset_lock(self) -> None:
+        self._lock = Lock()
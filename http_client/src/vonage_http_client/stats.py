@@ -0,0 +1,48 @@
+from threading import Lock
+
+
+class RequestStats:
+    """Thread-safe counters describing the requests made by an `HttpClient`."""
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets all counters to zero."""
+        with self._lock:
+            self._counters = {
+                'requests': 0,
+                'errors': 0,
+                'rate_limited': 0,
+                'connection_errors': 0,
+                'request_time': 0.0,
+                'throttled_time': 0.0,
+                'request_bytes_saved': 0,
+                'response_bytes_saved': 0,
+            }
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def record_response(self, status_code: int, duration: float) -> None:
+        with self._lock:
+            self._counters['requests'] += 1
+            self._counters['request_time'] += duration
+            if status_code >= 400:
+                self._counters['errors'] += 1
+            if status_code == 429:
+                self._counters['rate_limited'] += 1
+
+    def snapshot(self) -> dict:
+        """Gets a copy of the current counters.
+
+        Returns:
+            dict: The counters, keyed by name.
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def _reset_lock(self) -> None:
+        self._lock = Lock()
@@ -0,0 +1,52 @@
+from functools import wraps
+from inspect import signature
+from itertools import chain
+from typing import Any, Callable
+
+from pydantic import BaseModel, validate_call
+
+
+def _is_constructed(value: Any) -> bool:
+    if isinstance(value, BaseModel):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(item, BaseModel) for item in value)
+    return False
+
+
+def validate_call_unless_trusted(func: Callable) -> Callable:
+    """Like `pydantic.validate_call`, for methods of API classes that have an
+    `_http_client` attribute.
+
+    If the HTTP client was created with the `trusted` option and every argument is an
+    already-constructed (so already-validated) pydantic model, the method is called
+    directly without validating its arguments again. None is only skipped for
+    parameters that default to None. Otherwise, arguments are validated as usual.
+    """
+    validated = validate_call(func)
+    # The parameters after `self`
+    parameters = list(signature(func).parameters.values())[1:]
+    names = [parameter.name for parameter in parameters]
+    optional = frozenset(
+        parameter.name for parameter in parameters if parameter.default is None
+    )
+
+    def constructed(args: tuple, kwargs: dict) -> bool:
+        if len(args) > len(names):
+            return False
+        for name, value in chain(zip(names, args), kwargs.items()):
+            if value is None:
+                if name not in optional:
+                    return False
+            elif not _is_constructed(value):
+                return False
+        return True
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._http_client.trusted and constructed(args, kwargs):
+            return func(self, *args, **kwargs)
+        return validated(self, *args, **kwargs)
+
+    wrapper.raw_function = func
+    return wrapper
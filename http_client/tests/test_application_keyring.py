@@ -0,0 +1,83 @@
+from os.path import dirname, join
+from unittest.mock import patch
+
+import responses
+from jwt import decode
+from pytest import raises
+from testutils import build_response
+from vonage_http_client import ApplicationKeyring, HttpClient
+from vonage_http_client.errors import InvalidAuthError, JWTGenerationError
+
+
+def read_file(path):
+    with open(join(dirname(__file__), path)) as input_file:
+        return input_file.read()
+
+
+path = join(dirname(__file__), 'test_application_keyring.py')
+private_key = read_file('data/dummy_private_key.txt')
+public_key = read_file('data/dummy_public_key.txt')
+
+
+def test_keyring_add_and_remove_applications():
+    keyring = ApplicationKeyring({'app-1': private_key})
+    keyring.add('app-2', private_key)
+
+    assert 'app-1' in keyring
+    assert len(keyring) == 2
+    assert keyring.application_ids == ['app-1', 'app-2']
+
+    keyring.remove('app-1')
+    assert 'app-1' not in keyring
+
+
+def test_keyring_generates_jwt_per_application():
+    keyring = ApplicationKeyring({'app-1': private_key, 'app-2': private_key})
+
+    token_1 = keyring.generate_application_jwt('app-1')
+    token_2 = keyring.generate_application_jwt('app-2')
+
+    assert decode(token_1, public_key, algorithms='RS256')['application_id'] == 'app-1'
+    assert decode(token_2, public_key, algorithms='RS256')['application_id'] == 'app-2'
+
+
+def test_keyring_caches_default_tokens_until_refresh():
+    keyring = ApplicationKeyring({'app-1': private_key}, refresh_margin=60)
+
+    token = keyring.generate_application_jwt('app-1')
+    assert keyring.generate_application_jwt('app-1') == token
+    assert keyring.generate_application_jwt('app-1', {'sub': 'user'}) != token
+
+    with patch('vonage_http_client.application_keyring.time') as mock_time:
+        mock_time.return_value = decode(token, public_key, algorithms='RS256')['exp']
+        assert keyring.generate_application_jwt('app-1') != token
+
+
+def test_keyring_without_token_cache():
+    keyring = ApplicationKeyring({'app-1': private_key}, cache_tokens=False)
+    token = keyring.generate_application_jwt('app-1')
+    assert keyring.generate_application_jwt('app-1') != token
+
+
+def test_keyring_unknown_application():
+    keyring = ApplicationKeyring()
+    with raises(JWTGenerationError):
+        keyring.generate_application_jwt('app-1')
+    with raises(InvalidAuthError):
+        keyring.auth('app-1')
+
+
+@responses.activate
+def test_keyring_auth_switches_application_on_shared_client():
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    keyring = ApplicationKeyring({'app-1': private_key, 'app-2': private_key})
+    client = HttpClient(keyring.auth('app-1', api_key='key', api_secret='secret'))
+    app_2_client = client.with_auth(keyring.auth('app-2'))
+
+    assert client.auth.application_id == 'app-1'
+    assert client.auth.api_key == 'key'
+    assert app_2_client.connection_pool is client.connection_pool
+
+    app_2_client.get(host='example.com', request_path='/get_json')
+    token = responses.calls[0].request.headers['Authorization'][len(b'Bearer ') :]
+    assert decode(token, public_key, algorithms='RS256')['application_id'] == 'app-2'
@@ -39,6 +39,18 @@ def test_create_auth_class_and_get_objects():
     assert auth._signature_method == hashlib.sha256
 
 
+def test_create_auth_from_jwt_client():
+    jwt_client = JwtClient(application_id, private_key)
+    auth = Auth.from_jwt_client(
+        application_id, jwt_client, api_key=api_key, api_secret=api_secret
+    )
+
+    assert auth.application_id == application_id
+    assert auth.api_key == api_key
+    assert auth._jwt_client is jwt_client
+    assert auth.create_jwt_auth_string().startswith(b'Bearer ')
+
+
 def test_create_new_auth_invalid_type():
     with raises(ValidationError):
         Auth(api_key=1234)
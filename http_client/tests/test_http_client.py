@@ -1,14 +1,21 @@
+import gzip
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from http.client import RemoteDisconnected
-from json import loads
+from json import dumps, loads
 from os.path import abspath, dirname, join
+from threading import Thread, get_ident
+from time import perf_counter
 from unittest.mock import patch
 
 import responses
-from pytest import raises
+from pytest import mark, raises
 from requests import PreparedRequest, Response, Session
 from requests.exceptions import ConnectionError
 from responses import matchers
 from testutils import build_response, get_mock_jwt_auth
+from vonage_http_client import correlation_id
 from vonage_http_client.auth import Auth
 from vonage_http_client.errors import (
     AuthenticationError,
@@ -16,10 +23,21 @@ from vonage_http_client.errors import (
     ForbiddenError,
     HttpRequestError,
     InvalidHttpClientOptionsError,
+    NotFoundError,
     RateLimitedError,
     ServerError,
 )
-from vonage_http_client.http_client import HttpClient, HttpClientOptions
+from vonage_http_client.http_client import (
+    HttpClient,
+    HttpClientOptions,
+    _reset_clients_after_fork,
+)
+from vonage_http_client.http_logging import (
+    REDACTED,
+    LazyRedacted,
+    LazyResponseText,
+    redact,
+)
 
 path = abspath(__file__)
 
@@ -49,6 +67,13 @@ def test_create_http_client_options():
         'pool_connections': 5,
         'pool_maxsize': 12,
         'max_retries': 5,
+        'log_sample_rate': 0.5,
+        'exchange_history_size': 5,
+        'exchange_history_body_bytes': 256,
+        'max_requests_per_second': 100.0,
+        'trusted': True,
+        'json_library': 'orjson',
+        'request_compression_min_bytes': 1024,
     }
     client = HttpClient(Auth(), client_options)
     assert client.http_client_options.model_dump() == client_options
@@ -86,6 +111,26 @@ def test_make_get_request_and_last_request_and_response():
     assert client.last_response.headers == {'Content-Type': 'application/json'}
 
 
+def test_last_request_and_response_before_any_request():
+    client = HttpClient(Auth())
+    assert client.last_request is None
+    assert client.last_response is None
+
+
+@responses.activate
+def test_last_response_is_per_thread():
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(get_mock_jwt_auth())
+
+    thread = Thread(target=client.get, args=('example.com', '/get_json'))
+    thread.start()
+    thread.join()
+
+    assert client.last_response is None
+    client.get(host='example.com', request_path='/get_json')
+    assert client.last_response.status_code == 200
+
+
 @responses.activate
 def test_make_get_request_no_content():
     build_response(path, 'GET', 'https://example.com/get_json', status_code=204)
@@ -115,6 +160,43 @@ def test_make_post_request():
     assert loads(responses.calls[0].request.body) == params
 
 
+@responses.activate
+def test_make_post_request_with_pre_encoded_body():
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    client = HttpClient(Auth(api_key='asdf', api_secret='asdf'))
+    body = b'{"test":"post request"}'
+
+    res = client.post('example.com', '/post_json', body, auth_type='basic')
+    assert res['hello'] == 'world!'
+
+    request = responses.calls[0].request
+    assert request.body == body
+    assert request.headers['Content-Type'] == 'application/json'
+
+
+@responses.activate
+def test_orjson_json_library():
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    client = HttpClient(
+        Auth(api_key='asdf', api_secret='asdf'),
+        http_client_options={'json_library': 'orjson'},
+    )
+    params = {'test': 'post request', 'testing': 'http client'}
+
+    res = client.post('example.com', '/post_json', params, auth_type='basic')
+    assert res == {'hello': 'world!'}
+
+    body = responses.calls[0].request.body
+    assert body == b'{"test":"post request","testing":"http client"}'
+
+
+def test_orjson_json_library_not_installed():
+    with patch.dict('sys.modules', {'orjson': None}):
+        with raises(InvalidHttpClientOptionsError) as e:
+            HttpClient(Auth(), http_client_options={'json_library': 'orjson'})
+    assert 'orjson is not installed' in str(e.value)
+
+
 @responses.activate
 def test_make_post_request_with_signature():
     params = {
@@ -294,6 +376,86 @@ def test_download_file_stream_error():
     assert '400 response from' in e.exconly()
 
 
+@responses.activate
+def test_stream_json_items():
+    responses.add(
+        'GET',
+        'https://example.com/list',
+        body=b'{"count": 3, "items": [{"id": 1}, {"id": 2}, {"id": 3}]}',
+        content_type='application/json',
+    )
+    client = HttpClient(Auth(api_key='asdf', api_secret='asdf'))
+
+    items = client.stream_json_items(
+        'example.com', '/list', 'items', {'page': 1}, auth_type='basic'
+    )
+    assert len(responses.calls) == 0
+    assert list(items) == [{'id': 1}, {'id': 2}, {'id': 3}]
+
+    request = responses.calls[0].request
+    assert request.url == 'https://example.com/list?page=1'
+    assert request.headers['Authorization'].startswith('Basic ')
+    assert client.last_response.status_code == 200
+    assert client.stats.snapshot()['requests'] == 1
+
+
+@responses.activate
+def test_stream_json_items_error():
+    build_response(path, 'GET', 'https://example.com/list', '404.json', 404)
+    client = HttpClient(Auth(api_key='asdf', api_secret='asdf'))
+
+    with raises(NotFoundError):
+        list(client.stream_json_items('example.com', '/list', 'items', auth_type='basic'))
+
+
+@responses.activate
+def test_response_decompression_and_bytes_saved():
+    body = dumps({'items': [{'id': i, 'name': 'item'} for i in range(200)]}).encode()
+    responses.add(
+        'GET',
+        'https://example.com/list',
+        body=gzip.compress(body),
+        headers={'Content-Encoding': 'gzip'},
+        content_type='application/json',
+    )
+    client = HttpClient(Auth(api_key='asdf', api_secret='asdf'))
+
+    res = client.get('example.com', '/list', auth_type='basic')
+    assert len(res['items']) == 200
+    assert 'gzip' in responses.calls[0].request.headers['Accept-Encoding']
+    bytes_saved = len(body) - len(gzip.compress(body))
+    assert client.stats.snapshot()['response_bytes_saved'] == bytes_saved
+
+    items = client.stream_json_items('example.com', '/list', 'items', auth_type='basic')
+    assert len(list(items)) == 200
+    assert client.stats.snapshot()['response_bytes_saved'] == 2 * (
+        len(body) - len(gzip.compress(body))
+    )
+
+
+@responses.activate
+def test_request_body_compression():
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    client = HttpClient(
+        Auth(api_key='asdf', api_secret='asdf'),
+        http_client_options={'request_compression_min_bytes': 256},
+    )
+    large = {'text': 'Hello from Vonage! ' * 100}
+
+    client.post('example.com', '/post_json', {'text': 'short'}, auth_type='basic')
+    client.post('example.com', '/post_json', large, auth_type='basic')
+
+    small_request, large_request = (call.request for call in responses.calls)
+    assert 'Content-Encoding' not in small_request.headers
+    assert loads(small_request.body) == {'text': 'short'}
+    assert large_request.headers['Content-Encoding'] == 'gzip'
+    assert loads(gzip.decompress(large_request.body)) == large
+    assert client.stats.snapshot()['request_bytes_saved'] == len(
+        dumps(large).encode()
+    ) - len(large_request.body)
+
+
 @patch.object(Session, 'request')
 def test_retry_on_remote_disconnected_connection_error(mock_request):
     mock_request.side_effect = ConnectionError(
@@ -324,3 +486,380 @@ def test_dont_retry_on_generic_connection_error(mock_request):
         client.get(host='example.com', request_path='/get_json')
     assert mock_request.call_count == 1
     assert 'Error in connection to remote server' in str(e.value)
+
+
+@responses.activate
+def test_debug_logging_redacts_credentials(caplog):
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    client = HttpClient(Auth(api_key='asdfzxcv', api_secret='qwerasdfzxcv'))
+
+    with caplog.at_level(logging.DEBUG, logger='vonage'):
+        client.post(
+            host='example.com',
+            request_path='/post_json',
+            params={'test': 'post request'},
+            auth_type='body',
+        )
+
+    request_record, response_record = caplog.records
+    assert 'qwerasdfzxcv' not in request_record.getMessage()
+    assert f"'api_secret': '{REDACTED}'" in request_record.getMessage()
+    assert request_record.vonage_http['method'] == 'POST'
+    assert request_record.vonage_http['url'] == 'https://example.com/post_json'
+    assert response_record.vonage_http['status_code'] == 200
+
+
+@responses.activate
+def test_debug_logging_not_formatted_when_disabled(caplog):
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(get_mock_jwt_auth())
+
+    with patch('vonage_http_client.http_logging.redact') as mock_redact:
+        with caplog.at_level(logging.WARNING, logger='vonage'):
+            client.get(host='example.com', request_path='/get_json')
+
+    assert caplog.records == []
+    mock_redact.assert_not_called()
+
+
+@responses.activate
+def test_log_sample_rate_suppresses_records(caplog):
+    build_response(path, 'GET', 'https://example.com/get_json', '429.json', 429)
+    client = HttpClient(Auth(), http_client_options={'log_sample_rate': 0})
+
+    with caplog.at_level(logging.DEBUG, logger='vonage'):
+        with raises(RateLimitedError):
+            client.get(host='example.com', request_path='/get_json', auth_type='basic')
+
+    assert caplog.records == []
+
+
+@responses.activate
+def test_log_sampling_decided_per_exchange(caplog):
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(get_mock_jwt_auth(), http_client_options={'log_sample_rate': 0.5})
+
+    with patch('vonage_http_client.http_logging.random', side_effect=[0.1, 0.9]):
+        with caplog.at_level(logging.DEBUG, logger='vonage'):
+            client.get(host='example.com', request_path='/get_json')
+            client.get(host='example.com', request_path='/get_json')
+
+    # The first exchange is logged in full, and nothing is logged for the second
+    assert [record.vonage_http['event'] for record in caplog.records] == [
+        'request',
+        'response',
+    ]
+
+
+def test_redact_nested_values():
+    assert redact(None) is None
+    assert redact({'Authorization': 'Bearer abc', 'nested': {'sig': 'abc', 'a': 1}}) == {
+        'Authorization': REDACTED,
+        'nested': {'sig': REDACTED, 'a': 1},
+    }
+    assert redact({'items': [{'api_secret': 'abc'}, 'a']}) == {
+        'items': [{'api_secret': REDACTED}, 'a']
+    }
+    assert str(LazyRedacted(b'[{"token": "abc"}]')) == str([{'token': REDACTED}])
+
+
+def test_lazy_redacted_pre_encoded_body():
+    assert str(LazyRedacted(b'{"to": "1234", "api_secret": "x"}')) == str(
+        {'to': '1234', 'api_secret': REDACTED}
+    )
+    assert str(LazyRedacted(b'\x00\x01')) == '<2 bytes>'
+
+
+def test_lazy_response_text_truncates():
+    response = Response()
+    response._content = b'x' * 20
+    assert str(LazyResponseText(response, max_length=5)) == "'xxxxx'... (20 characters)"
+    assert str(LazyResponseText(response)) == repr('x' * 20)
+
+
+def test_exchange_history_disabled_by_default():
+    assert HttpClient(Auth()).exchange_history is None
+
+
+@responses.activate
+def test_exchange_history_records_redacted_truncated_exchanges():
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(
+        Auth(api_key='asdfzxcv', api_secret='qwerasdfzxcv'),
+        http_client_options={
+            'exchange_history_size': 2,
+            'exchange_history_body_bytes': 10,
+        },
+    )
+
+    with correlation_id('abc-123'):
+        client.post(
+            host='example.com',
+            request_path='/post_json',
+            params={'test': 'post request'},
+            auth_type='body',
+        )
+    client.get(host='example.com', request_path='/get_json', auth_type='body', params={})
+    client.get(host='example.com', request_path='/get_json', auth_type='basic')
+
+    history = client.exchange_history
+    assert len(history) == 2
+    query_auth_exchange, basic_auth_exchange = history.find()
+    assert query_auth_exchange.correlation_id is None
+    assert 'qwerasdfzxcv' not in query_auth_exchange.url
+    assert 'api_secret=%2A%2A%2A' in query_auth_exchange.url
+    assert basic_auth_exchange.request_headers['Authorization'] == '***'
+    assert basic_auth_exchange.response_size > 10
+    assert len(basic_auth_exchange.response_body) == 10
+    assert basic_auth_exchange.duration >= 0
+    assert history.find(correlation_id='abc-123') == []
+    assert history.find(thread_id=get_ident()) == [
+        query_auth_exchange,
+        basic_auth_exchange,
+    ]
+
+    history.clear()
+    assert len(history) == 0
+
+
+@responses.activate
+def test_exchange_history_correlation_id_and_json_redaction():
+    build_response(path, 'POST', 'https://example.com/post_json', 'example_post.json')
+    client = HttpClient(
+        Auth(api_key='asdfzxcv', api_secret='qwerasdfzxcv'),
+        http_client_options={'exchange_history_size': 5},
+    )
+
+    with correlation_id('abc-123'):
+        client.post(
+            host='example.com',
+            request_path='/post_json',
+            params={'test': 'post request'},
+            auth_type='body',
+        )
+
+    (exchange,) = client.exchange_history.find(correlation_id='abc-123')
+    assert exchange.method == 'POST'
+    assert exchange.status_code == 200
+    assert loads(exchange.request_body) == {
+        'test': 'post request',
+        'api_key': 'asdfzxcv',
+        'api_secret': '***',
+    }
+
+
+@responses.activate
+def test_exchange_history_redacts_token_responses_and_compressed_bodies():
+    responses.add(
+        responses.POST,
+        'https://example.com/oauth2/token',
+        json={'access_token': 'secret-access-token', 'expires_in': 3600},
+        headers={'Set-Cookie': 'session=secret-session'},
+    )
+    client = HttpClient(
+        Auth(api_key='asdfzxcv', api_secret='qwerasdfzxcv'),
+        http_client_options={
+            'exchange_history_size': 5,
+            'request_compression_min_bytes': 64,
+        },
+    )
+
+    client.post(
+        host='example.com',
+        request_path='/oauth2/token',
+        params={'client_secret': 'secret-client-secret', 'padding': 'x' * 100},
+        auth_type='basic',
+    )
+
+    (exchange,) = client.exchange_history.find()
+    assert loads(exchange.response_body) == {'access_token': '***', 'expires_in': 3600}
+    assert exchange.response_headers['Set-Cookie'] == '***'
+    # The gzipped request body is stored decompressed, so it can be redacted
+    assert exchange.request_headers['Content-Encoding'] == 'gzip'
+    assert loads(exchange.request_body)['client_secret'] == '***'
+    assert b'secret-' not in exchange.request_body + exchange.response_body
+
+
+@responses.activate
+def test_exchange_history_redacts_truncated_and_unreadable_bodies():
+    body = dumps([{'id': i, 'api_secret': f'secret-{i}'} for i in range(1000)])
+    responses.add(
+        responses.GET,
+        'https://example.com/list',
+        body=body,
+        content_type='application/json',
+    )
+    responses.add(
+        responses.GET,
+        'https://example.com/error',
+        body='secret-in-an-error-page',
+        content_type='application/json',
+    )
+    client = HttpClient(
+        Auth(),
+        http_client_options={
+            'exchange_history_size': 5,
+            'exchange_history_body_bytes': 63,
+        },
+    )
+
+    client.get('example.com', '/list', auth_type='basic')
+    client.get('example.com', '/error', auth_type='basic')
+
+    list_exchange, error_exchange = client.exchange_history.find()
+    # Secrets in lists of objects are redacted, even where the body was cut short
+    assert list_exchange.response_size == len(body)
+    assert list_exchange.response_body == (
+        b'[{"id": 0, "api_secret": "***"}, {"id": 1, "api_secret": "***"'
+    )
+    assert b'secret-' not in list_exchange.response_body
+    # A body that can't be redacted by key isn't stored
+    assert b'secret-' not in error_exchange.response_body
+
+
+def test_reset_after_fork_replaces_connection_pools():
+    client = HttpClient(
+        get_mock_jwt_auth(), http_client_options={'exchange_history_size': 5}
+    )
+    tenant_client = client.with_auth(Auth())
+    client.append_to_user_agent('TestAgent')
+    pool = client.connection_pool
+    session, adapter = pool.session, pool.adapter
+
+    _reset_clients_after_fork()
+    assert pool.session is session
+
+    with patch('vonage_http_client.connection_pool.os.getpid', return_value=-1):
+        _reset_clients_after_fork()
+
+    assert pool.session is not session
+    assert pool.adapter is not adapter
+    assert pool.session.get_adapter('https://example.com') is pool.adapter
+    assert tenant_client.connection_pool is pool
+    assert 'TestAgent' in client.user_agent
+    assert client.exchange_history is not None
+
+
+@mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+def test_forked_child_gets_new_session():
+    client = HttpClient(get_mock_jwt_auth())
+    parent_session = client.connection_pool.session
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        new_session = client.connection_pool.session is not parent_session
+        os.write(write_fd, b'1' if new_session else b'0')
+        os._exit(0)
+
+    os.close(write_fd)
+    result = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert result == b'1'
+    assert client.connection_pool.session is parent_session
+
+
+@responses.activate
+def test_with_auth_shares_connection_pool_with_separate_auth_and_stats():
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(get_mock_jwt_auth(), sdk_version='1.0.0')
+    tenant_client = client.with_auth(Auth('tenant_key', 'tenant_secret'))
+
+    assert tenant_client.connection_pool is client.connection_pool
+    assert tenant_client.auth.api_key == 'tenant_key'
+    assert tenant_client.user_agent == client.user_agent
+
+    tenant_client.get(host='example.com', request_path='/get_json', auth_type='basic')
+    client.get(host='example.com', request_path='/get_json')
+
+    assert responses.calls[0].request.headers['Authorization'].startswith('Basic ')
+    assert responses.calls[1].request.headers['Authorization'].startswith(b'Bearer ')
+    assert tenant_client.stats.snapshot()['requests'] == 1
+    assert client.stats.snapshot()['requests'] == 1
+
+
+@responses.activate
+def test_stats_count_errors():
+    build_response(path, 'GET', 'https://example.com/get_json', '429.json', 429)
+    client = HttpClient(Auth())
+    with raises(RateLimitedError):
+        client.get(host='example.com', request_path='/get_json', auth_type='basic')
+
+    stats = client.stats.snapshot()
+    assert stats['requests'] == 1
+    assert stats['errors'] == 1
+    assert stats['rate_limited'] == 1
+
+    client.stats.reset()
+    assert client.stats.snapshot()['requests'] == 0
+
+
+@responses.activate
+def test_max_requests_per_second_paces_requests():
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(Auth(), http_client_options={'max_requests_per_second': 50})
+
+    start = perf_counter()
+    for _ in range(4):
+        client.get(host='example.com', request_path='/get_json', auth_type='basic')
+
+    assert perf_counter() - start >= 0.06
+    assert client.stats.snapshot()['throttled_time'] > 0
+
+
+@responses.activate
+def test_concurrent_requests_use_their_own_headers():
+    responses.add_callback(
+        responses.POST,
+        'https://example.com/post_json',
+        callback=lambda request: (
+            200,
+            {},
+            dumps(
+                {
+                    'authorization': request.headers['Authorization'],
+                    'token': loads(request.body)['token'],
+                }
+            ),
+        ),
+    )
+    client = HttpClient(Auth(), http_client_options={'max_requests_per_second': 1000})
+
+    def post(i: int) -> dict:
+        return client.post(
+            'example.com',
+            '/post_json',
+            {'token': f'token-{i}'},
+            auth_type='oauth2',
+            token=f'token-{i}',
+        )
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(post, range(60)))
+
+    for result in results:
+        assert result['authorization'] == f'Bearer {result["token"]}'
+    assert 'Authorization' not in client._headers
+
+
+@responses.activate
+def test_rate_limit_acquired_before_request_prepared():
+    build_response(path, 'GET', 'https://example.com/get_json', 'example_get.json')
+    client = HttpClient(
+        get_mock_jwt_auth(), http_client_options={'max_requests_per_second': 50}
+    )
+    calls = []
+
+    with patch.object(
+        client._rate_limiter, 'acquire', side_effect=lambda: calls.append('acquire') or 0
+    ), patch.object(
+        client._auth,
+        'create_jwt_auth_string',
+        side_effect=lambda: calls.append('jwt') or 'Bearer token',
+    ):
+        client.get(host='example.com', request_path='/get_json')
+
+    assert calls == ['acquire', 'jwt']
@@ -0,0 +1,85 @@
+from json import JSONDecodeError, JSONDecoder, dumps
+from unittest.mock import patch
+
+from pytest import mark, raises
+from vonage_http_client.json_stream import iter_json_items
+
+DOCUMENT = {
+    'count': 3,
+    'meta': {'note': 'skipped [values] {here}', 'nested': [1, 2, {'a': None}]},
+    '_embedded': {
+        'calls': [
+            {'uuid': 'one', 'price': 0.5, 'to': {'number': '447700900000'}},
+            {'uuid': 'twö €', 'price': 12345, 'escaped': 'quote \" and \\\\ slash'},
+            {'uuid': 'three', 'flags': [True, False, None]},
+        ]
+    },
+    'trailing': 'not read',
+}
+ENCODED = dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+
+
+def chunked(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@mark.parametrize('size', [1, 2, 3, 7, 64, len(ENCODED)])
+def test_iter_json_items_across_chunk_boundaries(size):
+    items = list(iter_json_items(chunked(ENCODED, size), '_embedded.calls'))
+    assert items == DOCUMENT['_embedded']['calls']
+
+
+def test_iter_json_items_top_level_array_of_numbers():
+    assert list(iter_json_items(chunked(b' [1, 23, 456 ,7.5e3]', 1), '')) == [
+        1,
+        23,
+        456,
+        7500.0,
+    ]
+
+
+def test_iter_json_items_is_incremental():
+    received = []
+
+    def chunks():
+        for chunk in chunked(ENCODED, 16):
+            received.append(chunk)
+            yield chunk
+
+    items = iter_json_items(chunks(), '_embedded.calls')
+    assert next(items)['uuid'] == 'one'
+    assert sum(len(chunk) for chunk in received) < len(ENCODED)
+
+
+def test_iter_json_items_missing_path_or_empty_array():
+    assert list(iter_json_items([ENCODED], 'missing')) == []
+    assert list(iter_json_items([ENCODED], 'count.calls')) == []
+    assert list(iter_json_items([b'{"items": []}'], 'items')) == []
+    assert list(iter_json_items([b'{}'], 'items')) == []
+
+
+def test_iter_json_items_invalid_json():
+    with raises(JSONDecodeError):
+        list(iter_json_items([b'{"items": [{"a": 1} {"b": 2}]}'], 'items'))
+    with raises(JSONDecodeError):
+        list(iter_json_items([b'{"items": [{"a": 1}, {"b": '], 'items'))
+
+
+def test_iter_json_items_decodes_large_items_a_bounded_number_of_times():
+    item = {'networks': [{'name': f'Network {i}', 'price': '0.1'} for i in range(2000)]}
+    encoded = dumps([item, item]).encode()
+    decoder = JSONDecoder()
+    calls = []
+
+    def raw_decode(text, pos):
+        calls.append(len(text) - pos)
+        return decoder.raw_decode(text, pos)
+
+    with patch('vonage_http_client.json_stream._decoder') as mock_decoder:
+        mock_decoder.raw_decode.side_effect = raw_decode
+        items = list(iter_json_items(chunked(encoded, 64), ''))
+
+    assert items == [item, item]
+    # Each item spans over 1000 chunks, but the text decoded is within a small
+    # multiple of the document's size
+    assert sum(calls) < 4 * len(encoded)
@@ -0,0 +1,23 @@
+from threading import Thread
+from time import monotonic
+
+from vonage_http_client.rate_limiter import RateLimiter
+
+
+def test_rate_limiter_allows_burst_then_paces():
+    limiter = RateLimiter(100, burst=3)
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire() > 0
+
+
+def test_rate_limiter_paces_concurrent_callers():
+    limiter = RateLimiter(200)
+    start = monotonic()
+    threads = [Thread(target=limiter.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert monotonic() - start >= 0.045
+    assert limiter.rate == 200
@@ -0,0 +1,51 @@
+from pydantic import BaseModel, ValidationError
+from pytest import raises
+from vonage_http_client import Auth, HttpClient
+from vonage_http_client.trusted import validate_call_unless_trusted
+
+
+class Request(BaseModel):
+    value: int
+
+
+class Api:
+    def __init__(self, http_client: HttpClient):
+        self._http_client = http_client
+
+    @validate_call_unless_trusted
+    def call(self, request: Request, extra: list[Request] = None):
+        return request
+
+
+def test_trusted_option():
+    assert HttpClient(Auth()).trusted is False
+    client = HttpClient(Auth(), {'trusted': True})
+    assert client.trusted is True
+    assert client._request.__func__ is HttpClient.make_request.raw_function
+
+
+def test_untrusted_client_validates_arguments():
+    api = Api(HttpClient(Auth()))
+    assert api.call({'value': '1'}) == Request(value=1)
+    with raises(ValidationError):
+        api.call({'value': 'one'})
+
+
+def test_trusted_client_skips_validation_for_constructed_models():
+    api = Api(HttpClient(Auth(), {'trusted': True}))
+    request = Request.model_construct(value='not validated')
+
+    assert api.call(request, extra=[request]) is request
+    assert api.call(request, None) is request
+    assert api.call(request, extra=None) is request
+    assert api.call({'value': '1'}) == Request(value=1)
+    with raises(ValidationError):
+        api.call({'value': 'one'})
+
+
+def test_trusted_client_validates_none_for_required_models():
+    api = Api(HttpClient(Auth(), {'trusted': True}))
+    with raises(ValidationError):
+        api.call(None)
+    with raises(ValidationError):
+        api.call(request=None)
@@ -5,6 +5,7 @@ from typing import Union
 from uuid import uuid4
 
 from jwt import encode
+from jwt.algorithms import RSAAlgorithm
 
 from .errors import VonageJwtError
 
@@ -26,6 +27,8 @@ class JwtClient:
                 'Both of "application_id" and "private_key" are required.'
             )
 
+        self._signing_key = self._load_signing_key()
+
     def generate_application_jwt(self, jwt_options: dict = None) -> bytes:
         """Generates a JWT for the specified Vonage application.
 
@@ -51,9 +54,18 @@ class JwtClient:
 
         headers = {'alg': 'RS256', 'typ': 'JWT'}
 
-        token = encode(payload, self._private_key, algorithm='RS256', headers=headers)
+        token = encode(payload, self._signing_key, algorithm='RS256', headers=headers)
         return bytes(token, 'utf-8')
 
+    def _load_signing_key(self):
+        """Parses the PEM private key once, so it isn't parsed again for every JWT. If
+        the key can't be parsed, the raw key is used and the error is raised when a JWT
+        is generated."""
+        try:
+            return RSAAlgorithm(RSAAlgorithm.SHA256).prepare_key(self._private_key)
+        except Exception:
+            return self._private_key
+
     def _set_private_key(self, key: Union[str, bytes]) -> None:
         if isinstance(key, (str, bytes)) and re.search("[.][a-zA-Z0-9_]+$", key):
             with open(key, "rb") as key_file:
@@ -66,3 +66,11 @@ def test_generate_application_jwt_custom_claims():
     with raises(ImmatureSignatureError) as err:
         decode(jwt, key=public_key, algorithms='RS256')
     assert str(err.value) == 'The token is not yet valid (nbf)'
+
+
+def test_private_key_is_parsed_once():
+    jwt_client = JwtClient(application_id, private_key_string)
+    assert not isinstance(jwt_client._signing_key, (str, bytes))
+
+    jwt = jwt_client.generate_application_jwt()
+    assert decode(jwt, key=public_key, algorithms='RS256')['application_id'] == 'asdf1234'
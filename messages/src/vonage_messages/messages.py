@@ -1,5 +1,7 @@
 from pydantic import validate_call
+from pydantic_core import to_json
 from vonage_http_client.http_client import HttpClient
+from vonage_http_client.trusted import validate_call_unless_trusted
 
 from .models import BaseMessage
 from .responses import SendMessageResponse
@@ -30,7 +32,7 @@ class Messages:
         """
         return self._http_client
 
-    @validate_call
+    @validate_call_unless_trusted
     def send(
         self, message: BaseMessage, failover: list[BaseMessage] = None
     ) -> SendMessageResponse:
@@ -45,16 +47,17 @@ class Messages:
             SendMessageResponse: Response model containing the unique identifier of the sent message.
                 Access the identifier with the `message_uuid` attribute.
         """
-        body = message.model_dump(by_alias=True, exclude_none=True) or message
-
-        if failover is not None:
-            failover_body = [
-                m.model_dump(by_alias=True, exclude_none=True) or m for m in failover
-            ]
-            body = {
-                **body,
-                'failover': failover_body,
-            }
+        if failover is None:
+            body = to_json(message, by_alias=True, exclude_none=True)
+        else:
+            body = to_json(
+                {
+                    **message.model_dump(by_alias=True, exclude_none=True),
+                    'failover': failover,
+                },
+                by_alias=True,
+                exclude_none=True,
+            )
 
         response = self._http_client.post(
             self._http_client.api_host,
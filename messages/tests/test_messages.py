@@ -2,6 +2,7 @@ from json import loads
 from os.path import abspath
 
 import responses
+from pydantic import ValidationError
 from pytest import raises
 from vonage_http_client import Auth, HttpClient, HttpClientOptions, HttpRequestError
 from vonage_messages import (
@@ -52,6 +53,27 @@ def test_send_message():
     assert messages._auth_type == 'jwt'
 
 
+@responses.activate
+def test_send_message_trusted():
+    build_response(
+        path, 'POST', 'https://api.nexmo.com/v1/messages', 'send_message.json', 202
+    )
+    trusted_messages = Messages(HttpClient(get_mock_jwt_auth(), {'trusted': True}))
+    sms = Sms(from_='Vonage APIs', to='1234567890', text='Hello, World!')
+
+    response = trusted_messages.send(sms, failover=[sms])
+
+    assert (
+        loads(responses.calls[0].request.body)['failover'][0]['text'] == 'Hello, World!'
+    )
+    assert type(response) == SendMessageResponse
+    assert response.message_uuid == 'd8f86df1-dec6-442f-870a-2241be27d721'
+
+    # None isn't a constructed model, so it's still validated
+    with raises(ValidationError):
+        trusted_messages.send(None)
+
+
 @responses.activate
 def test_send_message_with_failover():
     build_response(
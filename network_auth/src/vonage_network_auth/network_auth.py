@@ -1,3 +1,8 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from time import monotonic
+from typing import Callable, Optional
 from urllib.parse import urlencode, urlunparse
 
 from pydantic import validate_call
@@ -6,16 +11,35 @@ from vonage_network_auth.requests import CreateOidcUrl
 
 from .responses import OidcResponse, TokenResponse
 
+# Cached tokens are refreshed this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 5
+
+# Called before the authorization and token requests of a SIM Swap token
+_TokenHooks = tuple[Optional[Callable[[], object]], Optional[Callable[[], object]]]
+
 
 class NetworkAuth:
     """Class containing methods for authenticating Network APIs following CAMARA
-    standards."""
+    standards.
+
+    SIM Swap access tokens are cached per number and scope until shortly before they
+    expire, and concurrent requests for the same token share one authorization flow.
+
+    Args:
+        http_client (HttpClient): The HTTP client used to make requests.
+        max_cached_tokens (int, optional): The maximum number of access tokens cached. Set
+            to 0 to disable caching.
+    """
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, max_cached_tokens: int = 10000):
         self._http_client = http_client
         self._host = 'api-eu.vonage.com'
         self._auth_type = 'jwt'
         self._sent_data_type = 'form'
+        self._max_cached_tokens = max_cached_tokens
+        self._tokens: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self._token_requests: dict[tuple[str, str], Future] = {}
+        self._token_lock = Lock()
 
     @property
     def http_client(self) -> HttpClient:
@@ -76,6 +100,9 @@ class NetworkAuth:
         """Get an OAuth2 user token for a given number and scope, to do a sim swap check.
         A CAMARA token is requested using the number and scope, and the token is returned.
 
+        Tokens are cached until shortly before they expire. If a token for the same
+        number and scope is already being requested, the result of that request is used.
+
         Args:
             number (str): The phone number to authenticate.
             scope (str): The scope of the token.
@@ -83,10 +110,59 @@ class NetworkAuth:
         Returns:
             str: The OAuth2 user token.
         """
-        oidc_response = self.make_oidc_auth_id_request(number, scope)
-        token_response = self.request_sim_swap_access_token(oidc_response.auth_req_id)
+        return self._get_sim_swap_camara_token(number, scope)
+
+    def _get_sim_swap_camara_token(
+        self, number: str, scope: str, hooks: _TokenHooks = (None, None)
+    ) -> str:
+        # `hooks` are called before the authorization and token requests respectively,
+        # if they're made, e.g. to wait for a rate limiter
+        if not self._max_cached_tokens:
+            return self._request_sim_swap_token(number, scope, hooks).access_token
+
+        key = (self._ensure_plus_prefix(number), scope)
+        with self._token_lock:
+            cached = self._tokens.get(key)
+            if cached is not None and cached[1] > monotonic():
+                return cached[0]
+            request = self._token_requests.get(key)
+            leader = request is None
+            if leader:
+                request = self._token_requests[key] = Future()
+
+        if not leader:
+            # Another thread is already requesting this token
+            return request.result()
+
+        try:
+            token_response = self._request_sim_swap_token(number, scope, hooks)
+        except BaseException as err:
+            with self._token_lock:
+                del self._token_requests[key]
+            request.set_exception(err)
+            raise
+        with self._token_lock:
+            if token_response.expires_in is not None:
+                self._cache_token(key, token_response)
+            del self._token_requests[key]
+        request.set_result(token_response.access_token)
         return token_response.access_token
 
+    def invalidate_sim_swap_camara_token(self, number: str, scope: str) -> None:
+        """Remove a cached SIM Swap access token, e.g. after it's been rejected.
+
+        Args:
+            number (str): The phone number the token is for.
+            scope (str): The scope of the token.
+        """
+        with self._token_lock:
+            self._tokens.pop((self._ensure_plus_prefix(number), scope), None)
+
+    def clear_token_cache(self) -> None:
+        """Remove every cached access token."""
+        with self._token_lock:
+            self._tokens.clear()
+
     @validate_call
     def make_oidc_auth_id_request(self, number: str, scope: str) -> OidcResponse:
         """Make an OIDC request for an authentication ID. The auth ID is then used to
@@ -151,6 +227,31 @@ class NetworkAuth:
         )
         return TokenResponse(**response)
 
+    def _request_sim_swap_token(
+        self, number: str, scope: str, hooks: _TokenHooks
+    ) -> TokenResponse:
+        before_authorize, before_token = hooks
+        if before_authorize is not None:
+            before_authorize()
+        oidc_response = self.make_oidc_auth_id_request(number, scope)
+        if before_token is not None:
+            before_token()
+        return self.request_sim_swap_access_token(oidc_response.auth_req_id)
+
+    def _cache_token(self, key: tuple[str, str], token_response: TokenResponse) -> None:
+        # Called with the token lock held
+        now = monotonic()
+        self._tokens[key] = (
+            token_response.access_token,
+            now + token_response.expires_in - TOKEN_EXPIRY_MARGIN,
+        )
+        self._tokens.move_to_end(key)
+        if len(self._tokens) > self._max_cached_tokens:
+            for expired_key in [k for k, v in self._tokens.items() if v[1] <= now]:
+                del self._tokens[expired_key]
+        while len(self._tokens) > self._max_cached_tokens:
+            self._tokens.popitem(last=False)
+
     def _ensure_plus_prefix(self, number: str) -> str:
         """Ensure that the number has a plus prefix.
 
@@ -1,11 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath
+from threading import Event
+from time import sleep
 
 import responses
 from pytest import raises
 from vonage_http_client.errors import HttpRequestError
 from vonage_http_client.http_client import HttpClient
 from vonage_network_auth import NetworkAuth
-from vonage_network_auth.responses import OidcResponse
+from vonage_network_auth.responses import OidcResponse, TokenResponse
 
 from testutils import build_response, get_mock_jwt_auth
 
@@ -141,3 +144,127 @@ def test_get_number_verification_camara_token():
         token
         == 'eyJhbGciOiJSUzI1NiIsImprdSI6Imh0dHBzOi8vYW51YmlzLWNlcnRzLWMxLWV1dzEucHJvZC52MS52b25hZ2VuZXR3b3Jrcy5uZXQvandrcyIsImtpZCI6IkNOPVZvbmFnZSAxdmFwaWd3IEludGVybmFsIENBOjoxOTUxODQ2ODA3NDg1NTYwNjYzODY3MTM0NjE2MjU2MTU5MjU2NDkiLCJ0eXAiOiJKV1QiLCJ4NXUiOiJodHRwczovL2FudWJpcy1jZXJ0cy1jMS1ldXcxLnByb2QudjEudm9uYWdlbmV0d29ya3MubmV0L3YxL2NlcnRzLzA4NjliNDMyZTEzZmIyMzcwZTk2ZGI4YmUxMDc4MjJkIn0.eyJwcmluY2lwYWwiOnsiYXBpS2V5IjoiNGI1MmMwMGUiLCJhcHBsaWNhdGlvbklkIjoiMmJlZTViZWQtNmZlZS00ZjM2LTkxNmQtNWUzYjRjZDI1MjQzIiwibWFzdGVyQWNjb3VudElkIjoiNGI1MmMwMGUiLCJjYXBhYmlsaXRpZXMiOlsibmV0d29yay1hcGktZmVhdHVyZXMiXSwiZXh0cmFDb25maWciOnsiY2FtYXJhU3RhdGUiOiJmb0ZyQndnOFNmeGMydnd2S1o5Y3UrMlgrT0s1K2FvOWhJTTVGUGZMQ1dOeUlMTHR3WmY1dFRKbDdUc1p4QnY4QWx3aHM2bFNWcGVvVkhoWngvM3hUenFRWVkwcHpIZE5XL085ZEdRN1RKOE9sU1lDdTFYYXFEcnNFbEF4WEJVcUpGdnZTTkp5a1A5ZDBYWVN4ajZFd0F6UUFsNGluQjE1c3VMRFNsKy82U1FDa29Udnpld0tvcFRZb0F5MVg2dDJVWXdEVWFDNjZuOS9kVWxIemN3V0NGK3QwOGNReGxZVUxKZyt3T0hwV2xvWGx1MGc3REx0SCtHd0pvRGJoYnMyT2hVY3BobGZqajBpeHQ1OTRsSG5sQ1NYNkZrMmhvWEhKUW01S3JtOVBKSmttK0xTRjVsRTd3NUxtWTRvYTFXSGpkY0dwV1VsQlNQY000YnprOGU0bVE9PSJ9fSwiZmVkZXJhdGVkQXNzZXJ0aW9ucyI6e30sImF1ZCI6ImFwaS1ldS52b25hZ2UuY29tIiwiZXhwIjoxNzE3MDkyODY4LCJqdGkiOiJmNDZhYTViOC1hODA2LTRjMzctODQyMS02OGYwMzJjNDlhMWYiLCJpYXQiOjE3MTcwOTE5NzAsImlzcyI6IlZJQU0tSUFQIiwibmJmIjoxNzE3MDkxOTU1fQ.iLUbyDPR1HGLKh29fy6fqK65Q1O7mjWOletAEPJD4eu7gb0E85EL4M9R7ckJq5lIvgedQt3vBheTaON9_u-VYjMqo8ulPoEoGUDHbOzNbs4MmCW0_CRdDPGyxnUhvcbuJhPgnEHxmfHjJBljncUnk-Z7XCgyNajBNXeQQnHkRF_6NMngxJ-qjjhqbYL0VsF_JS7-TXxixNL0KAFl0SeN2DjkfwRBCclP-69CTExDjyOvouAcchqi-6ZYj_tXPCrTADuzUrQrW8C5nHp2-XjWJSFKzyvi48n8V1U6KseV-eYzBzvy7bJf0tRMX7G6gctTYq3DxdC_eXvXlnp1zx16mg'
     )
+
+
+@responses.activate
+def test_sim_swap_token_cached():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()))
+    scope = 'dpv:FraudPreventionAndDetection#check-sim-swap'
+
+    token = auth.get_sim_swap_camara_token('447700900000', scope)
+    assert auth.get_sim_swap_camara_token('+447700900000', scope) == token
+    assert len(responses.calls) == 2
+
+    auth.get_sim_swap_camara_token('447700900001', scope)
+    assert len(responses.calls) == 4
+
+    auth.invalidate_sim_swap_camara_token('447700900000', scope)
+    auth.get_sim_swap_camara_token('447700900000', scope)
+    assert len(responses.calls) == 6
+
+
+@responses.activate
+def test_sim_swap_token_hooks():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()))
+    scope = 'dpv:FraudPreventionAndDetection#check-sim-swap'
+    calls = []
+
+    def before_authorize():
+        calls.append(('authorize', len(responses.calls)))
+
+    def before_token():
+        calls.append(('token', len(responses.calls)))
+
+    for _ in range(2):
+        auth._get_sim_swap_camara_token(
+            '447700900000', scope, (before_authorize, before_token)
+        )
+    assert calls == [('authorize', 0), ('token', 1)]
+
+
+@responses.activate
+def test_sim_swap_token_expires(monkeypatch):
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    now = [1000.0]
+    monkeypatch.setattr('vonage_network_auth.network_auth.monotonic', lambda: now[0])
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()))
+    scope = 'dpv:FraudPreventionAndDetection#check-sim-swap'
+
+    auth.get_sim_swap_camara_token('447700900000', scope)
+    # The token expires in 29 seconds, so it's refreshed 5 seconds early
+    now[0] += 23
+    auth.get_sim_swap_camara_token('447700900000', scope)
+    assert len(responses.calls) == 2
+    now[0] += 1
+    auth.get_sim_swap_camara_token('447700900000', scope)
+    assert len(responses.calls) == 4
+
+
+def test_sim_swap_token_single_flight(monkeypatch):
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()))
+    started, release = Event(), Event()
+    requests = []
+
+    def request_token(number, scope, *hooks):
+        requests.append(number)
+        started.set()
+        release.wait(5)
+        return TokenResponse(access_token=f'token-{len(requests)}', expires_in=60)
+
+    monkeypatch.setattr(auth, '_request_sim_swap_token', request_token)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(auth.get_sim_swap_camara_token, '447700900000', 'scope')
+        started.wait(5)
+        others = [
+            executor.submit(auth.get_sim_swap_camara_token, '447700900000', 'scope')
+            for _ in range(3)
+        ]
+        sleep(0.05)
+        release.set()
+        tokens = {first.result(), *(future.result() for future in others)}
+
+    assert tokens == {'token-1'}
+    assert len(requests) == 1
+
+
+def test_sim_swap_token_single_flight_error(monkeypatch):
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()))
+
+    def request_token(number, scope, *hooks):
+        raise ConnectionError('Connection refused')
+
+    monkeypatch.setattr(auth, '_request_sim_swap_token', request_token)
+    with raises(ConnectionError):
+        auth.get_sim_swap_camara_token('447700900000', 'scope')
+    assert auth._token_requests == {}
+
+
+@responses.activate
+def test_sim_swap_token_cache_disabled():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    auth = NetworkAuth(HttpClient(get_mock_jwt_auth()), max_cached_tokens=0)
+    auth.get_sim_swap_camara_token('447700900000', 'scope')
+    auth.get_sim_swap_camara_token('447700900000', 'scope')
+    assert len(responses.calls) == 4
@@ -5,11 +5,11 @@ class SwapStatus(BaseModel):
     """Model for the status of a SIM swap.
 
     Args:
-        swapped (str): Indicates whether the SIM card has been swapped during the period
+        swapped (bool): Indicates whether the SIM card has been swapped during the period
             within the `max_age` provided in the request.
     """
 
-    swapped: str
+    swapped: bool
 
 
 class LastSwapDate(BaseModel):
@@ -1,20 +1,48 @@
-from pydantic import validate_call
-from vonage_http_client import HttpClient
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from time import monotonic
+from typing import Annotated, Iterable, Iterator, NamedTuple, Optional, Union
+
+from pydantic import Field, validate_call
+from vonage_http_client import AuthenticationError, HttpClient
+from vonage_http_client.rate_limiter import RateLimiter
 from vonage_network_auth import NetworkAuth
 from vonage_network_sim_swap.requests import SimSwapCheckRequest
+from vonage_utils.errors import VonageError
 
 from .responses import LastSwapDate, SwapStatus
 
+CHECK_SCOPE = 'dpv:FraudPreventionAndDetection#check-sim-swap'
+
+# Results of checks are cached by phone number and `max_age`
+_ResultKey = tuple[str, Optional[int]]
+
+
+class _StageRateLimiters(NamedTuple):
+    authorize: Optional[RateLimiter] = None
+    token: Optional[RateLimiter] = None
+    check: Optional[RateLimiter] = None
+
 
 class NetworkSimSwap:
-    """Class containing methods for working with the Vonage SIM Swap Network API."""
+    """Class containing methods for working with the Vonage SIM Swap Network API.
+
+    Args:
+        http_client (HttpClient): The HTTP client used to make requests.
+        max_cached_results (int, optional): The maximum number of `check_many` results
+            cached. Set to 0 to disable caching.
+    """
 
-    def __init__(self, http_client: HttpClient):
+    def __init__(self, http_client: HttpClient, max_cached_results: int = 10000):
         self._http_client = http_client
         self._host = 'api-eu.vonage.com'
 
         self._auth_type = 'oauth2'
         self._network_auth = NetworkAuth(self._http_client)
+        self._max_cached_results = max_cached_results
+        self._results: OrderedDict[_ResultKey, tuple[SwapStatus, float]] = OrderedDict()
+        self._results_lock = Lock()
 
     @property
     def http_client(self) -> HttpClient:
@@ -36,19 +64,68 @@ class NetworkSimSwap:
         Returns:
             SwapStatus: Class containing the Swap Status response.
         """
-        token = self._network_auth.get_sim_swap_camara_token(
-            number=sim_swap_request.phone_number,
-            scope='dpv:FraudPreventionAndDetection#check-sim-swap',
+        return self._post_with_token(
+            '/camara/sim-swap/v040/check',
+            sim_swap_request.model_dump(by_alias=True, exclude_none=True),
+            sim_swap_request.phone_number,
+            CHECK_SCOPE,
         )
 
-        return self._http_client.post(
-            self._host,
-            '/camara/sim-swap/v040/check',
-            params=sim_swap_request.model_dump(by_alias=True, exclude_none=True),
-            auth_type=self._auth_type,
-            token=token,
+    @validate_call
+    def check_many(
+        self,
+        sim_swap_requests: Iterable[SimSwapCheckRequest],
+        concurrency: Annotated[int, Field(ge=1)] = 8,
+        max_authorizations_per_second: Optional[Annotated[float, Field(gt=0)]] = None,
+        max_tokens_per_second: Optional[Annotated[float, Field(gt=0)]] = None,
+        max_checks_per_second: Optional[Annotated[float, Field(gt=0)]] = None,
+        cache_ttl: Annotated[float, Field(ge=0)] = 60,
+    ) -> Iterator[tuple[SimSwapCheckRequest, Union[SwapStatus, VonageError]]]:
+        """Check many numbers for SIM swaps, making requests concurrently.
+
+        Each check needs an authorization request, a token request and the check itself.
+        Numbers are checked by a pool of workers, so the authorization and token
+        requests for some numbers are made while others are being checked. Access tokens
+        are reused while they're valid, and results are yielded as soon as each check
+        completes, so they may not be in the order of `sim_swap_requests`.
+
+        Results are cached for `cache_ttl` seconds by phone number and `max_age`, and
+        requests for the same number and `max_age` in a batch share one check.
+
+        Args:
+            sim_swap_requests (Iterable[SimSwapCheckRequest]): The checks to make.
+            concurrency (int, optional): The maximum number of numbers being checked at
+                once.
+            max_authorizations_per_second (float, optional): A maximum rate for
+                authorization requests.
+            max_tokens_per_second (float, optional): A maximum rate for token requests.
+            max_checks_per_second (float, optional): A maximum rate for SIM swap checks.
+            cache_ttl (float, optional): The number of seconds a result can be reused
+                for. Set to 0 to always make a new check.
+
+        Yields:
+            tuple[SimSwapCheckRequest, SwapStatus | VonageError]: Each request, with its
+                result or the error raised for it.
+        """
+        rate_limiters = _StageRateLimiters(
+            *(
+                RateLimiter(rate) if rate is not None else None
+                for rate in (
+                    max_authorizations_per_second,
+                    max_tokens_per_second,
+                    max_checks_per_second,
+                )
+            )
+        )
+        return self._check_many(
+            list(sim_swap_requests), concurrency, rate_limiters, cache_ttl
         )
 
+    def clear_result_cache(self) -> None:
+        """Remove every cached `check_many` result."""
+        with self._results_lock:
+            self._results.clear()
+
     @validate_call
     def get_last_swap_date(self, phone_number: str) -> LastSwapDate:
         """Get the last SIM swap date for a phone number.
@@ -60,14 +137,114 @@ class NetworkSimSwap:
         Returns:
             LastSwapDate: Class containing the Last Swap Date response.
         """
-        token = self._network_auth.get_sim_swap_camara_token(
-            number=phone_number,
-            scope='dpv:FraudPreventionAndDetection#retrieve-sim-swap-date',
-        )
-        return self._http_client.post(
-            self._host,
+        return self._post_with_token(
             '/camara/sim-swap/v040/retrieve-date',
-            params={'phoneNumber': phone_number},
-            auth_type=self._auth_type,
-            token=token,
+            {'phoneNumber': phone_number},
+            phone_number,
+            'dpv:FraudPreventionAndDetection#retrieve-sim-swap-date',
+        )
+
+    def _check_many(
+        self,
+        sim_swap_requests: list[SimSwapCheckRequest],
+        concurrency: int,
+        rate_limiters: _StageRateLimiters,
+        cache_ttl: float,
+    ) -> Iterator[tuple[SimSwapCheckRequest, Union[SwapStatus, VonageError]]]:
+        def check(
+            sim_swap_request: SimSwapCheckRequest,
+        ) -> Union[SwapStatus, VonageError]:
+            try:
+                response = self._post_with_token(
+                    '/camara/sim-swap/v040/check',
+                    sim_swap_request.model_dump(by_alias=True, exclude_none=True),
+                    sim_swap_request.phone_number,
+                    CHECK_SCOPE,
+                    rate_limiters,
+                )
+            except VonageError as err:
+                return err
+            return SwapStatus(**response)
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            # Requests waiting on each check, by the key its result is cached under
+            in_progress: dict[Future, list[SimSwapCheckRequest]] = {}
+            checks: dict[_ResultKey, Future] = {}
+            queued = iter(sim_swap_requests)
+            while True:
+                # Keep a bounded number of checks queued, so results don't pile up
+                for sim_swap_request in queued:
+                    key = self._result_key(sim_swap_request)
+                    cached = self._cached_result(key, cache_ttl)
+                    if cached is not None:
+                        yield sim_swap_request, cached
+                    elif key in checks:
+                        in_progress[checks[key]].append(sim_swap_request)
+                    else:
+                        future = executor.submit(check, sim_swap_request)
+                        checks[key] = future
+                        in_progress[future] = [sim_swap_request]
+                        if len(in_progress) >= concurrency * 2:
+                            break
+                if not in_progress:
+                    return
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    waiting = in_progress.pop(future)
+                    key = self._result_key(waiting[0])
+                    del checks[key]
+                    result = future.result()
+                    if isinstance(result, SwapStatus) and cache_ttl:
+                        self._cache_result(key, result)
+                    for sim_swap_request in waiting:
+                        yield sim_swap_request, result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _result_key(self, sim_swap_request: SimSwapCheckRequest) -> _ResultKey:
+        return sim_swap_request.phone_number.lstrip('+'), sim_swap_request.max_age
+
+    def _cached_result(self, key: _ResultKey, cache_ttl: float) -> Optional[SwapStatus]:
+        if not cache_ttl:
+            return None
+        with self._results_lock:
+            cached = self._results.get(key)
+            if cached is None or monotonic() - cached[1] >= cache_ttl:
+                return None
+            return cached[0].model_copy()
+
+    def _cache_result(self, key: _ResultKey, result: SwapStatus) -> None:
+        if not self._max_cached_results:
+            return
+        with self._results_lock:
+            self._results[key] = (result, monotonic())
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_cached_results:
+                self._results.popitem(last=False)
+
+    def _post_with_token(
+        self,
+        request_path: str,
+        params: dict,
+        number: str,
+        scope: str,
+        rate_limiters: _StageRateLimiters = _StageRateLimiters(),
+    ):
+        hooks = tuple(
+            limiter.acquire if limiter is not None else None
+            for limiter in (rate_limiters.authorize, rate_limiters.token)
         )
+        for attempt in range(2):
+            token = self._network_auth._get_sim_swap_camara_token(number, scope, hooks)
+            if rate_limiters.check is not None:
+                rate_limiters.check.acquire()
+            try:
+                return self._http_client.post(
+                    self._host, request_path, params, self._auth_type, token=token
+                )
+            except AuthenticationError:
+                if attempt:
+                    raise
+                # A cached token may have been revoked, so get a new one and retry once
+                self._network_auth.invalidate_sim_swap_camara_token(number, scope)
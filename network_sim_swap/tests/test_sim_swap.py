@@ -1,9 +1,13 @@
+import json
 from os.path import abspath
+from time import monotonic
+from urllib.parse import parse_qs
 from unittest.mock import MagicMock, patch
 
 import responses
+from vonage_http_client.errors import ServerError
 from vonage_http_client.http_client import HttpClient
-from vonage_network_sim_swap import NetworkSimSwap
+from vonage_network_sim_swap import NetworkSimSwap, SwapStatus
 from vonage_network_sim_swap.requests import SimSwapCheckRequest
 
 from testutils import build_response, get_mock_jwt_auth
@@ -18,7 +22,7 @@ def test_http_client_property():
     assert isinstance(http_client, HttpClient)
 
 
-@patch('vonage_network_auth.NetworkAuth.get_sim_swap_camara_token')
+@patch('vonage_network_auth.NetworkAuth._get_sim_swap_camara_token')
 @responses.activate
 def test_check_sim_swap(mock_get_oauth2_user_token: MagicMock):
     build_response(
@@ -36,7 +40,7 @@ def test_check_sim_swap(mock_get_oauth2_user_token: MagicMock):
     assert response['swapped'] == True
 
 
-@patch('vonage_network_auth.NetworkAuth.get_sim_swap_camara_token')
+@patch('vonage_network_auth.NetworkAuth._get_sim_swap_camara_token')
 @responses.activate
 def test_get_last_swap_date(mock_get_oauth2_user_token: MagicMock):
     build_response(
@@ -50,3 +54,207 @@ def test_get_last_swap_date(mock_get_oauth2_user_token: MagicMock):
     response = sim_swap.get_last_swap_date('447700900000')
 
     assert response['latestSimChange'] == '2023-12-22T04:00:44.000Z'
+
+
+@responses.activate
+def test_check_sim_swap_reuses_token():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    build_response(
+        path,
+        'POST',
+        'https://api-eu.vonage.com/camara/sim-swap/v040/check',
+        'check_sim_swap.json',
+    )
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+
+    for _ in range(3):
+        sim_swap.check(SimSwapCheckRequest(phone_number='447700900000', max_age=24))
+
+    assert len(responses.calls) == 5
+    assert [call.request.url.rsplit('/', 1)[-1] for call in responses.calls] == [
+        'bc-authorize',
+        'token',
+        'check',
+        'check',
+        'check',
+    ]
+
+
+@responses.activate
+def test_check_sim_swap_rejected_token_refreshed():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    responses.add(
+        responses.POST,
+        'https://api-eu.vonage.com/camara/sim-swap/v040/check',
+        status=401,
+        json={'title': 'Unauthorized'},
+    )
+    build_response(
+        path,
+        'POST',
+        'https://api-eu.vonage.com/camara/sim-swap/v040/check',
+        'check_sim_swap.json',
+    )
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+
+    response = sim_swap.check(SimSwapCheckRequest(phone_number='447700900000'))
+    assert response['swapped'] == True
+    assert len(responses.calls) == 6
+
+
+def add_check_many_responses():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    build_response(
+        path,
+        'POST',
+        'https://api-eu.vonage.com/camara/sim-swap/v040/check',
+        'check_sim_swap.json',
+    )
+
+
+def request_paths():
+    return [call.request.url.rsplit('/', 1)[-1] for call in responses.calls]
+
+
+@responses.activate
+def test_check_many():
+    add_check_many_responses()
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+    requests = [
+        SimSwapCheckRequest(phone_number=f'44770090000{i}', max_age=24) for i in range(5)
+    ]
+
+    results = list(sim_swap.check_many(requests, concurrency=3))
+
+    assert sorted(request.phone_number for request, _ in results) == sorted(
+        request.phone_number for request in requests
+    )
+    assert all(isinstance(status, SwapStatus) for _, status in results)
+    assert all(status.swapped is True for _, status in results)
+    assert sorted(request_paths()) == ['bc-authorize'] * 5 + ['check'] * 5 + ['token'] * 5
+
+
+@responses.activate
+def test_check_many_uses_each_numbers_token():
+    checks = []
+
+    def form(request) -> dict:
+        return {key: values[0] for key, values in parse_qs(request.body).items()}
+
+    def authorize(request):
+        number = form(request)['login_hint'].lstrip('+')
+        return 200, {}, json.dumps({'auth_req_id': number, 'expires_in': 300})
+
+    def token(request):
+        access_token = f'token-{form(request)["auth_req_id"]}'
+        return 200, {}, json.dumps({'access_token': access_token, 'expires_in': 300})
+
+    def check(request):
+        number = json.loads(request.body)['phoneNumber'].lstrip('+')
+        checks.append((number, request.headers['Authorization']))
+        return 200, {}, json.dumps({'swapped': False})
+
+    base_url = 'https://api-eu.vonage.com'
+    responses.add_callback(responses.POST, f'{base_url}/oauth2/bc-authorize', authorize)
+    responses.add_callback(responses.POST, f'{base_url}/oauth2/token', token)
+    responses.add_callback(
+        responses.POST, f'{base_url}/camara/sim-swap/v040/check', check
+    )
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+    requests = [
+        SimSwapCheckRequest(phone_number=f'4477009{i:05d}', max_age=24) for i in range(60)
+    ]
+
+    results = list(
+        sim_swap.check_many(requests, concurrency=8, max_checks_per_second=1000)
+    )
+
+    assert len(results) == 60
+    assert len(checks) == 60
+    for number, authorization in checks:
+        assert authorization == f'Bearer token-{number}'
+
+
+@responses.activate
+def test_check_many_caches_results():
+    add_check_many_responses()
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+    requests = [
+        SimSwapCheckRequest(phone_number='447700900000', max_age=24),
+        SimSwapCheckRequest(phone_number='+447700900000', max_age=24),
+        SimSwapCheckRequest(phone_number='447700900000', max_age=12),
+    ]
+
+    results = list(sim_swap.check_many(requests))
+    assert len(results) == 3
+    assert request_paths().count('check') == 2
+
+    list(sim_swap.check_many(requests))
+    assert request_paths().count('check') == 2
+
+    list(sim_swap.check_many(requests, cache_ttl=0))
+    assert request_paths().count('check') == 4
+    assert request_paths().count('bc-authorize') == 1
+
+    sim_swap.clear_result_cache()
+    list(sim_swap.check_many(requests[:1]))
+    assert request_paths().count('check') == 5
+
+
+@responses.activate
+def test_check_many_rate_limited():
+    add_check_many_responses()
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+    requests = [SimSwapCheckRequest(phone_number=f'44770090000{i}') for i in range(3)]
+
+    start = monotonic()
+    results = list(
+        sim_swap.check_many(
+            requests,
+            max_authorizations_per_second=1000,
+            max_tokens_per_second=1000,
+            max_checks_per_second=20,
+        )
+    )
+
+    assert len(results) == 3
+    assert monotonic() - start >= 0.09
+
+
+@responses.activate
+def test_check_many_error():
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/bc-authorize', 'oidc_request.json'
+    )
+    build_response(
+        path, 'POST', 'https://api-eu.vonage.com/oauth2/token', 'token_request.json'
+    )
+    responses.add(
+        responses.POST,
+        'https://api-eu.vonage.com/camara/sim-swap/v040/check',
+        status=500,
+        json={'title': 'Internal Server Error'},
+    )
+    sim_swap = NetworkSimSwap(HttpClient(get_mock_jwt_auth()))
+
+    [(request, result)] = sim_swap.check_many(
+        [SimSwapCheckRequest(phone_number='447700900000')]
+    )
+    assert request.phone_number == '447700900000'
+    assert isinstance(result, ServerError)
+    assert sim_swap._results == {}
@@ -1,4 +1,6 @@
 from . import errors
+from .cache import DEFAULT_TTLS, InsightCache, InsightLevel
+from .correlator import AsyncInsightCorrelator, parse_async_insight_callback
 from .number_insight import NumberInsight
 from .requests import (
     AdvancedAsyncInsightRequest,
@@ -18,6 +20,11 @@ from .responses import (
 
 __all__ = [
     'NumberInsight',
+    'InsightCache',
+    'AsyncInsightCorrelator',
+    'parse_async_insight_callback',
+    'InsightLevel',
+    'DEFAULT_TTLS',
     'BasicInsightRequest',
     'StandardInsightRequest',
     'AdvancedAsyncInsightRequest',
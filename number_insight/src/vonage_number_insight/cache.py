@@ -0,0 +1,178 @@
+import os
+import sqlite3
+from collections import OrderedDict
+from threading import Lock
+from time import time
+from typing import Literal, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+InsightLevel = Literal['basic', 'standard', 'advanced']
+"""The level of a Number Insight lookup."""
+
+DEFAULT_TTLS: dict[InsightLevel, float] = {
+    'basic': 30 * 86400,
+    'standard': 86400,
+    'advanced': 3600,
+}
+"""The default number of seconds results are cached for at each level. Basic results
+rarely change, carrier and porting data in standard results can change daily, and the
+roaming and reachability data in advanced results goes stale quickly."""
+
+ResponseT = TypeVar('ResponseT', bound=BaseModel)
+
+
+class InsightCache:
+    """A cache of Number Insight results, keyed by insight level and request options.
+
+    Results are held in an in-memory LRU cache, and optionally in a SQLite database that
+    processes on the same host can share. Each level has its own time-to-live, and results
+    are never returned once it has passed, whichever store they come from.
+
+    Args:
+        path (str, optional): The path of a SQLite database file to store results in. If
+            not set, results are only cached in memory.
+        ttls (dict[InsightLevel, float], optional): The number of seconds to cache
+            results for at each level. Levels not set use the value in `DEFAULT_TTLS`, and
+            a TTL of 0 disables caching for a level.
+        max_memory_entries (int, optional): The maximum number of results held in memory.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttls: Optional[dict[InsightLevel, float]] = None,
+        max_memory_entries: int = 10000,
+    ):
+        self._path = path
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, tuple[float, BaseModel]] = OrderedDict()
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def get(
+        self, level: InsightLevel, options: BaseModel, response_type: Type[ResponseT]
+    ) -> Optional[ResponseT]:
+        """Gets a cached result.
+
+        Args:
+            level (InsightLevel): The insight level.
+            options (BaseModel): The request options.
+            response_type (Type[BaseModel]): The model of the response.
+
+        Returns:
+            BaseModel: A copy of the cached response, or None if there's no result for the
+                options that's still within its TTL.
+        """
+        if not self._ttls[level]:
+            return None
+        key = _cache_key(level, options)
+        now = time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    return response.model_copy(deep=True)
+                del self._memory[key]
+
+            if self._path is None:
+                return None
+            row = (
+                self._db()
+                .execute(
+                    'SELECT expires_at, response FROM insights WHERE key = ?', (key,)
+                )
+                .fetchone()
+            )
+            if row is None or row[0] <= now:
+                return None
+            response = response_type.model_validate_json(row[1])
+            self._remember(key, row[0], response)
+            return response.model_copy(deep=True)
+
+    def set(self, level: InsightLevel, options: BaseModel, response: BaseModel) -> None:
+        """Caches a result for the level's TTL.
+
+        Args:
+            level (InsightLevel): The insight level.
+            options (BaseModel): The request options.
+            response (BaseModel): The response to cache.
+        """
+        ttl = self._ttls[level]
+        if not ttl:
+            return
+        key = _cache_key(level, options)
+        expires_at = time() + ttl
+        with self._lock:
+            self._remember(key, expires_at, response.model_copy(deep=True))
+            if self._path is not None:
+                with self._db() as connection:
+                    connection.execute(
+                        'INSERT OR REPLACE INTO insights (key, expires_at, response) '
+                        'VALUES (?, ?, ?)',
+                        (key, expires_at, response.model_dump_json(exclude_none=True)),
+                    )
+
+    def purge_expired(self) -> int:
+        """Removes expired results from memory and from the database.
+
+        Returns:
+            int: The number of results removed from the database, or from memory if there
+                is no database.
+        """
+        now = time()
+        with self._lock:
+            expired = [
+                key for key, (expires_at, _) in self._memory.items() if expires_at <= now
+            ]
+            for key in expired:
+                del self._memory[key]
+            if self._path is None:
+                return len(expired)
+            with self._db() as connection:
+                return connection.execute(
+                    'DELETE FROM insights WHERE expires_at <= ?', (now,)
+                ).rowcount
+
+    def clear(self) -> None:
+        """Removes every result from memory and from the database."""
+        with self._lock:
+            self._memory.clear()
+            if self._path is not None:
+                with self._db() as connection:
+                    connection.execute('DELETE FROM insights')
+
+    def close(self) -> None:
+        """Closes the connection to the database. It's reopened if the cache is used
+        again."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _remember(self, key: str, expires_at: float, response: BaseModel) -> None:
+        self._memory[key] = (expires_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _db(self) -> sqlite3.Connection:
+        # SQLite connections can't be used across a fork, so each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=30, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS insights '
+                '(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, response TEXT NOT NULL)'
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+
+def _cache_key(level: InsightLevel, options: BaseModel) -> str:
+    return f'{level}:{options.model_dump_json(exclude_none=True)}'
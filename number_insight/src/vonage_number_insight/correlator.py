@@ -0,0 +1,254 @@
+import json
+from collections import OrderedDict
+from concurrent.futures import Future
+from heapq import heapify, heappop, heappush
+from threading import Lock, Timer, current_thread
+from time import monotonic
+from typing import TYPE_CHECKING, Optional, Union
+
+from .errors import AsyncInsightTimeoutError, NumberInsightError
+from .requests import AdvancedAsyncInsightRequest
+from .responses import AdvancedSyncInsightResponse
+
+if TYPE_CHECKING:
+    from .number_insight import NumberInsight
+
+
+def parse_async_insight_callback(
+    payload: Union[bytes, str, dict],
+) -> AdvancedSyncInsightResponse:
+    """Parses the body of an asynchronous Advanced Number Insight callback.
+
+    Args:
+        payload (bytes | str | dict): The JSON body sent to your callback URL, or the
+            dict it decodes to.
+
+    Returns:
+        AdvancedSyncInsightResponse: The advanced insight result.
+
+    Raises:
+        NumberInsightError: If the payload isn't valid JSON or has no `request_id`.
+    """
+    if isinstance(payload, (bytes, str)):
+        try:
+            payload = json.loads(payload)
+        except ValueError as err:
+            raise NumberInsightError(
+                'The Number Insight callback body is not valid JSON.'
+            ) from err
+    if not isinstance(payload, dict) or not payload.get('request_id'):
+        raise NumberInsightError('The Number Insight callback has no "request_id".')
+    return AdvancedSyncInsightResponse(**payload)
+
+
+class AsyncInsightCorrelator:
+    """Matches the results of asynchronous Advanced Number Insight requests, which arrive
+    at your callback URL, to the requests that were made.
+
+    Each request is registered with a future, which is resolved with the result when its
+    callback is handled, or fails with an `AsyncInsightTimeoutError` if no callback
+    arrives in time. No thread waits on each pending request: a single timer thread is
+    armed for the earliest deadline, so requests expire even if the correlator isn't used
+    again. Timeouts are also checked whenever the correlator is used, or by calling
+    `expire`. Call `close` to stop the timer when the correlator is no longer needed.
+
+    Args:
+        number_insight (NumberInsight): Used to make the requests.
+        timeout (float, optional): The number of seconds to wait for a callback.
+        max_pending (int, optional): The maximum number of requests that can be waiting
+            for a callback. Also bounds the number of unmatched callbacks kept, e.g. those
+            that arrive before their request is registered.
+    """
+
+    def __init__(
+        self,
+        number_insight: 'NumberInsight',
+        timeout: float = 300,
+        max_pending: int = 10000,
+    ):
+        self._number_insight = number_insight
+        self._timeout = timeout
+        self._max_pending = max_pending
+        self._pending: dict[str, Future] = {}
+        self._deadlines: list[tuple[float, str]] = []
+        self._unmatched: OrderedDict[str, AdvancedSyncInsightResponse] = OrderedDict()
+        self._timer: Optional[Timer] = None
+        self._timer_deadline = 0.0
+        self._closed = False
+        self._lock = Lock()
+
+    @property
+    def pending(self) -> int:
+        """The number of requests waiting for a callback."""
+        return len(self._pending)
+
+    def submit(self, options: AdvancedAsyncInsightRequest) -> Future:
+        """Makes an asynchronous Advanced Number Insight request and registers it.
+
+        Args:
+            options (AdvancedAsyncInsightRequest): The options for the request. The
+                `callback` URL must lead to a handler that calls `handle_callback`.
+
+        Returns:
+            Future: Resolved with an `AdvancedSyncInsightResponse` when the result
+                arrives.
+
+        Raises:
+            NumberInsightError: If the request fails, or too many requests are pending.
+        """
+        self.expire()
+        if len(self._pending) >= self._max_pending:
+            raise self._too_many_pending()
+        response = self._number_insight.get_advanced_info_async(options)
+        return self.register(response.request_id)
+
+    def register(self, request_id: str, timeout: Optional[float] = None) -> Future:
+        """Registers a request that was made with `get_advanced_info_async`. Registering
+        a request that is already pending returns its existing future.
+
+        Args:
+            request_id (str): The `request_id` of the request.
+            timeout (float, optional): The number of seconds to wait for the callback.
+                Defaults to the correlator's timeout.
+
+        Returns:
+            Future: Resolved with an `AdvancedSyncInsightResponse` when the result
+                arrives.
+
+        Raises:
+            NumberInsightError: If too many requests are pending.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        expired = self._expire()
+        full = False
+        with self._lock:
+            result = None
+            if request_id in self._pending:
+                future = self._pending[request_id]
+            elif request_id in self._unmatched:
+                result = self._unmatched.pop(request_id)
+            elif len(self._pending) >= self._max_pending:
+                full = True
+            else:
+                if len(self._deadlines) >= 2 * self._max_pending:
+                    # Drop the deadlines of requests that have already been resolved
+                    self._deadlines = [
+                        entry for entry in self._deadlines if entry[1] in self._pending
+                    ]
+                    heapify(self._deadlines)
+                if timeout is None:
+                    timeout = self._timeout
+                self._pending[request_id] = future
+                heappush(self._deadlines, (monotonic() + timeout, request_id))
+                self._schedule()
+        self._fail(expired)
+        if full:
+            raise self._too_many_pending()
+        if result is not None:
+            future.set_result(result)
+        return future
+
+    def handle_callback(self, payload: Union[bytes, str, dict]) -> bool:
+        """Resolves the future of the request a callback is for.
+
+        Call this from the handler for your callback URL with the request body.
+        Callbacks that arrive before their request is registered are kept until it is.
+
+        Args:
+            payload (bytes | str | dict): The JSON body of the callback, or the dict it
+                decodes to.
+
+        Returns:
+            bool: Whether the callback matched a pending request.
+
+        Raises:
+            NumberInsightError: If the payload isn't a valid callback.
+        """
+        result = parse_async_insight_callback(payload)
+        expired = self._expire()
+        with self._lock:
+            future = self._pending.pop(result.request_id, None)
+            if future is None:
+                self._unmatched[result.request_id] = result
+                while len(self._unmatched) > self._max_pending:
+                    self._unmatched.popitem(last=False)
+        self._fail(expired)
+        if future is None:
+            return False
+        if not future.done():
+            future.set_result(result)
+        return True
+
+    def expire(self) -> int:
+        """Fails the futures of requests whose callback hasn't arrived in time.
+
+        Returns:
+            int: The number of requests that expired.
+        """
+        expired = self._expire()
+        self._fail(expired)
+        return len(expired)
+
+    def close(self) -> None:
+        """Stops the timer that expires pending requests. Requests still expire when the
+        correlator is used, or when `expire` is called."""
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule(self) -> None:
+        # Arms the timer for the earliest deadline of a pending request. Call with the
+        # lock held.
+        if self._closed:
+            return
+        while self._deadlines and self._deadlines[0][1] not in self._pending:
+            heappop(self._deadlines)
+        if not self._deadlines:
+            return
+        deadline = self._deadlines[0][0]
+        if self._timer is not None:
+            if self._timer_deadline <= deadline:
+                return
+            self._timer.cancel()
+        self._timer = Timer(max(deadline - monotonic(), 0), self._on_timer)
+        self._timer.daemon = True
+        self._timer_deadline = deadline
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._timer is current_thread():
+                self._timer = None
+        self.expire()
+        with self._lock:
+            self._schedule()
+
+    def _expire(self) -> list[tuple[str, Future]]:
+        now = monotonic()
+        expired = []
+        with self._lock:
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, request_id = heappop(self._deadlines)
+                future = self._pending.pop(request_id, None)
+                if future is not None:
+                    expired.append((request_id, future))
+        return expired
+
+    def _too_many_pending(self) -> NumberInsightError:
+        return NumberInsightError(
+            'Too many Number Insight requests are waiting for a callback. The limit is '
+            f'{self._max_pending}.'
+        )
+
+    def _fail(self, expired: list[tuple[str, Future]]) -> None:
+        for request_id, future in expired:
+            if not future.done():
+                future.set_exception(
+                    AsyncInsightTimeoutError(
+                        'No Number Insight callback was received for request '
+                        f'"{request_id}".'
+                    )
+                )
@@ -3,3 +3,8 @@ from vonage_utils.errors import VonageError
 
 class NumberInsightError(VonageError):
     """Indicates an error when using the Vonage Number Insight API."""
+
+
+class AsyncInsightTimeoutError(NumberInsightError):
+    """Indicates that the callback for an asynchronous Advanced Number Insight request
+    wasn't received in time."""
@@ -1,8 +1,14 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from logging import getLogger
+from typing import Annotated, Iterable, Iterator, Literal, Optional, Union
 
-from pydantic import validate_call
+from pydantic import Field, validate_call
 from vonage_http_client.http_client import HttpClient
+from vonage_http_client.rate_limiter import RateLimiter
+from vonage_utils.errors import InvalidPhoneNumberError, VonageError
+from vonage_utils.utils import PhoneNumberErrorCode, format_phone_numbers
 
+from .cache import InsightCache
 from .errors import NumberInsightError
 from .requests import (
     AdvancedAsyncInsightRequest,
@@ -19,13 +25,26 @@ from .responses import (
 
 logger = getLogger('vonage_number_insight')
 
+InsightResponse = Union[
+    BasicInsightResponse, StandardInsightResponse, AdvancedSyncInsightResponse
+]
+
 
 class NumberInsight:
-    """Calls Vonage's Number Insight API."""
+    """Calls Vonage's Number Insight API.
+
+    Args:
+        http_client (HttpClient): The HTTP client used to make requests.
+        cache (InsightCache, optional): A cache for the results of basic, standard and
+            synchronous advanced lookups.
+    """
 
-    def __init__(self, http_client: HttpClient) -> None:
+    def __init__(
+        self, http_client: HttpClient, cache: Optional[InsightCache] = None
+    ) -> None:
         self._http_client = http_client
         self._auth_type = 'basic'
+        self._cache = cache
 
     @property
     def http_client(self) -> HttpClient:
@@ -36,6 +55,20 @@ class NumberInsight:
         """
         return self._http_client
 
+    @property
+    def cache(self) -> Optional[InsightCache]:
+        """The cache used for the results of basic, standard and synchronous advanced
+        lookups, or None if results aren't cached.
+
+        Returns:
+            InsightCache: The cache.
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: Optional[InsightCache]) -> None:
+        self._cache = cache
+
     @validate_call
     def get_basic_info(self, options: BasicInsightRequest) -> BasicInsightResponse:
         """Get basic number insight information about a phone number.
@@ -48,6 +81,11 @@ class NumberInsight:
             BasicInsightResponse: The response object containing the basic number insight
                 information about the phone number.
         """
+        if self._cache is not None:
+            cached = self._cache.get('basic', options, BasicInsightResponse)
+            if cached is not None:
+                return cached
+
         response = self._http_client.get(
             self._http_client.api_host,
             '/ni/basic/json',
@@ -56,7 +94,10 @@ class NumberInsight:
         )
         self._check_for_error(response)
 
-        return BasicInsightResponse(**response)
+        insight = BasicInsightResponse(**response)
+        if self._cache is not None and insight.status == 0:
+            self._cache.set('basic', options, insight)
+        return insight
 
     @validate_call
     def get_standard_info(
@@ -72,6 +113,11 @@ class NumberInsight:
             StandardInsightResponse: The response object containing the standard number insight
                 information about the phone number.
         """
+        if self._cache is not None:
+            cached = self._cache.get('standard', options, StandardInsightResponse)
+            if cached is not None:
+                return cached
+
         response = self._http_client.get(
             self._http_client.api_host,
             '/ni/standard/json',
@@ -80,7 +126,10 @@ class NumberInsight:
         )
         self._check_for_error(response)
 
-        return StandardInsightResponse(**response)
+        insight = StandardInsightResponse(**response)
+        if self._cache is not None and insight.status == 0:
+            self._cache.set('standard', options, insight)
+        return insight
 
     @validate_call
     def get_advanced_info_async(
@@ -121,6 +170,11 @@ class NumberInsight:
             AdvancedSyncInsightResponse: The response object containing the advanced number insight
                 information about the phone number.
         """
+        if self._cache is not None:
+            cached = self._cache.get('advanced', options, AdvancedSyncInsightResponse)
+            if cached is not None:
+                return cached
+
         response = self._http_client.get(
             self._http_client.api_host,
             '/ni/advanced/json',
@@ -129,7 +183,122 @@ class NumberInsight:
         )
         self._check_for_error(response)
 
-        return AdvancedSyncInsightResponse(**response)
+        insight = AdvancedSyncInsightResponse(**response)
+        if self._cache is not None and insight.status == 0:
+            self._cache.set('advanced', options, insight)
+        return insight
+
+    @validate_call
+    def lookup_many(
+        self,
+        numbers: Iterable[Union[str, int]],
+        level: Literal['basic', 'standard', 'advanced'] = 'standard',
+        concurrency: Annotated[int, Field(ge=1)] = 8,
+        max_requests_per_second: Optional[Annotated[float, Field(gt=0)]] = 30,
+        country: Optional[str] = None,
+        cnam: Optional[bool] = None,
+    ) -> Iterator[tuple[str, Union[InsightResponse, VonageError]]]:
+        """Get number insight information about many phone numbers, making requests
+        concurrently.
+
+        Numbers are formatted and deduplicated first: each distinct number is looked up
+        and yielded once, however many times it appears in `numbers`, so there can be
+        fewer results than numbers. Invalid numbers are reported without making a
+        request. Requests share the HTTP client's connection pool and rate limit, and
+        results are yielded as soon as each request completes, so they may not be in the
+        order of `numbers`. Results come from the cache, if one is set.
+
+        Args:
+            numbers (Iterable[str | int]): The phone numbers to look up.
+            level (str, optional): The insight level: 'basic', 'standard' or 'advanced'
+                (synchronous).
+            concurrency (int, optional): The maximum number of requests in progress at
+                once.
+            max_requests_per_second (float, optional): A maximum rate for these lookups,
+                in addition to any rate limit set on the HTTP client. Defaults to 30,
+                the default rate limit of a Vonage account. Set to None to only use the
+                HTTP client's rate limit.
+            country (str, optional): The country code to use for numbers that aren't in
+                international format.
+            cnam (bool, optional): Whether to include the Caller ID Name (CNAM) with
+                standard and advanced results. Not valid for basic lookups.
+
+        Yields:
+            tuple[str, InsightResponse | VonageError]: Each number, formatted if valid,
+                with its result or the error raised for it. Invalid numbers have an
+                `InvalidPhoneNumberError`, and API errors are `NumberInsightError` or
+                `HttpRequestError` objects.
+
+        Raises:
+            NumberInsightError: If `cnam` is set for basic lookups.
+        """
+        if level == 'basic' and cnam is not None:
+            raise NumberInsightError('The "cnam" option is not valid for basic lookups.')
+        return self._lookup_many(
+            list(numbers), level, concurrency, max_requests_per_second, country, cnam
+        )
+
+    def _lookup_many(
+        self,
+        numbers: list[Union[str, int]],
+        level: str,
+        concurrency: int,
+        max_requests_per_second: Optional[float],
+        country: Optional[str],
+        cnam: Optional[bool],
+    ) -> Iterator[tuple[str, Union[InsightResponse, VonageError]]]:
+        formatted = format_phone_numbers(numbers, deduplicate=True)
+        lookup, request_type = {
+            'basic': (self.get_basic_info, BasicInsightRequest),
+            'standard': (self.get_standard_info, StandardInsightRequest),
+            'advanced': (self.get_advanced_info_sync, AdvancedSyncInsightRequest),
+        }[level]
+        options = {'country': country}
+        if level != 'basic':
+            options['cnam'] = cnam
+        rate_limiter = (
+            RateLimiter(max_requests_per_second)
+            if max_requests_per_second is not None
+            else None
+        )
+
+        def look_up(number: str) -> Union[InsightResponse, VonageError]:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                return lookup(request_type(number=number, **options))
+            except VonageError as err:
+                return err
+
+        pending_numbers = []
+        for number, formatted_number, error in zip(
+            numbers, formatted.numbers, formatted.errors
+        ):
+            if formatted_number is not None:
+                pending_numbers.append(formatted_number)
+            elif error != PhoneNumberErrorCode.DUPLICATE:
+                yield str(number), InvalidPhoneNumberError(
+                    f'Invalid phone number provided. You provided: "{number}". '
+                    f'Reason: {error.value}.'
+                )
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            in_progress = {}
+            queued = iter(pending_numbers)
+            while True:
+                # Keep a bounded number of requests queued, so results don't pile up
+                for number in queued:
+                    in_progress[executor.submit(look_up, number)] = number
+                    if len(in_progress) >= concurrency * 2:
+                        break
+                if not in_progress:
+                    return
+                done, _ = wait(in_progress, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_progress.pop(future), future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _check_for_error(self, response: dict) -> None:
         """Check for an error in the response from the Number Insight API.
@@ -0,0 +1,133 @@
+import json
+from os.path import abspath
+
+import responses
+from pytest import raises
+from vonage_http_client.http_client import HttpClient
+from vonage_number_insight.correlator import (
+    AsyncInsightCorrelator,
+    parse_async_insight_callback,
+)
+from vonage_number_insight.errors import AsyncInsightTimeoutError, NumberInsightError
+from vonage_number_insight.number_insight import NumberInsight
+from vonage_number_insight.requests import AdvancedAsyncInsightRequest
+
+from testutils import build_response, get_mock_api_key_auth
+
+path = abspath(__file__)
+
+number_insight = NumberInsight(HttpClient(get_mock_api_key_auth()))
+
+REQUEST_ID = '434205b5-90ec-4ee2-a337-7b40d9683420'
+
+
+def callback_body(request_id: str = REQUEST_ID) -> bytes:
+    return json.dumps(
+        {
+            'request_id': request_id,
+            'status': 0,
+            'status_message': 'Success',
+            'international_format_number': '447700900000',
+            'reachable': 'reachable',
+            'valid_number': 'valid',
+            'roaming': {'status': 'not_roaming'},
+        }
+    ).encode()
+
+
+@responses.activate
+def test_submit_and_handle_callback():
+    build_response(
+        path,
+        'GET',
+        'https://api.nexmo.com/ni/advanced/async/json',
+        'advanced_async_insight.json',
+    )
+    correlator = AsyncInsightCorrelator(number_insight)
+    future = correlator.submit(
+        AdvancedAsyncInsightRequest(
+            callback='https://example.com/callback', number='447700900000'
+        )
+    )
+    assert correlator.pending == 1
+    assert not future.done()
+
+    assert correlator.handle_callback(callback_body()) is True
+    result = future.result(timeout=0)
+    assert result.request_id == REQUEST_ID
+    assert result.reachable == 'reachable'
+    assert result.roaming.status == 'not_roaming'
+    assert correlator.pending == 0
+
+
+def test_callback_before_register():
+    correlator = AsyncInsightCorrelator(number_insight)
+    assert correlator.handle_callback(json.loads(callback_body())) is False
+
+    future = correlator.register(REQUEST_ID)
+    assert future.result(timeout=0).international_format_number == '447700900000'
+    assert correlator.pending == 0
+
+
+def test_register_timeout():
+    correlator = AsyncInsightCorrelator(number_insight, timeout=0)
+    # Stop the timer, so the request only expires when `expire` is called
+    correlator.close()
+    future = correlator.register(REQUEST_ID)
+    assert correlator.expire() == 1
+    with raises(AsyncInsightTimeoutError) as e:
+        future.result(timeout=0)
+    assert e.match(REQUEST_ID)
+
+    # A late callback is kept in case the request is registered again
+    assert correlator.handle_callback(callback_body()) is False
+
+
+def test_register_pending_request_again():
+    correlator = AsyncInsightCorrelator(number_insight)
+    correlator.close()
+    future = correlator.register(REQUEST_ID)
+    assert correlator.register(REQUEST_ID) is future
+    assert correlator.pending == 1
+
+    assert correlator.handle_callback(callback_body()) is True
+    assert future.result(timeout=0).request_id == REQUEST_ID
+
+
+def test_timer_expires_idle_requests():
+    correlator = AsyncInsightCorrelator(number_insight, timeout=0.01)
+    future = correlator.register(REQUEST_ID)
+    later = correlator.register('request-2', timeout=60)
+
+    # The correlator isn't used again, but the request still expires
+    assert isinstance(future.exception(timeout=5), AsyncInsightTimeoutError)
+    assert correlator.pending == 1
+    assert not later.done()
+    correlator.close()
+
+
+def test_max_pending():
+    correlator = AsyncInsightCorrelator(number_insight, max_pending=2)
+    correlator.register('request-1')
+    correlator.register('request-2')
+    with raises(NumberInsightError) as e:
+        correlator.register('request-3')
+    assert e.match('The limit is 2')
+
+    correlator.handle_callback(callback_body('request-1'))
+    correlator.register('request-3')
+    assert correlator.pending == 2
+
+    for i in range(5):
+        correlator.handle_callback(callback_body(f'unmatched-{i}'))
+    assert len(correlator._unmatched) == 2
+
+
+def test_parse_async_insight_callback_errors():
+    with raises(NumberInsightError) as e:
+        parse_async_insight_callback(b'not json')
+    assert e.match('not valid JSON')
+
+    with raises(NumberInsightError) as e:
+        parse_async_insight_callback({'status': 0})
+    assert e.match('request_id')
@@ -0,0 +1,150 @@
+from os.path import abspath
+
+import responses
+from pytest import raises
+from vonage_http_client.http_client import HttpClient
+from vonage_number_insight.cache import InsightCache
+from vonage_number_insight.errors import NumberInsightError
+from vonage_number_insight.number_insight import NumberInsight
+from vonage_number_insight.requests import (
+    AdvancedSyncInsightRequest,
+    BasicInsightRequest,
+    StandardInsightRequest,
+)
+from vonage_number_insight.responses import StandardInsightResponse
+
+from testutils import build_response, get_mock_api_key_auth
+
+path = abspath(__file__)
+
+
+def build_number_insight(cache: InsightCache) -> NumberInsight:
+    return NumberInsight(HttpClient(get_mock_api_key_auth()), cache=cache)
+
+
+@responses.activate
+def test_cached_basic_info():
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/basic/json', 'basic_insight.json'
+    )
+    number_insight = build_number_insight(InsightCache())
+    options = BasicInsightRequest(number='12345678900')
+
+    first = number_insight.get_basic_info(options)
+    second = number_insight.get_basic_info(BasicInsightRequest(number='12345678900'))
+    assert len(responses.calls) == 1
+    assert second == first
+    assert second is not first
+
+    number_insight.get_basic_info(BasicInsightRequest(number='12345678900', country='US'))
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_keyed_by_level():
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/basic/json', 'basic_insight.json'
+    )
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/standard/json', 'standard_insight.json'
+    )
+    number_insight = build_number_insight(InsightCache())
+
+    number_insight.get_basic_info(BasicInsightRequest(number='12345678900'))
+    response = number_insight.get_standard_info(
+        StandardInsightRequest(number='12345678900')
+    )
+    assert len(responses.calls) == 2
+    assert isinstance(response, StandardInsightResponse)
+
+
+@responses.activate
+def test_cache_errors_not_cached():
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/basic/json', 'basic_insight_error.json'
+    )
+    cache = InsightCache()
+    number_insight = build_number_insight(cache)
+    for _ in range(2):
+        with raises(NumberInsightError):
+            number_insight.get_basic_info(BasicInsightRequest(number='1234567'))
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_expired_results_not_served(monkeypatch):
+    responses.add(
+        responses.GET,
+        'https://api.nexmo.com/ni/advanced/json',
+        json={'status': 0, 'status_message': 'Success', 'reachable': 'reachable'},
+    )
+    now = [1000000.0]
+    monkeypatch.setattr('vonage_number_insight.cache.time', lambda: now[0])
+    number_insight = build_number_insight(InsightCache(ttls={'advanced': 60}))
+    options = AdvancedSyncInsightRequest(number='12345678900')
+
+    number_insight.get_advanced_info_sync(options)
+    now[0] += 59
+    number_insight.get_advanced_info_sync(options)
+    assert len(responses.calls) == 1
+
+    now[0] += 1
+    number_insight.get_advanced_info_sync(options)
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_cache_disabled_for_level():
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/basic/json', 'basic_insight.json'
+    )
+    number_insight = build_number_insight(InsightCache(ttls={'basic': 0}))
+    number_insight.get_basic_info(BasicInsightRequest(number='12345678900'))
+    number_insight.get_basic_info(BasicInsightRequest(number='12345678900'))
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_persistent_cache_shared(tmp_path, monkeypatch):
+    build_response(
+        path, 'GET', 'https://api.nexmo.com/ni/standard/json', 'standard_insight.json'
+    )
+    now = [1000000.0]
+    monkeypatch.setattr('vonage_number_insight.cache.time', lambda: now[0])
+    db_path = str(tmp_path / 'insights.db')
+    options = StandardInsightRequest(number='12345678900', cnam=True)
+
+    first = build_number_insight(InsightCache(db_path)).get_standard_info(options)
+    second = build_number_insight(InsightCache(db_path)).get_standard_info(options)
+    assert len(responses.calls) == 1
+    assert second == first
+
+    now[0] += 86400
+    expired_cache = InsightCache(db_path)
+    assert expired_cache.get('standard', options, StandardInsightResponse) is None
+    assert expired_cache.purge_expired() == 1
+    expired_cache.close()
+
+
+def test_cache_lru_eviction():
+    cache = InsightCache(max_memory_entries=2)
+    response = StandardInsightResponse(status=0)
+    for number in ('1234567', '2345678', '3456789'):
+        cache.set('standard', StandardInsightRequest(number=number), response)
+    first, last = (
+        StandardInsightRequest(number='1234567'),
+        StandardInsightRequest(number='3456789'),
+    )
+    assert cache.get('standard', first, StandardInsightResponse) is None
+    assert cache.get('standard', last, StandardInsightResponse) == response
+
+    cache.clear()
+    assert cache.get('standard', last, StandardInsightResponse) is None
+
+
+def test_number_insight_cache_property():
+    number_insight = NumberInsight(HttpClient(get_mock_api_key_auth()))
+    assert number_insight.cache is None
+    cache = InsightCache()
+    number_insight.cache = cache
+    assert number_insight.cache is cache
@@ -1,9 +1,15 @@
+import json
 from os.path import abspath
+from time import monotonic
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
 import responses
+from pydantic import ValidationError
 from pytest import raises
 from vonage_http_client.http_client import HttpClient
 from vonage_number_insight.errors import NumberInsightError
+from vonage_http_client.rate_limiter import RateLimiter
 from vonage_number_insight.number_insight import NumberInsight
 from vonage_number_insight.requests import (
     AdvancedAsyncInsightRequest,
@@ -11,6 +17,7 @@ from vonage_number_insight.requests import (
     BasicInsightRequest,
     StandardInsightRequest,
 )
+from vonage_utils.errors import InvalidPhoneNumberError
 
 from testutils import build_response, get_mock_api_key_auth
 
@@ -157,3 +164,68 @@ def test_advanced_sync_insight(caplog):
     assert response.roaming == 'unknown'
     assert response.status_message == 'Lookup Handler unable to handle request'
     assert response.valid_number == 'valid'
+
+
+def standard_insight_callback(request):
+    number = parse_qs(urlparse(request.url).query)['number'][0]
+    if number == '447700900999':
+        body = {'status': 3, 'status_message': 'Invalid request'}
+    else:
+        body = {'status': 0, 'international_format_number': number, 'cnam': None}
+    return 200, {'Content-Type': 'application/json'}, json.dumps(body)
+
+
+@responses.activate
+def test_lookup_many():
+    responses.add_callback(
+        responses.GET,
+        'https://api.nexmo.com/ni/standard/json',
+        callback=standard_insight_callback,
+    )
+    numbers = [f'+44 7700 900{i:03d}' for i in range(20)]
+    numbers += ['447700900001', 'not a number', '123', 447700900999]
+
+    with patch(
+        'vonage_number_insight.number_insight.RateLimiter', wraps=RateLimiter
+    ) as mock_rate_limiter:
+        results = list(number_insight.lookup_many(numbers, concurrency=4))
+
+    # Requests are paced to the account's default rate limit
+    mock_rate_limiter.assert_called_once_with(30)
+    assert len(responses.calls) == 21
+    # The repeated number is only yielded once
+    assert [number for number, _ in results].count('447700900001') == 1
+    assert len(results) == 23
+    results = dict(results)
+    assert results['447700900005'].international_format_number == '447700900005'
+    assert isinstance(results['not a number'], InvalidPhoneNumberError)
+    assert isinstance(results['123'], InvalidPhoneNumberError)
+    assert isinstance(results['447700900999'], NumberInsightError)
+
+
+@responses.activate
+def test_lookup_many_basic_rate_limited():
+    build_response(
+        path,
+        'GET',
+        'https://api.nexmo.com/ni/basic/json',
+        'basic_insight.json',
+    )
+    start = monotonic()
+    results = list(
+        number_insight.lookup_many(
+            ['12345678900', '12345678901', '12345678902'],
+            level='basic',
+            max_requests_per_second=20,
+        )
+    )
+    assert monotonic() - start >= 0.09
+    assert [response.status for _, response in results] == [0, 0, 0]
+    assert 'cnam' not in responses.calls[0].request.url
+
+
+def test_lookup_many_invalid_options():
+    with raises(NumberInsightError):
+        number_insight.lookup_many(['12345678900'], level='basic', cnam=True)
+    with raises(ValidationError):
+        number_insight.lookup_many(['12345678900'], concurrency=0)
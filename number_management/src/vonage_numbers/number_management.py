@@ -3,6 +3,7 @@ from typing import Optional
 from pydantic import validate_call
 from vonage_http_client.http_client import HttpClient
 from vonage_numbers.errors import NumbersError
+from vonage_utils.response_modes import ResponseMode, build_models
 
 from .requests import (
     ListOwnedNumbersFilter,
@@ -32,7 +33,9 @@ class Numbers:
 
     @validate_call
     def list_owned_numbers(
-        self, filter: ListOwnedNumbersFilter = ListOwnedNumbersFilter()
+        self,
+        filter: ListOwnedNumbersFilter = ListOwnedNumbersFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[OwnedNumber], int, Optional[int]]:
         """List numbers you own.
 
@@ -41,6 +44,8 @@ class Numbers:
 
         Args:
             filter (ListOwnedNumbersFilter): The filter object.
+            response_mode (ResponseMode, optional): How the numbers are returned: 'model'
+                (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[OwnedNumber], int, Optional[int]]: A tuple containing a
@@ -59,10 +64,8 @@ class Numbers:
         index = filter.index or 1
         page_size = filter.size
 
-        numbers = []
         try:
-            for number in response['numbers']:
-                numbers.append(OwnedNumber(**number))
+            numbers = build_models(response['numbers'], OwnedNumber, response_mode)
         except KeyError:
             return [], 0, None
 
@@ -12,6 +12,7 @@ from vonage_numbers.requests import (
     SearchAvailableNumbersFilter,
     UpdateNumberParams,
 )
+from vonage_utils import LazyModelList
 
 from testutils import build_response, get_mock_api_key_auth
 
@@ -54,6 +55,22 @@ def test_list_owned_numbers_basic():
     assert next_page is None
 
 
+@responses.activate
+def test_list_owned_numbers_lazy():
+    build_response(
+        path,
+        'GET',
+        'https://rest.nexmo.com/account/numbers',
+        'list_owned_numbers_basic.json',
+    )
+    numbers_list, count, next_page = numbers.list_owned_numbers(response_mode='lazy')
+
+    assert isinstance(numbers_list, LazyModelList)
+    assert numbers_list[1].features == ['VOICE', 'SMS']
+    assert count == 2
+    assert next_page is None
+
+
 @responses.activate
 def test_list_owned_numbers_with_filter():
     build_response(
@@ -1 +1 @@
-__version__ = '1.1.6'
+__version__ = '1.2.0'
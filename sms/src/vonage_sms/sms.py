@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 
 from pydantic import validate_call
 from vonage_http_client.http_client import HttpClient
+from vonage_http_client.trusted import validate_call_unless_trusted
 
 from .errors import PartialFailureError, SmsError
 from .requests import SmsMessage
@@ -36,7 +37,7 @@ class Sms:
         """
         return self._http_client
 
-    @validate_call
+    @validate_call_unless_trusted
     def send(self, message: SmsMessage) -> SmsResponse:
         """Send an SMS message.
 
@@ -15,6 +15,7 @@ from vonage_subaccounts.responses import (
     Transfer,
     TransferNumberResponse,
 )
+from vonage_utils.response_modes import ResponseMode, build_models
 
 
 class Subaccounts:
@@ -153,7 +154,9 @@ class Subaccounts:
 
         return Subaccount(**response)
 
-    def list_balance_transfers(self, filter: ListTransfersFilter) -> list[Transfer]:
+    def list_balance_transfers(
+        self, filter: ListTransfersFilter, response_mode: ResponseMode = 'model'
+    ) -> list[Transfer]:
         """List all balance transfers.
 
         Args:
@@ -161,6 +164,8 @@ class Subaccounts:
                 - start_date (str, required)
                 - end_date (str)
                 - subaccount (str): Show balance transfers relating to this subaccount.
+            response_mode (ResponseMode, optional): How the transfers are returned:
+                'model' (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             list[Transfer]: A list of balance transfers. Each balance transfer contains the following attributes:
@@ -178,10 +183,9 @@ class Subaccounts:
             auth_type=self._auth_type,
         )
 
-        return [
-            Transfer(**transfer)
-            for transfer in response['_embedded']['balance_transfers']
-        ]
+        return build_models(
+            response['_embedded']['balance_transfers'], Transfer, response_mode
+        )
 
     def transfer_balance(self, params: TransferRequest) -> Transfer:
         """Transfer balance between subaccounts.
@@ -211,7 +215,9 @@ class Subaccounts:
 
         return Transfer(**response)
 
-    def list_credit_transfers(self, filter: ListTransfersFilter) -> list[Transfer]:
+    def list_credit_transfers(
+        self, filter: ListTransfersFilter, response_mode: ResponseMode = 'model'
+    ) -> list[Transfer]:
         """List all credit transfers.
 
         Args:
@@ -219,6 +225,8 @@ class Subaccounts:
                 - start_date (str, required)
                 - end_date (str)
                 - subaccount (str): Show credit transfers relating to this subaccount.
+            response_mode (ResponseMode, optional): How the transfers are returned:
+                'model' (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             list[Transfer]: A list of credit transfers. Each credit transfer contains the following attributes:
@@ -236,9 +244,9 @@ class Subaccounts:
             auth_type=self._auth_type,
         )
 
-        return [
-            Transfer(**transfer) for transfer in response['_embedded']['credit_transfers']
-        ]
+        return build_models(
+            response['_embedded']['credit_transfers'], Transfer, response_mode
+        )
 
     @validate_call
     def transfer_credit(self, params: TransferRequest) -> Transfer:
@@ -11,7 +11,9 @@ from vonage_subaccounts.requests import (
     TransferNumberRequest,
     TransferRequest,
 )
+from vonage_subaccounts.responses import Transfer
 from vonage_subaccounts.subaccounts import Subaccounts
+from vonage_utils import CompactRecord
 
 from testutils import build_response, get_mock_api_key_auth
 
@@ -133,6 +135,34 @@ def test_list_balance_transfers():
     assert response[1].created_at == '2023-12-22T19:40:36.000Z'
 
 
+@responses.activate
+def test_list_balance_transfers_compact():
+    build_response(
+        path,
+        'GET',
+        'https://api.nexmo.com/accounts/test_api_key/balance-transfers',
+        'list_balance_transfers.json',
+    )
+
+    response = subaccounts.list_balance_transfers(
+        ListTransfersFilter(start_date='2023-08-07T10:50:44Z'), response_mode='compact'
+    )
+
+    assert len(response) == 2
+    assert isinstance(response[0], CompactRecord)
+    assert not hasattr(response[0], '__dict__')
+    assert response[0].amount == 0.01
+    assert response[1].from_ == 'test_api_key'
+    assert response[1].to_model() == Transfer(
+        id=response[1].id,
+        amount=response[1].amount,
+        to='asdfqwer',
+        created_at='2023-12-22T19:40:36.000Z',
+        reference=response[1].reference,
+        **{'from': 'test_api_key'},
+    )
+
+
 @responses.activate
 def test_transfer_balance():
     build_response(
@@ -3,6 +3,7 @@ from urllib.parse import parse_qs, urlparse
 
 from pydantic import validate_call
 from vonage_http_client.http_client import HttpClient
+from vonage_utils.response_modes import ResponseMode, build_models, detach_items
 
 from .common import User
 from .requests import ListUsersFilter
@@ -31,7 +32,9 @@ class Users:
 
     @validate_call
     def list_users(
-        self, filter: ListUsersFilter = ListUsersFilter()
+        self,
+        filter: ListUsersFilter = ListUsersFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[UserSummary], Optional[str]]:
         """List all users.
 
@@ -42,6 +45,8 @@ class Users:
         Args:
             params (ListUsersFilter, optional): An instance of the `ListUsersFilter`
                 class that allows you to specify additional parameters for the user listing.
+            response_mode (ResponseMode, optional): How the users are returned: 'model'
+                (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[UserSummary], Optional[str]]: A tuple containing a list of `UserSummary`
@@ -55,14 +60,21 @@ class Users:
             self._auth_type,
         )
 
-        users_response = ListUsersResponse(**response)
+        if response_mode == 'model':
+            users_response = ListUsersResponse(**response)
+            users = users_response.embedded.users
+        else:
+            items = detach_items(response, '_embedded', 'users')
+            users_response = ListUsersResponse(**response)
+            users = build_models(items, UserSummary, response_mode)
+
         if users_response.links.next is None:
-            return users_response.embedded.users, None
+            return users, None
 
         parsed_url = urlparse(users_response.links.next.href)
         query_params = parse_qs(parsed_url.query)
         next_cursor = query_params.get('cursor', [None])[0]
-        return users_response.embedded.users, next_cursor
+        return users, next_cursor
 
     @validate_call
     def create_user(self, params: Optional[User] = None) -> User:
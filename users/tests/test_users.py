@@ -6,6 +6,7 @@ from vonage_http_client.http_client import HttpClient
 from vonage_users import Users
 from vonage_users.common import *
 from vonage_users.requests import ListUsersFilter
+from vonage_utils import LazyModelList
 
 from testutils import build_response, get_mock_jwt_auth
 
@@ -46,6 +47,19 @@ def test_list_users():
     )
 
 
+@responses.activate
+def test_list_users_lazy_and_raw():
+    build_response(path, 'GET', 'https://api.nexmo.com/v1/users', 'list_users.json')
+    users_list, _ = users.list_users(response_mode='lazy')
+    assert isinstance(users_list, LazyModelList)
+    assert len(users_list) == 7
+    assert users_list[3].display_name == 'My User Name'
+
+    build_response(path, 'GET', 'https://api.nexmo.com/v1/users', 'list_users.json')
+    users_list, _ = users.list_users(response_mode='raw')
+    assert users_list[3]['name'] == 'my_user_name'
+
+
 @responses.activate
 def test_list_users_options():
     build_response(
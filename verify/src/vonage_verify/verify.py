@@ -1,5 +1,7 @@
 from pydantic import validate_call
+from pydantic_core import to_json
 from vonage_http_client.http_client import HttpClient
+from vonage_http_client.trusted import validate_call_unless_trusted
 
 from .requests import VerifyRequest
 from .responses import CheckCodeResponse, StartVerificationResponse
@@ -24,7 +26,7 @@ class Verify:
         """
         return self._http_client
 
-    @validate_call
+    @validate_call_unless_trusted
     def start_verification(
         self, verify_request: VerifyRequest
     ) -> StartVerificationResponse:
@@ -40,7 +42,7 @@ class Verify:
         response = self._http_client.post(
             self._http_client.api_host,
             '/v2/verify',
-            verify_request.model_dump(by_alias=True, exclude_none=True),
+            to_json(verify_request, by_alias=True, exclude_none=True),
             self._auth_type,
         )
 
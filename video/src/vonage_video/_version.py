@@ -1 +1 @@
-__version__ = '1.5.1'
+__version__ = '1.6.0'
@@ -3,6 +3,7 @@ from typing import Optional, Type, Union
 from pydantic import validate_call
 from vonage_http_client.errors import HttpRequestError
 from vonage_http_client.http_client import HttpClient
+from vonage_utils.response_modes import ResponseMode, build_models
 from vonage_utils.types import Dtmf
 from vonage_video.errors import (
     InvalidArchiveStateError,
@@ -305,12 +306,17 @@ class Video:
 
     @validate_call
     def list_experience_composers(
-        self, filter: ListExperienceComposersFilter = ListExperienceComposersFilter()
+        self,
+        filter: ListExperienceComposersFilter = ListExperienceComposersFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[ExperienceComposer], int, Optional[int]]:
         """Lists Experience Composers associated with your Vonage application.
 
         Args:
             filter (ListExperienceComposersFilter, Optional): Filter for the Experience Composers.
+            response_mode (ResponseMode, optional): How the Experience Composers are
+                returned: 'model' (the default), 'lazy', 'raw' or 'compact'. See
+                `ResponseMode`.
 
         Returns:
             tuple[list[ExperienceComposer], int, Optional[int]]: A tuple containing a list of experience
@@ -325,7 +331,9 @@ class Video:
             filter.model_dump(exclude_none=True, by_alias=True),
         )
 
-        return self._list_video_objects(filter, response, ExperienceComposer)
+        return self._list_video_objects(
+            filter, response, ExperienceComposer, response_mode
+        )
 
     @validate_call
     def get_experience_composer(self, experience_composer_id: str) -> ExperienceComposer:
@@ -358,12 +366,16 @@ class Video:
 
     @validate_call
     def list_archives(
-        self, filter: ListArchivesFilter = ListArchivesFilter()
+        self,
+        filter: ListArchivesFilter = ListArchivesFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[Archive], int, Optional[int]]:
         """Lists archives associated with a Vonage Application.
 
         Args:
             filter (ListArchivesFilter, Optional): The filters for the archives.
+            response_mode (ResponseMode, optional): How the archives are returned: 'model'
+                (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[Archive], int, Optional[int]]: A tuple containing a list of archive objects,
@@ -377,7 +389,7 @@ class Video:
             filter.model_dump(exclude_none=True, by_alias=True),
         )
 
-        return self._list_video_objects(filter, response, Archive)
+        return self._list_video_objects(filter, response, Archive, response_mode)
 
     @validate_call
     def start_archive(self, options: CreateArchiveRequest) -> Archive:
@@ -513,12 +525,16 @@ class Video:
 
     @validate_call
     def list_broadcasts(
-        self, filter: ListBroadcastsFilter = ListBroadcastsFilter()
+        self,
+        filter: ListBroadcastsFilter = ListBroadcastsFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[Broadcast], int, Optional[int]]:
         """Lists broadcasts associated with a Vonage Application.
 
         Args:
             filter (ListBroadcastsFilter, Optional): The filters for the broadcasts.
+            response_mode (ResponseMode, optional): How the broadcasts are returned:
+                'model' (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[Broadcast], int, Optional[int]]: A tuple containing a list of broadcast objects,
@@ -533,7 +549,7 @@ class Video:
             filter.model_dump(exclude_none=True, by_alias=True),
         )
 
-        return self._list_video_objects(filter, response, Broadcast)
+        return self._list_video_objects(filter, response, Broadcast, response_mode)
 
     @validate_call
     def start_broadcast(self, options: CreateBroadcastRequest) -> Broadcast:
@@ -708,6 +724,7 @@ class Video:
         ],
         response: dict,
         model: Union[Type[Archive], Type[Broadcast], Type[ExperienceComposer]],
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[object], int, Optional[int]]:
         """List objects of a specific model from a response.
 
@@ -717,6 +734,8 @@ class Video:
             response (dict): The response from the API.
             model (Union[Type[Archive], Type[Broadcast], Type[ExperienceComposer]]): The type of a pydantic
                 model to populate the response into.
+            response_mode (ResponseMode, optional): How the objects are returned: 'model'
+                (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[object], int, Optional[int]]: A tuple containing a list of objects,
@@ -726,11 +745,9 @@ class Video:
         """
         index = 1 if request_filter is not None else request_filter.offset + 1
         page_size = request_filter.page_size
-        objects = []
 
         try:
-            for obj in response['items']:
-                objects.append(model(**obj))
+            objects = build_models(response['items'], model, response_mode)
         except KeyError:
             return [], 0, None
 
@@ -241,6 +241,22 @@ def test_list_archives():
         assert archives[1].max_bitrate == 2_000_000
 
 
+@responses.activate
+def test_list_archives_raw():
+    build_response(
+        path,
+        'GET',
+        'https://video.api.vonage.com/v2/project/test_application_id/archive',
+        'list_archives.json',
+    )
+
+    archives, count, next_page = video.list_archives(response_mode='raw')
+
+    assert count == 2
+    assert next_page is None
+    assert archives[0]['id'] == '5b1521e6-115f-4efd-bed9-e527b87f0699'
+
+
 @responses.activate
 def test_start_archive():
     build_response(
@@ -0,0 +1,131 @@
+"""Load-tests `AudioSocketServer` with synthetic calls on the local machine.
+
+Each call connects like the Voice API does, sends its metadata, then streams a 640-byte
+frame of 16kHz audio every 20ms. The server runs in a separate process and echoes every
+frame back into its call, paced at the same rate. Frames carry the time they were sent,
+so the server can measure how long each took to reach its handler.
+
+Run with: `python voice/benchmarks/bench_audio_socket.py [calls] [seconds]`
+"""
+
+import asyncio
+import json
+import sys
+from multiprocessing import Process, Queue
+from os import urandom
+from struct import pack, unpack_from
+from time import perf_counter
+
+from vonage_voice.audio_socket import (
+    AudioCall,
+    AudioSocketServer,
+    _encode_frame,
+    _read_frame,
+)
+
+FRAME_SIZE = 640
+FRAME_DURATION = 0.02
+
+HANDSHAKE = (
+    b'GET /socket HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n'
+    b'Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+    b'Sec-WebSocket-Version: 13\r\n\r\n'
+)
+METADATA = json.dumps(
+    {'event': 'websocket:connected', 'content-type': 'audio/l16;rate=16000'}
+).encode()
+
+
+async def echo_handler(call: AudioCall, results: dict) -> None:
+    async for frame in call:
+        results['latencies'].append(perf_counter() - unpack_from('d', frame)[0])
+        results['frames_received'] += 1
+        call.send_audio(frame)
+    results['frames_dropped'] += call.frames_dropped
+    results['calls'] += 1
+
+
+def run_server(calls: int, ports: Queue, summaries: Queue) -> None:
+    async def serve():
+        results = {'calls': 0, 'frames_received': 0, 'frames_dropped': 0, 'latencies': []}
+        server = AudioSocketServer(lambda call: echo_handler(call, results))
+        await server.start('127.0.0.1', 0)
+        ports.put(server.port)
+        while results['calls'] < calls:
+            await asyncio.sleep(0.1)
+        await server.close()
+        latencies = sorted(results.pop('latencies'))
+        results['p50'] = latencies[len(latencies) // 2] if latencies else None
+        results['p99'] = latencies[int(len(latencies) * 0.99)] if latencies else None
+        summaries.put(results)
+
+    asyncio.run(serve())
+
+
+async def synthetic_call(port: int, seconds: float, totals: dict) -> None:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(HANDSHAKE)
+    await reader.readuntil(b'\r\n\r\n')
+    writer.write(_encode_frame(0x1, METADATA, urandom(4)))
+    frames = int(seconds / FRAME_DURATION)
+
+    async def read_echoes():
+        echoed = 0
+        while echoed < frames:
+            _, opcode, _, _ = await _read_frame(reader, 1 << 20)
+            if opcode == 0x2:
+                echoed += 1
+                totals['frames_echoed'] += 1
+
+    reading = asyncio.get_running_loop().create_task(read_echoes())
+    silence = bytes(FRAME_SIZE - 8)
+    loop = asyncio.get_running_loop()
+    send_at = loop.time()
+    for _ in range(frames):
+        frame = pack('d', perf_counter()) + silence
+        writer.write(_encode_frame(0x2, frame, urandom(4)))
+        totals['frames_sent'] += 1
+        send_at += FRAME_DURATION
+        await asyncio.sleep(max(send_at - loop.time(), 0))
+    try:
+        # The echo is paced, so wait for the last frames to come back
+        await asyncio.wait_for(reading, 2)
+    except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    writer.write(_encode_frame(0x8, pack('!H', 1000), urandom(4)))
+    await writer.drain()
+    writer.close()
+
+
+async def run_calls(port: int, calls: int, seconds: float) -> dict:
+    totals = {'frames_sent': 0, 'frames_echoed': 0}
+    await asyncio.gather(*(synthetic_call(port, seconds, totals) for _ in range(calls)))
+    return totals
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    # The server runs in its own process, as it would in production
+    ports, summaries = Queue(), Queue()
+    server = Process(target=run_server, args=(calls, ports, summaries))
+    server.start()
+    totals = asyncio.run(run_calls(ports.get(), calls, seconds))
+    results = summaries.get()
+    server.join()
+
+    print(f'{calls} synthetic calls streaming for {seconds:g}s')
+    print(f'frames sent:     {totals["frames_sent"]}')
+    print(f'frames received: {results["frames_received"]}')
+    print(f'frames dropped:  {results["frames_dropped"]}')
+    print(f'frames echoed:   {totals["frames_echoed"]}')
+    if results['p50'] is not None:
+        print(
+            f'delivery latency p50 {results["p50"] * 1e3:.2f} ms, '
+            f'p99 {results["p99"] * 1e3:.2f} ms'
+        )
+
+
+if __name__ == '__main__':
+    main()
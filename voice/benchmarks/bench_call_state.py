@@ -0,0 +1,76 @@
+"""Measures how quickly `CallStateTracker` ingests Voice event webhooks, compared with
+validating each event as a pydantic model before tracking it.
+
+Events are generated for calls of two legs each, going through the statuses a call
+usually goes through, then ingested in batches.
+
+Run with: `python voice/benchmarks/bench_call_state.py`
+"""
+
+from time import perf_counter
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from vonage_voice.call_state import CallStateTracker
+
+CALLS = 20000
+BATCH_SIZE = 500
+STATUSES = ('started', 'ringing', 'answered', 'completed')
+
+
+class CallEvent(BaseModel):
+    uuid: str
+    conversation_uuid: str
+    status: str
+    direction: str
+    from_: str = Field(..., validation_alias='from')
+    to: str
+    timestamp: str
+    duration: Optional[str] = None
+
+
+def build_events() -> list[dict]:
+    events = []
+    for status_index, status in enumerate(STATUSES):
+        for call in range(CALLS):
+            for leg in range(2):
+                events.append(
+                    {
+                        'uuid': f'{call:08d}-leg-{leg}',
+                        'conversation_uuid': f'CON-{call:08d}',
+                        'status': status,
+                        'direction': 'outbound' if leg else 'inbound',
+                        'from': '447700900000',
+                        'to': '447700900001',
+                        'timestamp': f'2024-01-01T12:00:{status_index:02d}.000Z',
+                    }
+                )
+    return events
+
+
+def ingest(events: list[dict], validate: bool) -> tuple[float, CallStateTracker]:
+    tracker = CallStateTracker()
+    start = perf_counter()
+    for i in range(0, len(events), BATCH_SIZE):
+        batch = events[i : i + BATCH_SIZE]
+        if validate:
+            batch = [
+                CallEvent.model_validate(event).model_dump(by_alias=True)
+                for event in batch
+            ]
+        tracker.ingest_many(batch)
+    return len(events) / (perf_counter() - start), tracker
+
+
+def main():
+    events = build_events()
+    print(f'{len(events)} events for {CALLS} calls, in batches of {BATCH_SIZE}')
+    for name, validate in (('raw dicts', False), ('validated models', True)):
+        ingest(events[: len(events) // 10], validate)
+        rate, tracker = ingest(events, validate)
+        assert len(tracker) == 2 * CALLS and not tracker.active_legs()
+        print(f'{name:<17} {rate:>9.0f} events/s')
+
+
+if __name__ == '__main__':
+    main()
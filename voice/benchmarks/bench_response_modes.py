@@ -0,0 +1,94 @@
+"""Compares the `model`, `lazy` and `raw` response modes of `Voice.list_calls` on a page
+of 1000 calls.
+
+The HTTP layer is replaced by a stub that decodes the same JSON page on every call, so
+the timings cover decoding the body and building the returned items. For each mode, the
+time to get the page and read one field of every call is also measured, as well as the
+peak memory allocated while holding the page.
+
+Run with: `python voice/benchmarks/bench_response_modes.py`
+"""
+
+import tracemalloc
+from json import dumps, loads
+from timeit import timeit
+
+from vonage_voice import Voice
+
+PAGE_SIZE = 1000
+NUMBER = 20
+
+PAGE = dumps(
+    {
+        '_embedded': {
+            'calls': [
+                {
+                    '_links': {'self': {'href': f'/v1/calls/{i:032x}'}},
+                    'conversation_uuid': f'CON-{i:032x}',
+                    'direction': 'outbound',
+                    'duration': '2',
+                    'end_time': '2024-04-19T01:34:20.000Z',
+                    'from': {'number': '9876543210', 'type': 'phone'},
+                    'network': '23420',
+                    'price': '0.00333333',
+                    'rate': '0.10000000',
+                    'start_time': '2024-04-19T01:34:18.000Z',
+                    'status': 'completed',
+                    'to': {'number': '1234567890', 'type': 'phone'},
+                    'uuid': f'{i:032x}',
+                }
+                for i in range(PAGE_SIZE)
+            ]
+        },
+        '_links': {'self': {'href': '/v1/calls?page_size=1000&record_index=0'}},
+        'count': PAGE_SIZE,
+        'page_size': PAGE_SIZE,
+        'record_index': 0,
+    }
+).encode()
+
+
+class StubHttpClient:
+    api_host = 'api.nexmo.com'
+
+    def get(self, *args, **kwargs):
+        return loads(PAGE)
+
+
+def first_field(mode, call):
+    return call['uuid'] if mode == 'raw' else call.uuid
+
+
+def peak_memory(voice: Voice, mode: str) -> int:
+    tracemalloc.start()
+    calls, _ = voice.list_calls(response_mode=mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del calls
+    return peak
+
+
+def main():
+    voice = Voice(StubHttpClient())
+    decode = timeit(lambda: loads(PAGE), number=NUMBER) / NUMBER * 1e3
+    print(f'Page of {PAGE_SIZE} calls ({len(PAGE)} bytes); json.loads: {decode:.2f} ms')
+    print(f'{"mode":<6} {"list":>10} {"list + read all":>17} {"peak memory":>13}')
+    for mode in ('model', 'lazy', 'raw'):
+        list_only = timeit(lambda: voice.list_calls(response_mode=mode), number=NUMBER)
+
+        def list_and_read():
+            calls, _ = voice.list_calls(response_mode=mode)
+            for call in calls:
+                first_field(mode, call)
+
+        list_and_read_time = timeit(list_and_read, number=NUMBER)
+        memory = peak_memory(voice, mode)
+        print(
+            f'{mode:<6} {list_only / NUMBER * 1e3:>7.2f} ms '
+            f'{list_and_read_time / NUMBER * 1e3:>14.2f} ms '
+            f'{memory / 1024:>10.0f} KiB'
+        )
+
+
+if __name__ == '__main__':
+    main()
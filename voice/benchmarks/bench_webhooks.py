@@ -0,0 +1,114 @@
+"""Load-tests the Voice webhook ASGI app with concurrent local clients, comparing an
+answer handler that returns a compiled NCCO against one that rebuilds and serialises its
+NCCO for every call, with and without verifying signed webhooks.
+
+Clients call the ASGI app directly rather than over a socket, so the results measure the
+app itself, without the overhead of an HTTP server.
+
+Run with: `python voice/benchmarks/bench_webhooks.py`
+"""
+
+import asyncio
+from hashlib import sha256
+from time import perf_counter
+
+from vonage_voice.asgi import create_webhook_app
+from vonage_voice.models.input_types import Dtmf
+from vonage_voice.models.ncco import Input, Record, Talk
+from vonage_voice.ncco_compiler import NccoTemplates
+
+from jwt import encode
+
+REQUESTS = 20000
+CLIENTS = 50
+SECRET = 'benchmark_signature_secret_0123456789'
+QUERY = b'from=447700900000&to=447700900001&uuid=63f61863-4a51-4f6b-86e1-46edebcf9356'
+
+
+def build_ncco(caller: str) -> list:
+    return [
+        Talk(text=f'Hello {caller}, thanks for calling.', language='en-GB'),
+        Input(
+            type=['dtmf'],
+            dtmf=Dtmf(maxDigits=1, timeOut=5),
+            eventUrl=['https://example.com/webhooks/input'],
+        ),
+        Record(eventUrl=['https://example.com/webhooks/recording']),
+    ]
+
+
+templates = NccoTemplates()
+
+
+async def compiled_answer(request):
+    ncco = templates.get('answer', lambda: build_ncco('{{caller}}'))
+    return ncco.render(caller=request.query['from'])
+
+
+async def rebuilt_answer(request):
+    return build_ncco(request.query['from'])
+
+
+def signed_headers() -> list:
+    token = encode(
+        {'application_id': 'app', 'payload_hash': sha256(b'').hexdigest()},
+        SECRET,
+        algorithm='HS256',
+    )
+    return [(b'authorization', f'Bearer {token}'.encode())]
+
+
+async def run_client(app, requests: int, headers: list, latencies: list) -> None:
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/webhooks/answer',
+        'query_string': QUERY,
+        'headers': headers,
+    }
+    request_message = {'type': 'http.request', 'body': b'', 'more_body': False}
+    statuses = []
+
+    async def receive():
+        return request_message
+
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            statuses.append(message['status'])
+
+    for _ in range(requests):
+        start = perf_counter()
+        await app(scope, receive, send)
+        latencies.append(perf_counter() - start)
+    assert set(statuses) == {200}
+
+
+async def load_test(app, requests: int) -> tuple[float, float]:
+    latencies = []
+    headers = signed_headers()
+    start = perf_counter()
+    clients = [
+        run_client(app, requests // CLIENTS, headers, latencies) for _ in range(CLIENTS)
+    ]
+    await asyncio.gather(*clients)
+    elapsed = perf_counter() - start
+    latencies.sort()
+    return len(latencies) / elapsed, latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    print(f'{REQUESTS} answer webhooks from {CLIENTS} concurrent clients')
+    for secret in (None, SECRET):
+        for name, handler in (
+            ('compiled NCCO', compiled_answer),
+            ('rebuilt NCCO', rebuilt_answer),
+        ):
+            app = create_webhook_app(answer=handler, signature_secret=secret)
+            asyncio.run(load_test(app, REQUESTS // 10))
+            rate, p99 = asyncio.run(load_test(app, REQUESTS))
+            label = f'{name}{", signed" if secret else ""}'
+            print(f'{label:<22} {rate:>7.0f} requests/s   p99 {p99 * 1e6:>5.0f} us')
+
+
+if __name__ == '__main__':
+    main()
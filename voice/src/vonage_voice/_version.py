@@ -1 +1 @@
-__version__ = '1.4.0'
+__version__ = '1.5.0'
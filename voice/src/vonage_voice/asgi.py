@@ -0,0 +1,306 @@
+import json
+from base64 import urlsafe_b64decode
+from hashlib import sha256
+from hmac import compare_digest
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Optional, Union
+from urllib.parse import parse_qsl
+
+from pydantic_core import to_json
+from vonage_jwt.errors import VonageVerifyJwtError
+from vonage_jwt.verify_jwt import verify_signature
+from vonage_voice.models.ncco import NccoAction
+from vonage_voice.ncco_compiler import CompiledNcco
+
+logger = getLogger(__name__)
+
+NccoResult = Union[CompiledNcco, bytes, list[NccoAction], list[dict], None]
+"""What a webhook handler can return: a compiled NCCO with its slots filled in, NCCO
+JSON bytes, a list of NCCO actions, or None to send an empty response."""
+
+WebhookHandler = Callable[['WebhookRequest'], Awaitable[NccoResult]]
+
+_JSON_HEADERS = [(b'content-type', b'application/json')]
+
+_STATUS_BODIES = {
+    401: b'{"title":"Unauthorized"}',
+    404: b'{"title":"Not Found"}',
+    405: b'{"title":"Method Not Allowed"}',
+    413: b'{"title":"Payload Too Large"}',
+    500: b'{"title":"Internal Server Error"}',
+}
+
+
+class _ClientDisconnected(Exception):
+    """Raised when the client disconnects before its request body has been received."""
+
+
+class WebhookRequest:
+    """A webhook request received by a `VoiceWebhookApp`.
+
+    The query string and body are only parsed when they're used.
+
+    Args:
+        kind (str): The webhook the request was routed to: 'answer', 'event' or
+            'fallback'.
+        method (str): The HTTP method.
+        path (str): The request path.
+        query_string (bytes): The raw query string.
+        headers (list[tuple[bytes, bytes]]): The raw request headers.
+        body (bytes): The request body.
+        claims (dict, optional): The claims of the verified JWT, if the webhook was
+            signed.
+    """
+
+    __slots__ = (
+        'kind',
+        'method',
+        'path',
+        'query_string',
+        'headers',
+        'body',
+        'claims',
+        '_query',
+        '_json',
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        method: str,
+        path: str,
+        query_string: bytes,
+        headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        claims: Optional[dict] = None,
+    ):
+        self.kind = kind
+        self.method = method
+        self.path = path
+        self.query_string = query_string
+        self.headers = headers
+        self.body = body
+        self.claims = claims
+        self._query: Optional[dict[str, str]] = None
+        self._json: Any = None
+
+    @property
+    def query(self) -> dict[str, str]:
+        """The query string parameters."""
+        if self._query is None:
+            self._query = dict(parse_qsl(self.query_string.decode('latin-1')))
+        return self._query
+
+    def json(self) -> Any:
+        """The body, decoded from JSON. Returns None if the body is empty."""
+        if self._json is None and self.body:
+            self._json = json.loads(self.body)
+        return self._json
+
+    @property
+    def data(self) -> dict:
+        """The webhook parameters: the JSON body, or the query string parameters if the
+        body is empty, e.g. for answer webhooks sent with GET."""
+        if self.body:
+            return self.json()
+        return self.query
+
+
+class VoiceWebhookApp:
+    """An ASGI application that routes Voice API webhooks to async handlers.
+
+    Run it with any ASGI server, e.g. `uvicorn`. Answer and fallback handlers return the
+    NCCO to send, ideally as a `CompiledNcco` so nothing is serialised per request. Event
+    handlers usually return None, which sends an empty 204 response.
+
+    If a signature secret is set, requests must have a JWT in their `Authorization`
+    header signed with it, and if the JWT has a `payload_hash` claim it must match the
+    body. Other requests are rejected with a 401 response.
+
+    Create apps with `create_webhook_app`.
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, tuple[str, WebhookHandler]],
+        signature_secret: Optional[str],
+        max_body_size: int,
+    ):
+        self._routes = routes
+        self._signature_secret = signature_secret
+        self._max_body_size = max_body_size
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        route = self._routes.get(scope['path'])
+        if route is None:
+            await _send_status(send, 404)
+            return
+        if scope['method'] not in ('GET', 'POST'):
+            await _send_status(send, 405)
+            return
+
+        try:
+            body = await self._read_body(receive)
+        except _ClientDisconnected:
+            # Don't handle a partial body, and there's no one to send a response to
+            return
+        if body is None:
+            await _send_status(send, 413)
+            return
+
+        claims = None
+        if self._signature_secret is not None:
+            claims = self._verify(scope['headers'], body)
+            if claims is None:
+                await _send_status(send, 401)
+                return
+
+        kind, handler = route
+        request = WebhookRequest(
+            kind,
+            scope['method'],
+            scope['path'],
+            scope.get('query_string', b''),
+            scope['headers'],
+            body,
+            claims,
+        )
+        try:
+            result = await handler(request)
+            response_body = _encode_result(result)
+        except Exception:
+            logger.exception('Error handling the Voice %s webhook.', kind)
+            await _send_status(send, 500)
+            return
+
+        if response_body is None:
+            await send({'type': 'http.response.start', 'status': 204, 'headers': []})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 200,
+                'headers': _JSON_HEADERS
+                + [(b'content-length', str(len(response_body)).encode())],
+            }
+        )
+        await send({'type': 'http.response.body', 'body': response_body})
+
+    async def _read_body(self, receive: Callable) -> Optional[bytes]:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                raise _ClientDisconnected
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > self._max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                return b''.join(chunks)
+
+    def _verify(self, headers: list[tuple[bytes, bytes]], body: bytes) -> Optional[dict]:
+        token = None
+        for name, value in headers:
+            if name.lower() == b'authorization':
+                scheme, _, token = value.decode('latin-1').partition(' ')
+                if scheme.lower() != 'bearer':
+                    token = None
+                break
+        if not token:
+            return None
+        try:
+            if not verify_signature(token, self._signature_secret):
+                return None
+        except VonageVerifyJwtError:
+            # e.g. a malformed or expired token
+            return None
+        # The signature is valid, so the claims are the JSON object in the payload
+        payload = token.split('.')[1]
+        claims = json.loads(urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        payload_hash = claims.get('payload_hash')
+        if payload_hash is not None and not (
+            isinstance(payload_hash, str)
+            and compare_digest(payload_hash.encode(), sha256(body).hexdigest().encode())
+        ):
+            return None
+        return claims
+
+    async def _lifespan(self, receive: Callable, send: Callable) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def _encode_result(result: NccoResult) -> Optional[bytes]:
+    if result is None:
+        return None
+    if isinstance(result, bytes):
+        return result
+    if isinstance(result, CompiledNcco):
+        return result.render()
+    return to_json(result, by_alias=True, exclude_none=True)
+
+
+async def _send_status(send: Callable, status: int) -> None:
+    body = _STATUS_BODIES[status]
+    await send(
+        {
+            'type': 'http.response.start',
+            'status': status,
+            'headers': _JSON_HEADERS + [(b'content-length', str(len(body)).encode())],
+        }
+    )
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def create_webhook_app(
+    answer: Optional[WebhookHandler] = None,
+    event: Optional[WebhookHandler] = None,
+    fallback: Optional[WebhookHandler] = None,
+    signature_secret: Optional[str] = None,
+    answer_path: str = '/webhooks/answer',
+    event_path: str = '/webhooks/event',
+    fallback_path: str = '/webhooks/fallback',
+    max_body_size: int = 65536,
+) -> VoiceWebhookApp:
+    """Creates an ASGI application for Voice API answer, event and fallback webhooks.
+
+    Args:
+        answer (WebhookHandler, optional): Handles answer webhooks. An async function that
+            takes a `WebhookRequest` and returns the NCCO for the call.
+        event (WebhookHandler, optional): Handles event webhooks. Can return an NCCO,
+            e.g. for `input` events, or None.
+        fallback (WebhookHandler, optional): Handles fallback answer webhooks.
+        signature_secret (str, optional): Your account's signature secret. If set, only
+            signed webhooks are accepted.
+        answer_path (str, optional): The path of the answer webhook.
+        event_path (str, optional): The path of the event webhook.
+        fallback_path (str, optional): The path of the fallback webhook.
+        max_body_size (int, optional): The largest request body accepted, in bytes.
+
+    Returns:
+        VoiceWebhookApp: The ASGI application.
+    """
+    routes = {}
+    for kind, path, handler in (
+        ('answer', answer_path, answer),
+        ('event', event_path, event),
+        ('fallback', fallback_path, fallback),
+    ):
+        if handler is not None:
+            routes[path] = (kind, handler)
+    return VoiceWebhookApp(routes, signature_secret, max_body_size)
@@ -0,0 +1,535 @@
+import asyncio
+import json
+from base64 import b64encode
+from hashlib import sha1
+from logging import getLogger
+from struct import pack, unpack
+from typing import Awaitable, Callable, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+logger = getLogger('vonage_voice')
+
+_WEBSOCKET_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+_CONTINUATION = 0x0
+_TEXT = 0x1
+_BINARY = 0x2
+_CLOSE = 0x8
+_PING = 0x9
+_PONG = 0xA
+
+
+class AudioSocketMetadata(BaseModel):
+    """The first message the Voice API sends on a WebSocket connection.
+
+    Any custom headers set on the `WebsocketEndpoint` are included as extra fields, and
+    can be read from `headers`.
+
+    Args:
+        event (str, optional): The event, e.g. 'websocket:connected'.
+        content_type (str): The audio format, e.g. 'audio/l16;rate=16000'.
+    """
+
+    model_config = ConfigDict(extra='allow', populate_by_name=True)
+
+    event: Optional[str] = None
+    content_type: str = Field('audio/l16;rate=16000', validation_alias='content-type')
+
+    @property
+    def sample_rate(self) -> int:
+        """The sample rate of the audio, in Hz."""
+        for parameter in self.content_type.split(';')[1:]:
+            name, _, value = parameter.strip().partition('=')
+            if name == 'rate' and value.isdigit():
+                return int(value)
+        return 16000
+
+    @property
+    def headers(self) -> dict:
+        """The custom headers set on the `WebsocketEndpoint`."""
+        return dict(self.model_extra or {})
+
+
+class AudioFrameRing:
+    """A ring buffer of fixed-size audio frames, allocated once.
+
+    Frames are written into slots of the buffer and read as memoryviews of them, so the
+    buffer itself doesn't allocate memory per frame, and frames aren't copied again when
+    they're read. A frame that's been read stays valid until the next one is read. If the
+    buffer is full, new frames are dropped.
+
+    Args:
+        frame_size (int): The size of each frame, in bytes.
+        capacity (int): The number of frames in the buffer, at least 2.
+    """
+
+    def __init__(self, frame_size: int, capacity: int):
+        self._frame_size = frame_size
+        self._capacity = max(capacity, 2)
+        view = memoryview(bytearray(frame_size * self._capacity))
+        self._slots = [
+            view[index * frame_size : (index + 1) * frame_size]
+            for index in range(self._capacity)
+        ]
+        self._written = 0
+        self._read = 0
+        self.dropped = 0
+
+    @property
+    def frame_size(self) -> int:
+        return self._frame_size
+
+    def __len__(self) -> int:
+        """The number of frames waiting to be read."""
+        return self._written - self._read
+
+    def reserve(self) -> Optional[memoryview]:
+        """Gets the slot for the next frame, or None if the buffer is full. Call `commit`
+        once the frame has been written to it."""
+        # One slot is kept for the frame that was read last, which may still be in use
+        if self._written - self._read >= self._capacity - 1:
+            return None
+        return self._slots[self._written % self._capacity]
+
+    def commit(self) -> None:
+        """Makes the frame written to the reserved slot available to read."""
+        self._written += 1
+
+    def pop(self) -> Optional[memoryview]:
+        """Gets the oldest frame, or None if there are none."""
+        if self._read == self._written:
+            return None
+        frame = self._slots[self._read % self._capacity]
+        self._read += 1
+        return frame
+
+
+def _unmask(payload: bytes, mask: bytes) -> bytes:
+    length = len(payload)
+    key = int.from_bytes((mask * (length // 4 + 1))[:length], 'little')
+    return (int.from_bytes(payload, 'little') ^ key).to_bytes(length, 'little')
+
+
+def _encode_frame(
+    opcode: int, payload: bytes, mask: Optional[bytes] = None, fin: bool = True
+) -> bytes:
+    # Frames sent by a server aren't masked. Clients, e.g. in tests, must mask them.
+    length = len(payload)
+    first = 0x80 | opcode if fin else opcode
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = pack('!BB', first, mask_bit | length)
+    elif length < 65536:
+        header = pack('!BBH', first, mask_bit | 126, length)
+    else:
+        header = pack('!BBQ', first, mask_bit | 127, length)
+    if mask:
+        return header + mask + _unmask(payload, mask)
+    return header + payload
+
+
+async def _read_frame(
+    reader: asyncio.StreamReader, max_size: int
+) -> tuple[bool, int, bytes, Optional[bytes]]:
+    """Reads a frame, returning whether it's final, its opcode, its payload and its
+    mask. The payload isn't unmasked."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = unpack('!H', await reader.readexactly(2))
+    elif length == 127:
+        (length,) = unpack('!Q', await reader.readexactly(8))
+    if length > max_size:
+        raise ValueError(f'A WebSocket frame of {length} bytes is too large.')
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length) if length else b''
+    return bool(first & 0x80), first & 0x0F, payload, mask
+
+
+class AudioCall:
+    """A call streaming audio to an `AudioSocketServer` over a WebSocket.
+
+    Iterate over the call with `async for` to receive audio frames, as memoryviews that
+    are only valid until the next frame is received. Copy a frame, e.g. with `bytes`, to
+    keep it. Frames are 16-bit linear PCM, of `frame_duration` seconds each.
+
+    Audio sent with `send_audio` is queued, and sent one frame at a time at the rate it
+    plays back, so it can be interrupted with `clear_audio`.
+
+    Args:
+        path (str): The path the WebSocket connected to.
+        metadata (AudioSocketMetadata): The metadata sent when the call connected.
+        messages (asyncio.Queue): JSON text messages received after the metadata, e.g.
+            DTMF events, decoded to dicts.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        path: str,
+        metadata: AudioSocketMetadata,
+        frame_duration: float,
+        ring_frames: int,
+        max_message_size: int,
+    ):
+        self.path = path
+        self.metadata = metadata
+        self.frame_duration = frame_duration
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self._reader = reader
+        self._writer = writer
+        self._max_message_size = max_message_size
+        frame_size = round(metadata.sample_rate * frame_duration) * 2
+        self._ring = AudioFrameRing(frame_size, ring_frames)
+        self._partial = bytearray()
+        self._frame_ready = asyncio.Event()
+        self._outgoing = bytearray()
+        self._outgoing_ready = asyncio.Event()
+        self._sender: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def frame_size(self) -> int:
+        """The size of each audio frame, in bytes."""
+        return self._ring.frame_size
+
+    @property
+    def frames_dropped(self) -> int:
+        """The number of frames dropped because they weren't received quickly enough."""
+        return self._ring.dropped
+
+    @property
+    def pending_audio(self) -> float:
+        """The number of seconds of audio queued to be sent."""
+        return len(self._outgoing) / self.frame_size * self.frame_duration
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def receive(self) -> Optional[memoryview]:
+        """Waits for the next audio frame.
+
+        Returns:
+            memoryview: The frame, valid until the next frame is received, or None if
+                the call has ended.
+        """
+        while True:
+            frame = self._ring.pop()
+            if frame is not None:
+                return frame
+            if self._closed:
+                return None
+            self._frame_ready.clear()
+            await self._frame_ready.wait()
+
+    def __aiter__(self) -> 'AudioCall':
+        return self
+
+    async def __anext__(self) -> memoryview:
+        frame = await self.receive()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+    def send_audio(self, audio: bytes) -> None:
+        """Queues audio to be sent into the call. The last frame is padded with silence.
+
+        Args:
+            audio (bytes): 16-bit linear PCM audio, at the call's sample rate.
+        """
+        if self._closed:
+            return
+        self._outgoing += audio
+        if self._sender is None:
+            self._sender = asyncio.get_running_loop().create_task(self._send_frames())
+        self._outgoing_ready.set()
+
+    def clear_audio(self) -> None:
+        """Discards audio that's queued but hasn't been sent, e.g. when the caller starts
+        speaking."""
+        del self._outgoing[:]
+
+    async def wait_audio_sent(self) -> None:
+        """Waits until all the queued audio has been sent, or the call has ended."""
+        while self._outgoing and not self._closed:
+            await asyncio.sleep(self.frame_duration)
+
+    async def send_text(self, message: dict) -> None:
+        """Sends a JSON text message to the Voice API.
+
+        Args:
+            message (dict): The message.
+        """
+        self._writer.write(_encode_frame(_TEXT, json.dumps(message).encode()))
+        await self._writer.drain()
+
+    async def close(self, code: int = 1000) -> None:
+        """Closes the WebSocket, ending the call's audio stream.
+
+        Args:
+            code (int, optional): The WebSocket close status code.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._frame_ready.set()
+        self._outgoing_ready.set()
+        try:
+            self._writer.write(_encode_frame(_CLOSE, pack('!H', code)))
+            await self._writer.drain()
+        except ConnectionError:
+            pass
+
+    async def _read_frames(self) -> None:
+        message_opcode = None
+        message = bytearray()
+        close_code = 1000
+        try:
+            while True:
+                fin, opcode, payload, mask = await _read_frame(
+                    self._reader, self._max_message_size
+                )
+                if opcode == _BINARY or (
+                    opcode == _CONTINUATION and message_opcode == _BINARY
+                ):
+                    self._receive_audio(payload, mask)
+                    message_opcode = None if fin else _BINARY
+                    continue
+                if mask is not None:
+                    payload = _unmask(payload, mask)
+                if opcode == _TEXT or opcode == _CONTINUATION:
+                    if len(message) + len(payload) > self._max_message_size:
+                        raise ValueError(
+                            'A fragmented WebSocket message of more than '
+                            f'{self._max_message_size} bytes is too large.'
+                        )
+                    message += payload
+                    message_opcode = None if fin else _TEXT
+                    if fin:
+                        self._receive_message(message)
+                        message = bytearray()
+                elif opcode == _PING:
+                    self._writer.write(_encode_frame(_PONG, payload))
+                elif opcode == _CLOSE:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as err:
+            # Only raised for frames and messages that are too large
+            logger.warning('Closing the audio WebSocket for %s: %s', self.path, err)
+            close_code = 1009
+        finally:
+            await self.close(close_code)
+
+    def _receive_message(self, message: bytearray) -> None:
+        try:
+            decoded = json.loads(message)
+        except ValueError:
+            logger.warning(
+                'Ignoring a text message on the audio WebSocket for %s that is not '
+                'valid JSON.',
+                self.path,
+            )
+            return
+        self.messages.put_nowait(decoded)
+
+    def _receive_audio(self, payload: bytes, mask: Optional[bytes]) -> None:
+        frame_size = self.frame_size
+        if len(payload) == frame_size and not self._partial:
+            # Frames are normally exactly one slot long, so are unmasked straight into it
+            slot = self._ring.reserve()
+            if slot is None:
+                self._ring.dropped += 1
+                return
+            slot[:] = _unmask(payload, mask) if mask is not None else payload
+            self._ring.commit()
+        else:
+            self._partial += _unmask(payload, mask) if mask is not None else payload
+            while len(self._partial) >= frame_size:
+                slot = self._ring.reserve()
+                if slot is None:
+                    self._ring.dropped += 1
+                else:
+                    slot[:] = self._partial[:frame_size]
+                    self._ring.commit()
+                del self._partial[:frame_size]
+        self._frame_ready.set()
+
+    async def _send_frames(self) -> None:
+        loop = asyncio.get_running_loop()
+        frame_size = self.frame_size
+        send_at = None
+        try:
+            while not self._closed:
+                if not self._outgoing:
+                    self._outgoing_ready.clear()
+                    send_at = None
+                    await self._outgoing_ready.wait()
+                    continue
+                now = loop.time()
+                if send_at is None or send_at < now - self.frame_duration:
+                    # Start on time, or resynchronise after falling behind
+                    send_at = now
+                elif send_at > now:
+                    await asyncio.sleep(send_at - now)
+                    if not self._outgoing or self._closed:
+                        continue
+                frame = bytes(self._outgoing[:frame_size])
+                del self._outgoing[:frame_size]
+                if len(frame) < frame_size:
+                    frame += bytes(frame_size - len(frame))
+                self._writer.write(_encode_frame(_BINARY, frame))
+                await self._writer.drain()
+                send_at += self.frame_duration
+        except ConnectionError:
+            pass
+
+
+AudioCallHandler = Callable[[AudioCall], Awaitable[None]]
+
+
+async def _accept_handshake(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> Optional[str]:
+    request = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1')
+    request_line, *header_lines = request.split('\r\n')
+    method, path, _ = (request_line.split(' ', 2) + ['', ''])[:3]
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    key = headers.get('sec-websocket-key')
+    if method != 'GET' or headers.get('upgrade', '').lower() != 'websocket' or not key:
+        writer.write(
+            b'HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n'
+        )
+        await writer.drain()
+        return None
+    accept = b64encode(sha1(key.encode() + _WEBSOCKET_GUID).digest()).decode()
+    writer.write(
+        (
+            'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+            f'Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n'
+        ).encode()
+    )
+    await writer.drain()
+    return path
+
+
+async def _read_metadata(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_size: int
+) -> Optional[AudioSocketMetadata]:
+    while True:
+        _, opcode, payload, mask = await _read_frame(reader, max_size)
+        if mask is not None:
+            payload = _unmask(payload, mask)
+        if opcode == _TEXT:
+            return AudioSocketMetadata.model_validate_json(payload)
+        if opcode == _PING:
+            writer.write(_encode_frame(_PONG, payload))
+        elif opcode == _CLOSE:
+            return None
+
+
+class AudioSocketServer:
+    """An asyncio server for the WebSocket audio streams of calls connected to a
+    `WebsocketEndpoint`.
+
+    Each connection is handled by a coroutine on the event loop, so one process can
+    handle hundreds of calls at once. Incoming audio is written to a ring buffer
+    allocated for each call, and passed to the handler without being copied again.
+    Unmasking a frame from the Voice API still creates a temporary copy of its payload,
+    as pure Python has no in-place XOR of a buffer.
+
+    Args:
+        handler (AudioCallHandler): An async function called with the `AudioCall` for
+            each connection. The connection is closed when it returns.
+        frame_duration (float, optional): The length of each audio frame, in seconds.
+            The Voice API sends 20ms frames.
+        ring_frames (int, optional): The number of incoming frames buffered for each
+            call. Frames arriving when the buffer is full are dropped.
+        max_message_size (int, optional): The largest WebSocket frame, or text message
+            made of several frames, accepted, in bytes. Larger ones close the connection
+            with status 1009.
+    """
+
+    def __init__(
+        self,
+        handler: AudioCallHandler,
+        frame_duration: float = 0.02,
+        ring_frames: int = 50,
+        max_message_size: int = 1 << 20,
+    ):
+        self._handler = handler
+        self._frame_duration = frame_duration
+        self._ring_frames = ring_frames
+        self._max_message_size = max_message_size
+        self._server: Optional[asyncio.Server] = None
+        self.active_calls = 0
+
+    async def start(self, host: str = '0.0.0.0', port: int = 8080) -> asyncio.Server:
+        """Starts listening for connections.
+
+        Args:
+            host (str, optional): The address to listen on.
+            port (int, optional): The port to listen on. Use 0 to pick a free port.
+
+        Returns:
+            asyncio.Server: The running server, e.g. to call `serve_forever` on.
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    @property
+    def port(self) -> Optional[int]:
+        """The port the server is listening on, once started."""
+        if self._server is None or not self._server.sockets:
+            return None
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stops listening for connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        call = None
+        reading = None
+        try:
+            path = await _accept_handshake(reader, writer)
+            if path is None:
+                return
+            metadata = await _read_metadata(reader, writer, self._max_message_size)
+            if metadata is None:
+                return
+            call = AudioCall(
+                reader,
+                writer,
+                path,
+                metadata,
+                self._frame_duration,
+                self._ring_frames,
+                self._max_message_size,
+            )
+            self.active_calls += 1
+            reading = asyncio.get_running_loop().create_task(call._read_frames())
+            await self._handler(call)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        except Exception:
+            logger.exception('Error handling a Voice WebSocket connection.')
+        finally:
+            if call is not None:
+                self.active_calls -= 1
+                await call.close()
+                if call._sender is not None:
+                    call._sender.cancel()
+            if reading is not None:
+                reading.cancel()
+            writer.close()
@@ -0,0 +1,285 @@
+import csv
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from queue import Full, Queue
+from threading import Event
+from typing import IO, Callable, Optional, Union
+
+from vonage_voice.errors import VoiceError
+
+CALL_RECORD_COLUMNS = (
+    'uuid',
+    'conversation_uuid',
+    'status',
+    'direction',
+    'from_type',
+    'from_address',
+    'to_type',
+    'to_address',
+    'rate',
+    'price',
+    'duration',
+    'start_time',
+    'end_time',
+    'network',
+)
+"""The columns of an exported call record. All values are strings, or None if the API
+didn't return them; `rate`, `price` and `duration` are kept as strings, as sent by the API,
+so no precision is lost."""
+
+_ADDRESS_KEYS = ('number', 'uri', 'user')
+
+
+def _address(endpoint: Optional[dict]) -> tuple[Optional[str], Optional[str]]:
+    if not endpoint:
+        return None, None
+    for key in _ADDRESS_KEYS:
+        if endpoint.get(key) is not None:
+            return endpoint.get('type'), endpoint[key]
+    return endpoint.get('type'), None
+
+
+def flatten_call(call: dict) -> dict:
+    """Flattens a raw call record from the Voice API into a row with the columns in
+    `CALL_RECORD_COLUMNS`.
+
+    Args:
+        call (dict): A call, as returned by the API.
+
+    Returns:
+        dict: The flattened call record.
+    """
+    from_type, from_address = _address(call.get('from'))
+    to_type, to_address = _address(call.get('to'))
+    return {
+        'uuid': call.get('uuid'),
+        'conversation_uuid': call.get('conversation_uuid'),
+        'status': call.get('status'),
+        'direction': call.get('direction'),
+        'from_type': from_type,
+        'from_address': from_address,
+        'to_type': to_type,
+        'to_address': to_address,
+        'rate': call.get('rate'),
+        'price': call.get('price'),
+        'duration': call.get('duration'),
+        'start_time': call.get('start_time'),
+        'end_time': call.get('end_time'),
+        'network': call.get('network'),
+    }
+
+
+class CallRecordSink(ABC):
+    """Base class for writers that receive exported call records in batches.
+
+    Subclasses implement `write`, and `close` if they hold resources.
+    """
+
+    @abstractmethod
+    def write(self, rows: list[dict]) -> None:
+        """Writes a batch of flattened call records."""
+
+    def close(self) -> None:
+        """Flushes and releases any resources held by the sink."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvCallRecordSink(CallRecordSink):
+    """Writes call records to a CSV file, with a header row.
+
+    Args:
+        file (str | file object): The path of the file to create, or a text file object
+            to write to. File objects aren't closed by the sink.
+    """
+
+    def __init__(self, file: Union[str, IO[str]]):
+        if isinstance(file, str):
+            self._file = open(file, 'w', newline='', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self._writer = csv.DictWriter(self._file, fieldnames=CALL_RECORD_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+class ParquetCallRecordSink(CallRecordSink):
+    """Writes call records to a Parquet file with Apache Arrow, one row group per batch.
+
+    Requires the `pyarrow` package.
+
+    Args:
+        path (str): The path of the file to create.
+        compression (str, optional): The Parquet compression codec to use.
+
+    Raises:
+        VoiceError: If `pyarrow` is not installed.
+    """
+
+    def __init__(self, path: str, compression: str = 'zstd'):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise VoiceError(
+                'Writing Parquet files requires pyarrow. Install it with '
+                '`pip install vonage-voice[parquet]`, or export to CSV instead.'
+            ) from err
+        self._pa = pa
+        self._schema = pa.schema(
+            [(column, pa.string()) for column in CALL_RECORD_COLUMNS]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema, compression=compression)
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def open_call_record_sink(path: str) -> CallRecordSink:
+    """Opens a sink for a file path: Parquet for paths ending in '.parquet', otherwise CSV.
+
+    Args:
+        path (str): The path of the file to create.
+
+    Returns:
+        CallRecordSink: The sink.
+    """
+    if path.endswith('.parquet'):
+        return ParquetCallRecordSink(path)
+    return CsvCallRecordSink(path)
+
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Parses an ISO 8601 timestamp, treating naive values as UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_timestamp(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def shard_time_window(
+    date_start: datetime, date_end: datetime, shards: int
+) -> list[tuple[str, str]]:
+    """Splits a time window into consecutive, non-overlapping windows of whole seconds.
+
+    Args:
+        date_start (datetime): The start of the window.
+        date_end (datetime): The end of the window.
+        shards (int): The maximum number of windows to split it into.
+
+    Returns:
+        list[tuple[str, str]]: The start and end of each window, as timestamps that can be
+            used to filter calls. Each window ends one second before the next starts.
+    """
+    start = date_start.replace(microsecond=0)
+    end = date_end.replace(microsecond=0)
+    total = int((end - start).total_seconds()) + 1
+    shards = max(1, min(shards, total))
+    step, extra = divmod(total, shards)
+    windows = []
+    for index in range(shards):
+        length = step + (1 if index < extra else 0)
+        window_end = start + timedelta(seconds=length - 1)
+        windows.append((format_timestamp(start), format_timestamp(window_end)))
+        start = window_end + timedelta(seconds=1)
+    return windows
+
+
+def export_shards(
+    fetch_page: Callable[[str, str, int], tuple[list[dict], bool]],
+    windows: list[tuple[str, str]],
+    sink: CallRecordSink,
+    batch_size: int,
+    max_workers: int,
+) -> int:
+    """Fetches the calls in each time window in parallel and writes them to a sink in
+    batches. Pages waiting to be written are held in a bounded queue, so memory use
+    doesn't grow with the number of calls.
+
+    Args:
+        fetch_page (Callable): Gets a page of raw calls for a window, given its start, end
+            and the index of the first record, and returns the calls and whether there
+            are more.
+        windows (list[tuple[str, str]]): The time windows to fetch.
+        sink (CallRecordSink): The sink to write flattened call records to.
+        batch_size (int): The number of records written to the sink at a time.
+        max_workers (int): The number of windows fetched at the same time.
+
+    Returns:
+        int: The number of call records written.
+    """
+    pages = Queue(maxsize=max_workers * 2)
+    stop = Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def fetch_window(date_start: str, date_end: str) -> None:
+        # Puts each page of rows, then None when done or the exception that stopped it
+        record_index = 0
+        try:
+            while not stop.is_set():
+                calls, more = fetch_page(date_start, date_end, record_index)
+                if calls:
+                    put([flatten_call(call) for call in calls])
+                if not more or not calls:
+                    break
+                record_index += len(calls)
+        except Exception as err:
+            put(err)
+        else:
+            put(None)
+
+    written = 0
+    batch = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for window in windows:
+                executor.submit(fetch_window, *window)
+            remaining = len(windows)
+            while remaining:
+                item = pages.get()
+                if item is None:
+                    remaining -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                batch.extend(item)
+                if len(batch) >= batch_size:
+                    sink.write(batch)
+                    written += len(batch)
+                    batch = []
+            if batch:
+                sink.write(batch)
+                written += len(batch)
+        finally:
+            stop.set()
+    return written
@@ -0,0 +1,299 @@
+import json
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Iterable, NamedTuple, Optional, Union
+
+from vonage_voice.errors import VoiceError
+from vonage_voice.models.enums import CallState
+
+_STATUSES = frozenset(state.value for state in CallState)
+
+# A leg with one of these statuses has ended and won't change again
+_ENDED_STATUSES = frozenset(
+    {
+        CallState.COMPLETED,
+        CallState.BUSY,
+        CallState.CANCELLED,
+        CallState.FAILED,
+        CallState.REJECTED,
+        CallState.TIMEOUT,
+        CallState.UNANSWERED,
+    }
+)
+
+CallEvent = Union[dict, bytes, str]
+
+
+class CallLeg(NamedTuple):
+    """The state of a call leg, from the event webhooks received for it.
+
+    Args:
+        uuid (str): The unique identifier for the call leg.
+        conversation_uuid (str, optional): The unique identifier for the conversation
+            the leg is part of. Updated when the leg is transferred.
+        status (str, optional): The status of the call leg, e.g. 'answered'.
+        direction (str, optional): The direction of the call, 'inbound' or 'outbound'.
+        from_ (str, optional): The endpoint that made the call.
+        to (str, optional): The endpoint that received the call.
+        timestamp (str, optional): The time of the latest event applied to the leg.
+        duration (str, optional): The length of the call in seconds, once it has ended.
+    """
+
+    uuid: str
+    conversation_uuid: Optional[str] = None
+    status: Optional[str] = None
+    direction: Optional[str] = None
+    from_: Optional[str] = None
+    to: Optional[str] = None
+    timestamp: Optional[str] = None
+    duration: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the call leg hasn't ended yet."""
+        return self.status not in _ENDED_STATUSES
+
+
+def _decode_event(event: CallEvent) -> dict:
+    if isinstance(event, (bytes, str)):
+        try:
+            event = json.loads(event)
+        except ValueError as err:
+            raise VoiceError('The Voice event webhook body is not valid JSON.') from err
+    if not isinstance(event, dict):
+        raise VoiceError('A Voice event webhook body must be a JSON object.')
+    return event
+
+
+class CallStateTracker:
+    """Tracks the state of calls in memory, from the payloads of Voice event webhooks, so
+    it can be looked up without calling `Voice.get_call`.
+
+    Call legs are indexed by their UUID and by the UUID of their conversation. Events
+    are read from the decoded JSON directly, without being validated as models. Events
+    that arrive out of order don't overwrite newer state: an event is only applied if
+    its timestamp isn't older than the leg's, and a leg that has ended stays ended.
+
+    Legs are forgotten `completed_ttl` seconds after they end. Expired legs are removed
+    whenever the tracker is used, or by calling `expire`. If more than `max_calls` legs
+    are tracked, e.g. because the final events of some calls were never received, the
+    oldest are forgotten.
+
+    Args:
+        completed_ttl (float, optional): The number of seconds a leg is kept after it
+            ends.
+        max_calls (int, optional): The maximum number of legs to track.
+    """
+
+    def __init__(self, completed_ttl: float = 300, max_calls: int = 100000):
+        self._completed_ttl = completed_ttl
+        self._max_calls = max_calls
+        self._legs: dict[str, CallLeg] = {}
+        self._conversations: dict[str, dict[str, None]] = {}
+        self._ended: OrderedDict[str, float] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._legs)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._legs
+
+    def ingest(self, event: CallEvent) -> Optional[CallLeg]:
+        """Updates the tracker with an event webhook.
+
+        Call this from the handler for your event webhook, e.g. with `request.data` in
+        a handler for `vonage_voice.asgi.create_webhook_app`.
+
+        Args:
+            event (dict | bytes | str): The JSON body of the event webhook, or the dict
+                it decodes to.
+
+        Returns:
+            CallLeg: The state of the call leg after the event, or None if the event
+                isn't about a call leg.
+
+        Raises:
+            VoiceError: If the event isn't a JSON object.
+        """
+        event = _decode_event(event)
+        with self._lock:
+            leg = self._apply(event)
+            self._evict(monotonic())
+        return leg
+
+    def ingest_many(self, events: Iterable[CallEvent]) -> int:
+        """Updates the tracker with a batch of event webhooks, e.g. read from a queue.
+
+        Events are applied in the order given, holding the tracker's lock once for the
+        whole batch.
+
+        Args:
+            events (Iterable[dict | bytes | str]): The JSON bodies of the event
+                webhooks, or the dicts they decode to.
+
+        Returns:
+            int: The number of events that were about a call leg.
+
+        Raises:
+            VoiceError: If an event isn't a JSON object. No events in the batch are
+                applied.
+        """
+        decoded = [_decode_event(event) for event in events]
+        applied = 0
+        with self._lock:
+            for event in decoded:
+                if self._apply(event) is not None:
+                    applied += 1
+            self._evict(monotonic())
+        return applied
+
+    def get(self, uuid: str) -> Optional[CallLeg]:
+        """Gets the state of a call leg.
+
+        Args:
+            uuid (str): The UUID of the call leg.
+
+        Returns:
+            CallLeg: The state of the call leg, or None if it isn't tracked.
+        """
+        with self._lock:
+            self._evict(monotonic())
+            return self._legs.get(uuid)
+
+    def conversation_legs(self, conversation_uuid: str) -> list[CallLeg]:
+        """Gets the state of every tracked leg in a conversation.
+
+        Args:
+            conversation_uuid (str): The UUID of the conversation.
+
+        Returns:
+            list[CallLeg]: The legs, in the order they were first seen.
+        """
+        with self._lock:
+            self._evict(monotonic())
+            uuids = self._conversations.get(conversation_uuid, ())
+            return [self._legs[uuid] for uuid in uuids]
+
+    def active_legs(self, conversation_uuid: Optional[str] = None) -> list[CallLeg]:
+        """Gets the state of the legs that haven't ended.
+
+        Args:
+            conversation_uuid (str, optional): Only get the legs in this conversation.
+                By default, active legs in every conversation are returned.
+
+        Returns:
+            list[CallLeg]: The active legs, in the order they were first seen.
+        """
+        with self._lock:
+            self._evict(monotonic())
+            if conversation_uuid is None:
+                legs = self._legs.values()
+            else:
+                uuids = self._conversations.get(conversation_uuid, ())
+                legs = [self._legs[uuid] for uuid in uuids]
+            return [leg for leg in legs if leg.status not in _ENDED_STATUSES]
+
+    def expire(self) -> int:
+        """Forgets the legs that ended more than `completed_ttl` seconds ago.
+
+        Returns:
+            int: The number of legs forgotten.
+        """
+        with self._lock:
+            return self._evict(monotonic())
+
+    def clear(self) -> None:
+        """Forgets every tracked leg."""
+        with self._lock:
+            self._legs.clear()
+            self._conversations.clear()
+            self._ended.clear()
+
+    def _apply(self, event: dict) -> Optional[CallLeg]:
+        uuid = event.get('uuid')
+        if not uuid:
+            return None
+        status = event.get('status')
+        if status not in _STATUSES:
+            # E.g. 'human' from machine detection, which doesn't change the status
+            status = None
+        conversation_uuid = event.get('conversation_uuid_to') or event.get(
+            'conversation_uuid'
+        )
+        timestamp = event.get('timestamp')
+
+        leg = self._legs.get(uuid)
+        if leg is None:
+            leg = CallLeg(
+                uuid,
+                conversation_uuid,
+                status,
+                event.get('direction'),
+                event.get('from'),
+                event.get('to'),
+                timestamp,
+                event.get('duration'),
+            )
+            self._legs[uuid] = leg
+        else:
+            stale = (
+                timestamp is not None
+                and leg.timestamp is not None
+                and timestamp < leg.timestamp
+            )
+            if stale or leg.status in _ENDED_STATUSES:
+                # Only fill in what isn't known yet
+                status = leg.status or status
+                conversation_uuid = leg.conversation_uuid or conversation_uuid
+                timestamp = leg.timestamp or timestamp
+            previous = leg
+            leg = CallLeg(
+                uuid,
+                conversation_uuid or leg.conversation_uuid,
+                status or leg.status,
+                leg.direction or event.get('direction'),
+                leg.from_ or event.get('from'),
+                leg.to or event.get('to'),
+                timestamp or leg.timestamp,
+                event.get('duration') or leg.duration,
+            )
+            self._legs[uuid] = leg
+            if previous.conversation_uuid != leg.conversation_uuid:
+                self._unindex(previous)
+            elif previous.status in _ENDED_STATUSES:
+                return leg
+
+        if leg.conversation_uuid is not None:
+            self._conversations.setdefault(leg.conversation_uuid, {})[uuid] = None
+        if leg.status in _ENDED_STATUSES and uuid not in self._ended:
+            self._ended[uuid] = monotonic() + self._completed_ttl
+        return leg
+
+    def _unindex(self, leg: CallLeg) -> None:
+        uuids = self._conversations.get(leg.conversation_uuid)
+        if uuids is not None:
+            uuids.pop(leg.uuid, None)
+            if not uuids:
+                del self._conversations[leg.conversation_uuid]
+
+    def _remove(self, uuid: str) -> None:
+        leg = self._legs.pop(uuid, None)
+        self._ended.pop(uuid, None)
+        if leg is not None:
+            self._unindex(leg)
+
+    def _evict(self, now: float) -> int:
+        evicted = 0
+        while self._ended:
+            uuid, expires_at = next(iter(self._ended.items()))
+            if expires_at > now:
+                break
+            self._remove(uuid)
+            evicted += 1
+        while len(self._legs) > self._max_calls:
+            # Ended legs are forgotten first, then the legs that were seen first
+            self._remove(next(iter(self._ended or self._legs)))
+            evicted += 1
+        return evicted
@@ -0,0 +1,207 @@
+from concurrent.futures import ThreadPoolExecutor
+from math import ceil
+from queue import Queue
+from threading import Event, Lock, Semaphore, Thread
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from pydantic import BaseModel
+
+from .models.requests import CreateCallRequest
+from .models.responses import CreateCallResponse
+
+CallResult = Union[CreateCallResponse, Exception]
+
+# Put on the results queue by the dispatcher when no more calls will be made
+_DISPATCH_DONE = object()
+
+
+class CampaignStats(BaseModel):
+    """Statistics for the calls made by a `CallCampaign`.
+
+    Args:
+        dialled (int): The number of calls requested so far.
+        succeeded (int): The number of calls created.
+        failed (int): The number of requests that raised an error.
+        achieved_cps (float, optional): The rate calls were requested at, in calls per
+            second. Set once two calls have been requested.
+        latency_p50 (float, optional): The median time taken to create a call, in seconds.
+        latency_p90 (float, optional): The 90th percentile of the time taken to create a
+            call, in seconds.
+        latency_p99 (float, optional): The 99th percentile of the time taken to create a
+            call, in seconds.
+    """
+
+    dialled: int
+    succeeded: int
+    failed: int
+    achieved_cps: Optional[float] = None
+    latency_p50: Optional[float] = None
+    latency_p90: Optional[float] = None
+    latency_p99: Optional[float] = None
+
+
+def _percentile(ordered: list[float], percent: float) -> Optional[float]:
+    if not ordered:
+        return None
+    return ordered[max(ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+class CallCampaign:
+    """Creates calls at a steady rate, and yields the result of each as it completes.
+
+    Calls are started on a fixed schedule, `1 / cps` seconds apart, by a background
+    thread, so the rate doesn't depend on how quickly results are consumed. If the
+    maximum number of requests are in flight, the schedule waits and resumes from the
+    time a request completes, rather than making a burst of calls to catch up.
+
+    Iterate over the campaign to get each `(request, result)` pair. Results are yielded
+    in the order requests complete, and errors are yielded rather than raised, so one
+    failed call doesn't stop the campaign. Create campaigns with `Voice.create_calls`.
+
+    Args:
+        create_call (Callable): Creates a call from a request.
+        calls (Iterable[CreateCallRequest]): The calls to make. Read as they're needed,
+            so this can be a generator.
+        cps (float): The number of calls to create per second.
+        max_in_flight (int): The maximum number of requests in progress at once.
+    """
+
+    def __init__(
+        self,
+        create_call: Callable[[CreateCallRequest], CreateCallResponse],
+        calls: Iterable[CreateCallRequest],
+        cps: float,
+        max_in_flight: int,
+    ):
+        self._create_call = create_call
+        self._calls = iter(calls)
+        self._interval = 1 / cps
+        self._slots = Semaphore(max_in_flight)
+        self._results: Queue = Queue()
+        self._cancelled = Event()
+        self._lock = Lock()
+        self._latencies: list[float] = []
+        self._dialled = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._first_dialled_at: Optional[float] = None
+        self._last_dialled_at: Optional[float] = None
+        self._yielded = 0
+        self._total: Optional[int] = None
+        self._error: Optional[Exception] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        self._dispatcher = Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the campaign has been cancelled."""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stops making new calls. Requests already in flight complete, and their results
+        are still yielded."""
+        self._cancelled.set()
+
+    def stats(self) -> CampaignStats:
+        """Gets statistics for the calls made so far.
+
+        Returns:
+            CampaignStats: The number of calls made, the rate they were made at and the
+                time taken to create them.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            achieved_cps = None
+            if self._dialled > 1 and self._last_dialled_at > self._first_dialled_at:
+                achieved_cps = (self._dialled - 1) / (
+                    self._last_dialled_at - self._first_dialled_at
+                )
+            return CampaignStats(
+                dialled=self._dialled,
+                succeeded=self._succeeded,
+                failed=self._failed,
+                achieved_cps=achieved_cps,
+                latency_p50=_percentile(latencies, 50),
+                latency_p90=_percentile(latencies, 90),
+                latency_p99=_percentile(latencies, 99),
+            )
+
+    def __iter__(self) -> Iterator[tuple[CreateCallRequest, CallResult]]:
+        return self
+
+    def __next__(self) -> tuple[CreateCallRequest, CallResult]:
+        while self._total is None or self._yielded < self._total:
+            item = self._results.get()
+            if item is _DISPATCH_DONE:
+                continue
+            self._yielded += 1
+            return item
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+        raise StopIteration
+
+    def __enter__(self) -> 'CallCampaign':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cancel()
+
+    def _dispatch(self) -> None:
+        dialled = 0
+        try:
+            next_call_at = perf_counter()
+            while not self._cancelled.is_set():
+                # Wait for a request to complete if the maximum are in flight
+                if not self._slots.acquire(timeout=0.1):
+                    continue
+                try:
+                    call = next(self._calls)
+                except StopIteration:
+                    self._slots.release()
+                    break
+                now = perf_counter()
+                if next_call_at > now:
+                    if self._wait(next_call_at - now):
+                        self._slots.release()
+                        break
+                    now = perf_counter()
+                else:
+                    next_call_at = now
+                next_call_at += self._interval
+                with self._lock:
+                    self._dialled += 1
+                    if self._first_dialled_at is None:
+                        self._first_dialled_at = now
+                    self._last_dialled_at = now
+                self._executor.submit(self._dial, call)
+                dialled += 1
+        except Exception as err:
+            # Raised once the results of the calls already made have been yielded
+            self._error = err
+        finally:
+            self._executor.shutdown(wait=False)
+            self._total = dialled
+            self._results.put(_DISPATCH_DONE)
+
+    def _wait(self, timeout: float) -> bool:
+        # Waits until the next call is due, returning whether the campaign was cancelled
+        return self._cancelled.wait(timeout)
+
+    def _dial(self, call: CreateCallRequest) -> None:
+        start = perf_counter()
+        try:
+            result = self._create_call(call)
+        except Exception as err:
+            result = err
+        latency = perf_counter() - start
+        with self._lock:
+            self._latencies.append(latency)
+            if isinstance(result, Exception):
+                self._failed += 1
+            else:
+                self._succeeded += 1
+        self._slots.release()
+        self._results.put((call, result))
@@ -0,0 +1,202 @@
+import json
+import re
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+from pydantic import validate_call
+from pydantic_core import core_schema, to_json
+from vonage_voice.errors import NccoActionError
+from vonage_voice.models.ncco import NccoAction
+
+# A slot is written as `{{name}}`, or `{{name|url}}` to percent-encode its value
+_SLOT_PATTERN = re.compile(rb'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*(?:\|\s*(\w+)\s*)?\}\}')
+
+_FILTERS: dict[str, Callable[[str], str]] = {'url': lambda value: quote(value, safe='')}
+
+
+def _encode_slot_value(value: Any, filter_name: Optional[str]) -> bytes:
+    text = str(value)
+    if filter_name is not None:
+        text = _FILTERS[filter_name](text)
+    # Slots are inside JSON strings, so values are escaped as string contents
+    return json.dumps(text)[1:-1].encode()
+
+
+class CompiledNcco:
+    """An NCCO that has been validated and encoded as JSON once, so it can be sent many
+    times without being rebuilt.
+
+    String fields can contain slots, written as `{{name}}`, which are filled in each time
+    the NCCO is rendered. Values are escaped for JSON, and slots written as `{{name|url}}`
+    are also percent-encoded, e.g. for a query parameter in an `eventUrl`.
+
+    Create compiled NCCOs with `compile_ncco`, or `NccoTemplates` to cache them.
+    """
+
+    __slots__ = ('_literals', '_slots')
+
+    def __init__(
+        self, literals: tuple[bytes, ...], slots: tuple[tuple[str, Optional[str]], ...]
+    ):
+        # The encoded JSON is literals[0] + slot 0 + literals[1] + ... + literals[-1]
+        self._literals = literals
+        self._slots = slots
+
+    @property
+    def slots(self) -> tuple[str, ...]:
+        """The names of the slots that must be filled in to render the NCCO."""
+        return tuple(dict.fromkeys(name for name, _ in self._slots))
+
+    def render(self, **values: Any) -> bytes:
+        """Renders the NCCO as JSON, filling in its slots.
+
+        Args:
+            **values: The value of each slot. Values are converted to strings.
+
+        Returns:
+            bytes: The NCCO as UTF-8 encoded JSON, to return from an answer webhook.
+
+        Raises:
+            NccoActionError: If a value is missing for a slot, or given for a slot the
+                NCCO doesn't have.
+        """
+        if not self._slots:
+            if values:
+                raise self._unknown_slots(values)
+            return self._literals[0]
+        self._check_values(values, require_all=True)
+        parts = [self._literals[0]]
+        for (name, filter_name), literal in zip(self._slots, self._literals[1:]):
+            parts.append(_encode_slot_value(values[name], filter_name))
+            parts.append(literal)
+        return b''.join(parts)
+
+    def bind(self, **values: Any) -> 'CompiledNcco':
+        """Fills in some of the NCCO's slots.
+
+        Args:
+            **values: The value of each slot to fill in.
+
+        Returns:
+            CompiledNcco: A copy of the NCCO with the slots filled in.
+
+        Raises:
+            NccoActionError: If a value is given for a slot the NCCO doesn't have.
+        """
+        self._check_values(values, require_all=False)
+        literals = [self._literals[0]]
+        slots = []
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            name, filter_name = slot
+            if name in values:
+                literals[-1] += _encode_slot_value(values[name], filter_name) + literal
+            else:
+                slots.append(slot)
+                literals.append(literal)
+        return CompiledNcco(tuple(literals), tuple(slots))
+
+    def __bytes__(self) -> bytes:
+        return self.render()
+
+    def __repr__(self) -> str:
+        return f'CompiledNcco(slots={self.slots!r})'
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(cls)
+
+    def _check_values(self, values: dict[str, Any], require_all: bool) -> None:
+        slots = self.slots
+        unknown = values.keys() - set(slots)
+        if unknown:
+            raise self._unknown_slots(unknown)
+        if require_all:
+            missing = [name for name in slots if name not in values]
+            if missing:
+                raise NccoActionError(
+                    f'No value was given for the NCCO slots: {", ".join(missing)}.'
+                )
+
+    def _unknown_slots(self, names) -> NccoActionError:
+        return NccoActionError(
+            f'The NCCO has no slots named: {", ".join(sorted(names))}.'
+        )
+
+
+@validate_call
+def compile_ncco(ncco: list[NccoAction]) -> CompiledNcco:
+    """Validates an NCCO and encodes it as JSON, finding any slots in its string fields.
+
+    Args:
+        ncco (list[NccoAction]): The NCCO actions. Slots are written as `{{name}}`, e.g.
+            `Talk(text='Hello {{caller_name}}')`, or `{{name|url}}` for values that should
+            be percent-encoded.
+
+    Returns:
+        CompiledNcco: The compiled NCCO.
+
+    Raises:
+        NccoActionError: If a slot has an unknown filter.
+    """
+    encoded = to_json(ncco, by_alias=True, exclude_none=True)
+    literals = []
+    slots = []
+    position = 0
+    for match in _SLOT_PATTERN.finditer(encoded):
+        filter_name = match.group(2).decode() if match.group(2) else None
+        if filter_name is not None and filter_name not in _FILTERS:
+            raise NccoActionError(
+                f'Unknown NCCO slot filter "{filter_name}". Supported filters: '
+                f'{", ".join(_FILTERS)}.'
+            )
+        literals.append(encoded[position : match.start()])
+        slots.append((match.group(1).decode(), filter_name))
+        position = match.end()
+    literals.append(encoded[position:])
+    return CompiledNcco(tuple(literals), tuple(slots))
+
+
+class NccoTemplates:
+    """A cache of compiled NCCOs, so answer webhook handlers build and compile each NCCO
+    once.
+
+    Args:
+        max_templates (int, optional): The maximum number of compiled NCCOs cached. The
+            least recently used are removed first.
+    """
+
+    def __init__(self, max_templates: int = 1024):
+        self._max_templates = max_templates
+        self._templates: OrderedDict[str, CompiledNcco] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, name: str, build: Callable[[], list[NccoAction]]) -> CompiledNcco:
+        """Gets a compiled NCCO, building and compiling it if it's not cached.
+
+        Args:
+            name (str): The name the NCCO is cached under.
+            build (Callable[[], list[NccoAction]]): Builds the NCCO. Only called if it's
+                not cached.
+
+        Returns:
+            CompiledNcco: The compiled NCCO.
+        """
+        with self._lock:
+            compiled = self._templates.get(name)
+            if compiled is not None:
+                self._templates.move_to_end(name)
+                return compiled
+        compiled = compile_ncco(build())
+        with self._lock:
+            self._templates[name] = compiled
+            self._templates.move_to_end(name)
+            while len(self._templates) > self._max_templates:
+                self._templates.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Removes every compiled NCCO."""
+        with self._lock:
+            self._templates.clear()
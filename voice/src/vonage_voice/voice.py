@@ -1,11 +1,25 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Annotated, Callable, Iterable, Optional, TypeVar, Union
 
-from pydantic import validate_call
+from pydantic import Field, validate_call
+from pydantic_core import to_json
 from vonage_http_client.http_client import HttpClient
+from vonage_http_client.trusted import validate_call_unless_trusted
 from vonage_jwt.verify_jwt import verify_signature
+from vonage_utils.response_modes import ResponseMode, build_models, detach_items
 from vonage_utils.types import Dtmf
+from vonage_voice.call_export import (
+    CallRecordSink,
+    export_shards,
+    open_call_record_sink,
+    parse_timestamp,
+    shard_time_window,
+)
+from vonage_voice.dialler import CallCampaign
 from vonage_voice.errors import VoiceError
 from vonage_voice.models.ncco import NccoAction
+from vonage_voice.ncco_compiler import CompiledNcco
 
 from .models.requests import (
     AudioStreamOptions,
@@ -15,6 +29,8 @@ from .models.requests import (
 )
 from .models.responses import CallInfo, CallList, CallMessage, CreateCallResponse
 
+ResultT = TypeVar('ResultT')
+
 
 class Voice:
     """Calls Vonage's Voice API."""
@@ -31,7 +47,7 @@ class Voice:
         """
         return self._http_client
 
-    @validate_call
+    @validate_call_unless_trusted
     def create_call(self, params: CreateCallRequest) -> CreateCallResponse:
         """Creates a new call using the Vonage Voice API.
 
@@ -44,19 +60,52 @@ class Voice:
         response = self._http_client.post(
             self._http_client.api_host,
             '/v1/calls',
-            params.model_dump(by_alias=True, exclude_none=True),
+            to_json(params, by_alias=True, exclude_none=True),
         )
 
         return CreateCallResponse(**response)
 
+    @validate_call
+    def create_calls(
+        self,
+        calls: Iterable[CreateCallRequest],
+        cps: Annotated[float, Field(gt=0)],
+        max_in_flight: Annotated[int, Field(ge=1)] = 10,
+    ) -> CallCampaign:
+        """Creates many calls, paced to a number of calls per second, e.g. for a
+        dialling campaign.
+
+        Calls start being made in the background as soon as this returns. Iterate over the
+        campaign to get the result of each call as it completes, call `cancel` to stop
+        making new calls, and call `stats` to get the rate achieved and the time taken to
+        create calls. Leaving a `with` block for the campaign cancels it.
+
+        Args:
+            calls (Iterable[CreateCallRequest]): The calls to make. Read as they're
+                needed, so this can be a generator.
+            cps (float): The number of calls to create per second. Set this to your
+                account's calls per second limit, or lower.
+            max_in_flight (int, optional): The maximum number of requests in progress at
+                once.
+
+        Returns:
+            CallCampaign: Yields each request with its `CreateCallResponse`, or the error
+                raised for it.
+        """
+        return CallCampaign(self.create_call, calls, cps, max_in_flight)
+
     @validate_call
     def list_calls(
-        self, filter: ListCallsFilter = ListCallsFilter()
+        self,
+        filter: ListCallsFilter = ListCallsFilter(),
+        response_mode: ResponseMode = 'model',
     ) -> tuple[list[CallInfo], Optional[int]]:
         """Lists calls made with the Vonage Voice API.
 
         Args:
             filter (ListCallsFilter): The parameters to filter the list of calls.
+            response_mode (ResponseMode, optional): How the calls are returned: 'model'
+                (the default), 'lazy', 'raw' or 'compact'. See `ResponseMode`.
 
         Returns:
             tuple[list[CallInfo], Optional[int]] A tuple containing a list of `CallInfo` objects and the
@@ -69,11 +118,82 @@ class Voice:
             filter.model_dump(by_alias=True, exclude_none=True),
         )
 
-        list_response = CallList(**response)
+        if response_mode == 'model':
+            list_response = CallList(**response)
+            calls = list_response.embedded.calls
+        else:
+            items = detach_items(response, '_embedded', 'calls')
+            list_response = CallList(**response)
+            calls = build_models(items, CallInfo, response_mode)
+
         if list_response.links.next is None:
-            return list_response.embedded.calls, None
+            return calls, None
         next_page_index = list_response.record_index + 1
-        return list_response.embedded.calls, next_page_index
+        return calls, next_page_index
+
+    def export_calls(
+        self,
+        date_start: Union[str, datetime],
+        date_end: Union[str, datetime],
+        sink: Union[str, CallRecordSink],
+        shards: int = 4,
+        max_workers: int = 4,
+        batch_size: int = 10000,
+    ) -> int:
+        """Exports every call in a time window as flattened records, e.g. for billing
+        reconciliation.
+
+        The window is split into shards that are fetched in parallel, and records are
+        written to the sink in batches, so memory use doesn't depend on the number of
+        calls. The columns are listed in `vonage_voice.call_export.CALL_RECORD_COLUMNS`.
+
+        Args:
+            date_start (str | datetime): The start of the window, e.g.
+                '2024-03-01T00:00:00Z'. Naive datetimes are treated as UTC.
+            date_end (str | datetime): The end of the window.
+            sink (str | CallRecordSink): A file path, written as Parquet if it ends in
+                '.parquet' (requires `pyarrow`) and as CSV otherwise, or a sink object to
+                write records to. Sinks passed in aren't closed.
+            shards (int, optional): The number of time windows to split the export into.
+            max_workers (int, optional): The number of shards fetched at the same time.
+            batch_size (int, optional): The number of records written to the sink at a
+                time.
+
+        Returns:
+            int: The number of call records exported.
+
+        Raises:
+            VoiceError: If the arguments are invalid, or a Parquet file is requested and
+                `pyarrow` isn't installed.
+        """
+        start, end = parse_timestamp(date_start), parse_timestamp(date_end)
+        if end < start:
+            raise VoiceError('"date_end" must not be before "date_start".')
+        if min(shards, max_workers, batch_size) < 1:
+            raise VoiceError(
+                '"shards", "max_workers" and "batch_size" must be at least 1.'
+            )
+
+        def fetch_page(
+            shard_start: str, shard_end: str, record_index: int
+        ) -> tuple[list[dict], bool]:
+            calls, next_page = self.list_calls(
+                ListCallsFilter(
+                    date_start=shard_start,
+                    date_end=shard_end,
+                    page_size=100,
+                    record_index=record_index,
+                    order='asc',
+                ),
+                response_mode='raw',
+            )
+            return calls, next_page is not None
+
+        windows = shard_time_window(start, end, shards)
+        if not isinstance(sink, str):
+            return export_shards(fetch_page, windows, sink, batch_size, max_workers)
+        with open_call_record_sink(sink) as file_sink:
+            return export_shards(fetch_page, windows, file_sink, batch_size, max_workers)
 
     @validate_call
     def get_call(self, call_id: str) -> CallInfo:
@@ -92,24 +212,29 @@ class Voice:
         return CallInfo(**response)
 
     @validate_call
-    def transfer_call_ncco(self, uuid: str, ncco: list[NccoAction]) -> None:
+    def transfer_call_ncco(
+        self, uuid: str, ncco: Union[list[NccoAction], CompiledNcco]
+    ) -> None:
         """Transfers a call to a new NCCO.
 
         Args:
             uuid (str): The UUID of the call to transfer.
-            ncco (list[NccoAction]): The new NCCO to transfer the call to.
+            ncco (list[NccoAction] | CompiledNcco): The new NCCO to transfer the call to.
+                A compiled NCCO must have all its slots filled in, e.g. with `bind`.
         """
-        serializable_ncco = [
-            action.model_dump(by_alias=True, exclude_none=True) for action in ncco
-        ]
-        self._http_client.put(
-            self._http_client.api_host,
-            f'/v1/calls/{uuid}',
-            {
-                'action': 'transfer',
-                'destination': {'type': 'ncco', 'ncco': serializable_ncco},
-            },
-        )
+        if isinstance(ncco, CompiledNcco):
+            body = (
+                b'{"action":"transfer","destination":{"type":"ncco","ncco":'
+                + ncco.render()
+                + b'}}'
+            )
+        else:
+            body = to_json(
+                {'action': 'transfer', 'destination': {'type': 'ncco', 'ncco': ncco}},
+                by_alias=True,
+                exclude_none=True,
+            )
+        self._http_client.put(self._http_client.api_host, f'/v1/calls/{uuid}', body)
 
     @validate_call
     def transfer_call_answer_url(self, uuid: str, answer_url: str) -> None:
@@ -175,6 +300,57 @@ class Voice:
             self._http_client.api_host, f'/v1/calls/{uuid}', {'action': 'unearmuff'}
         )
 
+    @validate_call
+    def hangup_many(
+        self, uuids: list[str], concurrency: Optional[Annotated[int, Field(ge=1)]] = None
+    ) -> dict[str, Optional[Exception]]:
+        """Ends many calls at once, e.g. every leg of a conference.
+
+        Args:
+            uuids (list[str]): The UUIDs of the calls to end.
+            concurrency (int, optional): The maximum number of requests in progress at
+                once. Defaults to the size of the HTTP client's connection pool.
+
+        Returns:
+            dict[str, Exception | None]: The error raised for each UUID, e.g. a
+                `VonageError` or a connection error, or None if the call was ended.
+        """
+        return self._control_calls(uuids, 'hangup', concurrency)
+
+    @validate_call
+    def mute_many(
+        self, uuids: list[str], concurrency: Optional[Annotated[int, Field(ge=1)]] = None
+    ) -> dict[str, Optional[Exception]]:
+        """Mutes many calls at once.
+
+        Args:
+            uuids (list[str]): The UUIDs of the calls to mute.
+            concurrency (int, optional): The maximum number of requests in progress at
+                once. Defaults to the size of the HTTP client's connection pool.
+
+        Returns:
+            dict[str, Exception | None]: The error raised for each UUID, e.g. a
+                `VonageError` or a connection error, or None if the call was muted.
+        """
+        return self._control_calls(uuids, 'mute', concurrency)
+
+    @validate_call
+    def earmuff_many(
+        self, uuids: list[str], concurrency: Optional[Annotated[int, Field(ge=1)]] = None
+    ) -> dict[str, Optional[Exception]]:
+        """Earmuffs many calls at once (prevents them from hearing audio).
+
+        Args:
+            uuids (list[str]): The UUIDs of the calls to earmuff.
+            concurrency (int, optional): The maximum number of requests in progress at
+                once. Defaults to the size of the HTTP client's connection pool.
+
+        Returns:
+            dict[str, Exception | None]: The error raised for each UUID, e.g. a
+                `VonageError` or a connection error, or None if the call was earmuffed.
+        """
+        return self._control_calls(uuids, 'earmuff', concurrency)
+
     @validate_call
     def play_audio_into_call(
         self, uuid: str, audio_stream_options: AudioStreamOptions
@@ -191,11 +367,41 @@ class Voice:
         response = self._http_client.put(
             self._http_client.api_host,
             f'/v1/calls/{uuid}/stream',
-            audio_stream_options.model_dump(by_alias=True, exclude_none=True),
+            to_json(audio_stream_options, by_alias=True, exclude_none=True),
         )
 
         return CallMessage(**response)
 
+    @validate_call
+    def play_audio_into_calls(
+        self,
+        uuids: list[str],
+        audio_stream_options: AudioStreamOptions,
+        concurrency: Optional[Annotated[int, Field(ge=1)]] = None,
+    ) -> dict[str, Union[CallMessage, Exception]]:
+        """Plays an audio stream into many calls at once.
+
+        Args:
+            uuids (list[str]): The UUIDs of the calls to stream audio into.
+            audio_stream_options (AudioStreamOptions): The options for streaming audio.
+            concurrency (int, optional): The maximum number of requests in progress at
+                once. Defaults to the size of the HTTP client's connection pool.
+
+        Returns:
+            dict[str, CallMessage | Exception]: The response for each UUID, or the error
+                raised for it, e.g. a `VonageError` or a connection error.
+        """
+        body = to_json(audio_stream_options, by_alias=True, exclude_none=True)
+        return self._for_each_call(
+            uuids,
+            lambda uuid: CallMessage(
+                **self._http_client.put(
+                    self._http_client.api_host, f'/v1/calls/{uuid}/stream', body
+                )
+            ),
+            concurrency,
+        )
+
     def stop_audio_stream(self, uuid: str) -> CallMessage:
         """Stops streaming audio into a call.
 
@@ -225,11 +431,42 @@ class Voice:
         response = self._http_client.put(
             self._http_client.api_host,
             f'/v1/calls/{uuid}/talk',
-            tts_options.model_dump(by_alias=True, exclude_none=True),
+            to_json(tts_options, by_alias=True, exclude_none=True),
         )
 
         return CallMessage(**response)
 
+    @validate_call
+    def play_tts_into_calls(
+        self,
+        uuids: list[str],
+        tts_options: TtsStreamOptions,
+        concurrency: Optional[Annotated[int, Field(ge=1)]] = None,
+    ) -> dict[str, Union[CallMessage, Exception]]:
+        """Plays text-to-speech into many calls at once, e.g. an announcement to every
+        leg of a conference.
+
+        Args:
+            uuids (list[str]): The UUIDs of the calls to play text-to-speech into.
+            tts_options (TtsStreamOptions): The options for playing text-to-speech.
+            concurrency (int, optional): The maximum number of requests in progress at
+                once. Defaults to the size of the HTTP client's connection pool.
+
+        Returns:
+            dict[str, CallMessage | Exception]: The response for each UUID, or the error
+                raised for it, e.g. a `VonageError` or a connection error.
+        """
+        body = to_json(tts_options, by_alias=True, exclude_none=True)
+        return self._for_each_call(
+            uuids,
+            lambda uuid: CallMessage(
+                **self._http_client.put(
+                    self._http_client.api_host, f'/v1/calls/{uuid}/talk', body
+                )
+            ),
+            concurrency,
+        )
+
     def stop_tts(self, uuid: str) -> CallMessage:
         """Stops playing text-to-speech into a call.
 
@@ -294,3 +531,39 @@ class Voice:
             VonageVerifyJwtError: The signature could not be verified.
         """
         return verify_signature(token, signature)
+
+    def _control_calls(
+        self, uuids: list[str], action: str, concurrency: Optional[int]
+    ) -> dict[str, Optional[Exception]]:
+        body = {'action': action}
+
+        def control(uuid: str) -> None:
+            self._http_client.put(self._http_client.api_host, f'/v1/calls/{uuid}', body)
+
+        return self._for_each_call(uuids, control, concurrency)
+
+    def _for_each_call(
+        self,
+        uuids: list[str],
+        request: Callable[[str], ResultT],
+        concurrency: Optional[int],
+    ) -> dict[str, Union[ResultT, Exception]]:
+        """Makes a request for each call concurrently. The requests share the HTTP
+        client's connection pool, so by default there's one worker per pooled connection
+        and requests don't wait for a connection to be opened. Any error a request raises
+        is returned as its call's result, so one failed call doesn't lose the others.
+        """
+
+        def call(uuid: str) -> Union[ResultT, Exception]:
+            try:
+                return request(uuid)
+            except Exception as err:
+                return err
+
+        uuids = list(dict.fromkeys(uuids))
+        if not uuids:
+            return {}
+        if concurrency is None:
+            concurrency = self._http_client.connection_pool.pool_maxsize
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(uuids))) as executor:
+            return dict(zip(uuids, executor.map(call, uuids)))
@@ -0,0 +1,181 @@
+import asyncio
+import json
+from hashlib import sha256
+
+from jwt import encode
+from vonage_voice.asgi import WebhookRequest, create_webhook_app
+from vonage_voice.models.ncco import Talk
+from vonage_voice.ncco_compiler import compile_ncco
+
+SECRET = 'signature_secret_for_tests_1234567890'
+
+events = []
+
+ANSWER = compile_ncco([Talk(text='Hello {{from_number}}')])
+
+
+async def answer(request: WebhookRequest):
+    return ANSWER.render(from_number=request.data['from'])
+
+
+async def event(request: WebhookRequest):
+    events.append(request.data)
+
+
+async def fallback(request: WebhookRequest):
+    return [Talk(text='Sorry, something went wrong.')]
+
+
+def call_app(app, method, path, body=b'', query=b'', headers=None, chunk_size=None):
+    chunks = [body]
+    if chunk_size:
+        chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+    messages = [
+        {'type': 'http.request', 'body': chunk, 'more_body': i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query,
+        'headers': headers or [],
+    }
+    asyncio.run(app(scope, receive, send))
+    return sent[0]['status'], dict(sent[0]['headers']), sent[1]['body']
+
+
+def signed_headers(body: bytes, secret: str = SECRET, **claims) -> list:
+    token = encode(
+        {'application_id': 'app', 'payload_hash': sha256(body).hexdigest(), **claims},
+        secret,
+        algorithm='HS256',
+    )
+    return [(b'authorization', f'Bearer {token}'.encode())]
+
+
+app = create_webhook_app(answer=answer, event=event, fallback=fallback)
+
+
+def test_answer_webhook():
+    status, headers, body = call_app(
+        app, 'GET', '/webhooks/answer', query=b'from=447700900000&uuid=abc'
+    )
+    assert status == 200
+    assert headers[b'content-type'] == b'application/json'
+    assert int(headers[b'content-length']) == len(body)
+    assert json.loads(body) == [{'text': 'Hello 447700900000', 'action': 'talk'}]
+
+    status, _, body = call_app(
+        app, 'POST', '/webhooks/answer', body=b'{"from": "447700900001"}', chunk_size=7
+    )
+    assert status == 200
+    assert json.loads(body)[0]['text'] == 'Hello 447700900001'
+
+
+def test_event_and_fallback_webhooks():
+    events.clear()
+    status, _, body = call_app(
+        app, 'POST', '/webhooks/event', body=b'{"status": "answered", "uuid": "abc"}'
+    )
+    assert status == 204
+    assert body == b''
+    assert events == [{'status': 'answered', 'uuid': 'abc'}]
+
+    status, _, body = call_app(app, 'POST', '/webhooks/fallback', body=b'{}')
+    assert status == 200
+    assert json.loads(body)[0]['text'] == 'Sorry, something went wrong.'
+
+
+def test_routing_errors():
+    assert call_app(app, 'GET', '/unknown')[0] == 404
+    assert call_app(app, 'DELETE', '/webhooks/answer')[0] == 405
+
+    small_app = create_webhook_app(event=event, max_body_size=10)
+    assert call_app(small_app, 'POST', '/webhooks/event', body=b'x' * 20)[0] == 413
+    assert call_app(small_app, 'GET', '/webhooks/answer')[0] == 404
+
+
+def test_client_disconnect():
+    received = []
+
+    async def handler(request):
+        received.append(request.body)
+
+    messages = [
+        {'type': 'http.request', 'body': b'{"status":', 'more_body': True},
+        {'type': 'http.disconnect'},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': '/webhooks/event', 'headers': []}
+    asyncio.run(create_webhook_app(event=handler)(scope, receive, send))
+    # The partial body isn't handled, and no response is sent
+    assert received == []
+    assert sent == []
+
+
+def test_handler_error(caplog):
+    async def broken(request):
+        raise ValueError('broken')
+
+    broken_app = create_webhook_app(answer=broken)
+    status, _, body = call_app(broken_app, 'GET', '/webhooks/answer')
+    assert status == 500
+    assert json.loads(body) == {'title': 'Internal Server Error'}
+    assert 'Error handling the Voice answer webhook.' in caplog.text
+
+
+def test_signed_webhooks():
+    received = []
+
+    async def handler(request):
+        received.append(request.claims)
+
+    signed_app = create_webhook_app(event=handler, signature_secret=SECRET)
+    body = b'{"status": "completed"}'
+
+    def status(headers=None):
+        return call_app(signed_app, 'POST', '/webhooks/event', body, headers=headers)[0]
+
+    assert status(signed_headers(body)) == 204
+    assert received[0]['application_id'] == 'app'
+
+    # Unsigned, signed with another secret, or signed for another body
+    assert status() == 401
+    assert status(signed_headers(body, 'another_signature_secret_1234567890')) == 401
+    assert status(signed_headers(b'{"status": "answered"}')) == 401
+    # Expired, malformed, or with a payload hash that isn't a string
+    assert status(signed_headers(body, exp=1)) == 401
+    assert status([(b'authorization', b'Bearer not.a.jwt')]) == 401
+    assert status(signed_headers(body, payload_hash=[1])) == 401
+    assert status(signed_headers(body, payload_hash='\u00e9')) == 401
+    assert len(received) == 1
+
+
+def test_lifespan():
+    messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message['type'])
+
+    asyncio.run(app({'type': 'lifespan'}, receive, send))
+    assert sent == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
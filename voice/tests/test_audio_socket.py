@@ -0,0 +1,236 @@
+import asyncio
+import json
+from os import urandom
+
+from vonage_voice.audio_socket import (
+    AudioCall,
+    AudioFrameRing,
+    AudioSocketMetadata,
+    AudioSocketServer,
+    _encode_frame,
+    _read_frame,
+)
+
+FRAME_SIZE = 640
+
+METADATA = {
+    'event': 'websocket:connected',
+    'content-type': 'audio/l16;rate=16000',
+    'caller': '447700900000',
+}
+
+
+async def connect(port: int, metadata: dict = METADATA):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        b'GET /socket HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n'
+        b'Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n'
+        b'Sec-WebSocket-Version: 13\r\n\r\n'
+    )
+    response = await reader.readuntil(b'\r\n\r\n')
+    assert response.startswith(b'HTTP/1.1 101')
+    assert b'Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=' in response
+    writer.write(_encode_frame(0x1, json.dumps(metadata).encode(), urandom(4)))
+    return reader, writer
+
+
+def send(writer, opcode: int, payload: bytes, fin: bool = True) -> None:
+    writer.write(_encode_frame(opcode, payload, urandom(4), fin))
+
+
+async def read_close_code(reader) -> int:
+    while True:
+        _, opcode, payload, _ = await asyncio.wait_for(_read_frame(reader, 1 << 20), 2)
+        if opcode == 0x8:
+            return int.from_bytes(payload[:2], 'big')
+
+
+def test_metadata():
+    metadata = AudioSocketMetadata.model_validate(METADATA)
+    assert metadata.sample_rate == 16000
+    assert metadata.headers == {'caller': '447700900000'}
+    assert AudioSocketMetadata(content_type='audio/l16;rate=8000').sample_rate == 8000
+
+
+def test_frame_ring():
+    ring = AudioFrameRing(4, 3)
+    for value in (1, 2, 3):
+        slot = ring.reserve()
+        if slot is None:
+            ring.dropped += 1
+            continue
+        slot[:] = bytes([value]) * 4
+        ring.commit()
+    # One slot is kept for the frame being read, so the third frame is dropped
+    assert len(ring) == 2
+    assert ring.dropped == 1
+
+    first = ring.pop()
+    assert bytes(first) == b'\x01' * 4
+    ring.reserve()[:] = b'\x04' * 4
+    ring.commit()
+    assert bytes(first) == b'\x01' * 4
+    assert bytes(ring.pop()) == b'\x02' * 4
+    assert bytes(ring.pop()) == b'\x04' * 4
+    assert ring.pop() is None
+
+
+def test_audio_socket_echo(caplog):
+    received = []
+
+    async def handler(call: AudioCall):
+        assert call.path == '/socket'
+        assert call.metadata.headers['caller'] == '447700900000'
+        assert call.frame_size == FRAME_SIZE
+        async for frame in call:
+            assert isinstance(frame, memoryview)
+            received.append(bytes(frame))
+            call.send_audio(frame)
+        assert (await call.messages.get())['event'] == 'websocket:dtmf'
+
+    async def run():
+        server = AudioSocketServer(handler)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await connect(server.port)
+        frames = [bytes([i]) * FRAME_SIZE for i in range(1, 4)]
+        send(writer, 0x2, frames[0])
+        send(writer, 0x9, b'ping')
+        # Audio split across frames is reassembled into whole frames
+        send(writer, 0x2, frames[1] + frames[2][:100])
+        # An invalid text message is logged, and the call carries on
+        send(writer, 0x1, b'not json')
+        send(writer, 0x1, b'{"event": "websocket:dtmf", "digit": "5"}')
+        send(writer, 0x2, frames[2][100:])
+
+        echoed, pong = [], None
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        while len(echoed) < 3:
+            _, opcode, payload, mask = await asyncio.wait_for(
+                _read_frame(reader, 1 << 20), 2
+            )
+            assert mask is None
+            if opcode == 0xA:
+                pong = payload
+            elif opcode == 0x2:
+                echoed.append(payload)
+        elapsed = loop.time() - start
+
+        send(writer, 0x8, b'\x03\xe8')
+        await asyncio.sleep(0.05)
+        writer.close()
+        await server.close()
+        return frames, echoed, pong, elapsed, server.active_calls
+
+    frames, echoed, pong, elapsed, active_calls = asyncio.run(run())
+    assert received == frames
+    assert echoed == frames
+    assert pong == b'ping'
+    # Echoed audio is paced at one 20ms frame at a time
+    assert elapsed >= 0.035
+    assert active_calls == 0
+    assert 'is not valid JSON' in caplog.text
+
+
+def test_audio_socket_fragmented_messages():
+    received = []
+
+    async def handler(call: AudioCall):
+        async for frame in call:
+            received.append(bytes(frame))
+        received.append(call.messages.get_nowait())
+
+    async def run():
+        server = AudioSocketServer(handler)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await connect(server.port)
+        message = json.dumps({'event': 'websocket:dtmf', 'digit': '5'}).encode()
+        send(writer, 0x1, message[:10], fin=False)
+        # Control frames can arrive between the fragments of a message
+        send(writer, 0x9, b'ping')
+        send(writer, 0x0, message[10:20], fin=False)
+        send(writer, 0x0, message[20:])
+        send(writer, 0x2, bytes([1]) * 400, fin=False)
+        send(writer, 0x0, bytes([1]) * 240)
+        send(writer, 0x8, b'\x03\xe8')
+        code = await read_close_code(reader)
+        writer.close()
+        await server.close()
+        return code
+
+    assert asyncio.run(run()) == 1000
+    assert received == [
+        bytes([1]) * FRAME_SIZE,
+        {'event': 'websocket:dtmf', 'digit': '5'},
+    ]
+
+
+def test_audio_socket_oversized_messages(caplog):
+    async def handler(call: AudioCall):
+        async for _ in call:
+            pass
+
+    async def run(*frames):
+        server = AudioSocketServer(handler, max_message_size=100)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await connect(server.port)
+        for opcode, payload, fin in frames:
+            send(writer, opcode, payload, fin)
+        code = await read_close_code(reader)
+        writer.close()
+        await server.close()
+        return code
+
+    assert asyncio.run(run((0x1, bytes(101), True))) == 1009
+    assert 'A WebSocket frame of 101 bytes is too large.' in caplog.text
+
+    # Each frame is small enough, but the message they make up isn't
+    fragments = [(0x1, b'x' * 60, False), (0x0, b'x' * 60, True)]
+    assert asyncio.run(run(*fragments)) == 1009
+    assert 'A fragmented WebSocket message of more than 100 bytes' in caplog.text
+
+
+def test_audio_socket_concurrent_calls():
+    counts = []
+
+    async def handler(call: AudioCall):
+        count = 0
+        async for _ in call:
+            count += 1
+        counts.append(count)
+
+    async def stream(port: int):
+        reader, writer = await connect(port)
+        for _ in range(10):
+            send(writer, 0x2, bytes(FRAME_SIZE))
+            await asyncio.sleep(0.002)
+        send(writer, 0x8, b'\x03\xe8')
+        await writer.drain()
+        await reader.read()
+        writer.close()
+
+    async def run():
+        server = AudioSocketServer(handler)
+        await server.start('127.0.0.1', 0)
+        await asyncio.gather(*(stream(server.port) for _ in range(50)))
+        await server.close()
+
+    asyncio.run(run())
+    assert counts == [10] * 50
+
+
+def test_audio_socket_bad_handshake():
+    async def handler(call):
+        raise AssertionError('not called')
+
+    async def run():
+        server = AudioSocketServer(handler)
+        await server.start('127.0.0.1', 0)
+        reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+        writer.write(b'GET / HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        response = await reader.read()
+        writer.close()
+        await server.close()
+        return response
+
+    assert asyncio.run(run()).startswith(b'HTTP/1.1 400 Bad Request')
@@ -0,0 +1,187 @@
+import csv
+import json
+from datetime import datetime, timezone
+from io import StringIO
+from urllib.parse import parse_qs, urlparse
+
+import responses
+from pytest import importorskip, raises
+from testutils import get_mock_jwt_auth
+from vonage_http_client.errors import ServerError
+from vonage_http_client.http_client import HttpClient
+from vonage_voice.call_export import (
+    CALL_RECORD_COLUMNS,
+    CallRecordSink,
+    CsvCallRecordSink,
+    flatten_call,
+    shard_time_window,
+)
+from vonage_voice.errors import VoiceError
+from vonage_voice.voice import Voice
+
+voice = Voice(HttpClient(get_mock_jwt_auth()))
+
+CALLS_PER_SHARD = 150
+
+
+def make_call(shard_start: str, index: int) -> dict:
+    return {
+        '_links': {'self': {'href': f'/v1/calls/{shard_start}-{index}'}},
+        'conversation_uuid': f'CON-{shard_start}-{index}',
+        'direction': 'outbound',
+        'duration': '2',
+        'end_time': '2024-04-19T01:34:20.000Z',
+        'from': {'number': '9876543210', 'type': 'phone'},
+        'network': '23420',
+        'price': '0.00333333',
+        'rate': '0.10000000',
+        'start_time': '2024-04-19T01:34:18.000Z',
+        'status': 'completed',
+        'to': {'type': 'sip', 'uri': 'sip:rebekka@sip.example.com'},
+        'uuid': f'{shard_start}-{index}',
+    }
+
+
+def list_calls_callback(request):
+    query = parse_qs(urlparse(request.url).query)
+    query = {key: value[0] for key, value in query.items()}
+    record_index, page_size = int(query['record_index']), int(query['page_size'])
+    end = min(record_index + page_size, CALLS_PER_SHARD)
+    links = {'self': {'href': '/v1/calls'}}
+    if end < CALLS_PER_SHARD:
+        links['next'] = {'href': f'/v1/calls?record_index={end}'}
+    body = {
+        '_embedded': {
+            'calls': [make_call(query['date_start'], i) for i in range(record_index, end)]
+        },
+        '_links': links,
+        'count': CALLS_PER_SHARD,
+        'page_size': page_size,
+        'record_index': record_index,
+    }
+    return 200, {'Content-Type': 'application/json'}, json.dumps(body)
+
+
+class ListSink(CallRecordSink):
+    def __init__(self):
+        self.batches = []
+
+    def write(self, rows):
+        self.batches.append(rows)
+
+
+def test_call_record_sink_requires_write():
+    class NoWriteSink(CallRecordSink):
+        pass
+
+    with raises(TypeError):
+        NoWriteSink()
+
+
+def test_flatten_call():
+    row = flatten_call(make_call('2024-03-01T00:00:00Z', 1))
+    assert tuple(row) == CALL_RECORD_COLUMNS
+    assert row['from_type'] == 'phone'
+    assert row['from_address'] == '9876543210'
+    assert row['to_type'] == 'sip'
+    assert row['to_address'] == 'sip:rebekka@sip.example.com'
+    assert row['price'] == '0.00333333'
+    assert flatten_call({'uuid': 'abc'})['from_address'] is None
+
+
+def test_shard_time_window():
+    start = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 3, 1, 0, 0, 9, tzinfo=timezone.utc)
+    assert shard_time_window(start, end, 3) == [
+        ('2024-03-01T00:00:00Z', '2024-03-01T00:00:03Z'),
+        ('2024-03-01T00:00:04Z', '2024-03-01T00:00:06Z'),
+        ('2024-03-01T00:00:07Z', '2024-03-01T00:00:09Z'),
+    ]
+    assert shard_time_window(start, start, 4) == [
+        ('2024-03-01T00:00:00Z', '2024-03-01T00:00:00Z')
+    ]
+
+
+@responses.activate
+def test_export_calls_to_sink():
+    responses.add_callback(
+        responses.GET, 'https://api.nexmo.com/v1/calls', callback=list_calls_callback
+    )
+    sink = ListSink()
+    count = voice.export_calls(
+        '2024-03-01T00:00:00Z', '2024-03-01T23:59:59Z', sink, shards=3, batch_size=120
+    )
+
+    assert count == 3 * CALLS_PER_SHARD
+    assert len(responses.calls) == 6
+    assert all(len(batch) >= 120 for batch in sink.batches[:-1])
+    uuids = [row['uuid'] for batch in sink.batches for row in batch]
+    assert len(set(uuids)) == count
+    assert '2024-03-01T16:00:00Z-149' in uuids
+
+
+@responses.activate
+def test_export_calls_to_csv(tmp_path):
+    responses.add_callback(
+        responses.GET, 'https://api.nexmo.com/v1/calls', callback=list_calls_callback
+    )
+    file_path = str(tmp_path / 'calls.csv')
+    count = voice.export_calls(
+        '2024-03-01T00:00:00Z', '2024-03-01T23:59:59Z', file_path, shards=2
+    )
+
+    with open(file_path, newline='') as file:
+        rows = list(csv.DictReader(file))
+    assert count == len(rows) == 2 * CALLS_PER_SHARD
+    assert tuple(rows[0]) == CALL_RECORD_COLUMNS
+    assert rows[0]['to_address'] == 'sip:rebekka@sip.example.com'
+
+
+@responses.activate
+def test_export_calls_to_file_object():
+    responses.add_callback(
+        responses.GET, 'https://api.nexmo.com/v1/calls', callback=list_calls_callback
+    )
+    file = StringIO()
+    count = voice.export_calls(
+        '2024-03-01T00:00:00Z', '2024-03-01T00:00:00Z', CsvCallRecordSink(file)
+    )
+    assert count == CALLS_PER_SHARD
+    assert file.getvalue().startswith(','.join(CALL_RECORD_COLUMNS))
+
+
+@responses.activate
+def test_export_calls_to_parquet(tmp_path):
+    pq = importorskip('pyarrow.parquet')
+    responses.add_callback(
+        responses.GET, 'https://api.nexmo.com/v1/calls', callback=list_calls_callback
+    )
+    file_path = str(tmp_path / 'calls.parquet')
+    count = voice.export_calls('2024-03-01T00:00:00Z', '2024-03-01T23:59:59Z', file_path)
+
+    table = pq.read_table(file_path)
+    assert count == table.num_rows == 4 * CALLS_PER_SHARD
+    assert table.column_names == list(CALL_RECORD_COLUMNS)
+
+
+@responses.activate
+def test_export_calls_error():
+    responses.add(
+        responses.GET,
+        'https://api.nexmo.com/v1/calls',
+        json={'title': 'Internal Server Error'},
+        status=500,
+    )
+    with raises(ServerError):
+        voice.export_calls('2024-03-01T00:00:00Z', '2024-03-01T23:59:59Z', ListSink())
+
+
+def test_export_calls_invalid_window():
+    with raises(VoiceError) as e:
+        voice.export_calls('2024-03-02T00:00:00Z', '2024-03-01T00:00:00Z', ListSink())
+    assert e.match('"date_end" must not be before "date_start".')
+
+    with raises(VoiceError):
+        voice.export_calls(
+            '2024-03-01T00:00:00Z', '2024-03-02T00:00:00Z', ListSink(), shards=0
+        )
@@ -0,0 +1,144 @@
+import json
+from unittest.mock import patch
+
+from pytest import raises
+from vonage_voice.call_state import CallLeg, CallStateTracker
+from vonage_voice.errors import VoiceError
+
+
+def event(uuid, status, timestamp, conversation_uuid='CON-1', **fields):
+    return {
+        'uuid': uuid,
+        'conversation_uuid': conversation_uuid,
+        'status': status,
+        'direction': 'outbound',
+        'from': '447700900000',
+        'to': '447700900001',
+        'timestamp': f'2024-01-01T12:00:{timestamp:02d}.000Z',
+        **fields,
+    }
+
+
+def test_call_lifecycle():
+    tracker = CallStateTracker()
+    assert tracker.ingest(event('leg-1', 'started', 1)).status == 'started'
+    tracker.ingest(event('leg-2', 'ringing', 2))
+    leg = tracker.ingest(event('leg-1', 'answered', 3))
+
+    assert leg == CallLeg(
+        uuid='leg-1',
+        conversation_uuid='CON-1',
+        status='answered',
+        direction='outbound',
+        from_='447700900000',
+        to='447700900001',
+        timestamp='2024-01-01T12:00:03.000Z',
+    )
+    assert leg.active
+    assert tracker.get('leg-1') == leg
+    assert tracker.get('unknown') is None
+    assert [leg.uuid for leg in tracker.conversation_legs('CON-1')] == ['leg-1', 'leg-2']
+
+    tracker.ingest(event('leg-2', 'completed', 4, duration='12'))
+    assert not tracker.get('leg-2').active
+    assert tracker.get('leg-2').duration == '12'
+    assert [leg.uuid for leg in tracker.active_legs('CON-1')] == ['leg-1']
+    assert [leg.uuid for leg in tracker.active_legs()] == ['leg-1']
+    assert tracker.active_legs('unknown') == []
+    assert len(tracker) == 2
+    assert 'leg-2' in tracker
+
+
+def test_out_of_order_events():
+    tracker = CallStateTracker()
+    tracker.ingest(event('leg-1', 'answered', 5))
+    # An event older than the leg's state doesn't change it
+    assert tracker.ingest(event('leg-1', 'ringing', 4)).status == 'answered'
+
+    tracker.ingest(event('leg-1', 'completed', 9))
+    # An ended leg stays ended, even if a later event arrives without a timestamp
+    late = event('leg-1', 'answered', 10)
+    del late['timestamp']
+    assert tracker.ingest(late).status == 'completed'
+    assert tracker.active_legs('CON-1') == []
+
+    # An event without a status only fills in what isn't known
+    tracker.ingest({'uuid': 'leg-2', 'timestamp': '2024-01-01T12:00:09.000Z'})
+    leg = tracker.ingest(event('leg-2', 'ringing', 8, conversation_uuid='CON-2'))
+    assert leg.status == 'ringing'
+    assert leg.conversation_uuid == 'CON-2'
+    assert leg.timestamp == '2024-01-01T12:00:09.000Z'
+
+    # Machine detection results other than a machine don't change the status
+    assert tracker.ingest(event('leg-2', 'human', 10)).status == 'ringing'
+
+
+def test_transfer_moves_leg_between_conversations():
+    tracker = CallStateTracker()
+    tracker.ingest(event('leg-1', 'answered', 1))
+    tracker.ingest(event('leg-2', 'answered', 1))
+    tracker.ingest(
+        {
+            'uuid': 'leg-1',
+            'conversation_uuid_from': 'CON-1',
+            'conversation_uuid_to': 'CON-2',
+            'timestamp': '2024-01-01T12:00:02.000Z',
+        }
+    )
+    assert [leg.uuid for leg in tracker.active_legs('CON-1')] == ['leg-2']
+    assert [leg.uuid for leg in tracker.active_legs('CON-2')] == ['leg-1']
+    assert tracker.get('leg-1').status == 'answered'
+
+
+def test_ingest_many():
+    tracker = CallStateTracker()
+    events = [
+        json.dumps(event('leg-1', 'started', 1)).encode(),
+        event('leg-1', 'answered', 2),
+        {'status': 'completed'},
+        json.dumps(event('leg-2', 'started', 3)),
+    ]
+    assert tracker.ingest_many(events) == 3
+    assert [leg.status for leg in tracker.active_legs()] == ['answered', 'started']
+
+    with raises(VoiceError) as err:
+        tracker.ingest_many([event('leg-3', 'started', 4), b'not json'])
+    assert err.match('The Voice event webhook body is not valid JSON.')
+    assert 'leg-3' not in tracker
+    with raises(VoiceError):
+        tracker.ingest(b'[]')
+
+
+@patch('vonage_voice.call_state.monotonic')
+def test_ended_legs_expire(mock_monotonic):
+    mock_monotonic.return_value = 100
+    tracker = CallStateTracker(completed_ttl=60)
+    tracker.ingest(event('leg-1', 'answered', 1))
+    tracker.ingest(event('leg-2', 'completed', 2))
+    mock_monotonic.return_value = 130
+    tracker.ingest(event('leg-1', 'completed', 3))
+
+    mock_monotonic.return_value = 159
+    assert tracker.expire() == 0
+    mock_monotonic.return_value = 160
+    assert tracker.get('leg-2') is None
+    assert [leg.uuid for leg in tracker.conversation_legs('CON-1')] == ['leg-1']
+    mock_monotonic.return_value = 190
+    assert tracker.expire() == 1
+    assert tracker.conversation_legs('CON-1') == []
+
+    tracker.clear()
+    assert len(tracker) == 0
+
+
+def test_max_calls():
+    tracker = CallStateTracker(max_calls=2)
+    tracker.ingest(event('leg-1', 'answered', 1))
+    tracker.ingest(event('leg-2', 'answered', 1))
+    tracker.ingest(event('leg-3', 'answered', 1))
+    # The leg seen first is forgotten, unless a leg has ended
+    assert [leg.uuid for leg in tracker.active_legs()] == ['leg-2', 'leg-3']
+
+    tracker.ingest(event('leg-3', 'busy', 2))
+    tracker.ingest(event('leg-4', 'answered', 3))
+    assert [leg.uuid for leg in tracker.conversation_legs('CON-1')] == ['leg-2', 'leg-4']
@@ -0,0 +1,142 @@
+from os.path import abspath
+from threading import Lock
+from time import sleep
+from unittest.mock import patch
+
+import responses
+from pydantic import ValidationError
+from pytest import approx, raises
+from vonage_http_client.errors import ServerError
+from vonage_http_client.http_client import HttpClient
+from vonage_voice import CreateCallRequest
+from vonage_voice.dialler import CallCampaign, CampaignStats
+from vonage_voice.models.ncco import Talk
+from vonage_voice.models.responses import CreateCallResponse
+from vonage_voice.voice import Voice
+
+from testutils import build_response, get_mock_jwt_auth
+
+path = abspath(__file__)
+
+voice = Voice(HttpClient(get_mock_jwt_auth()))
+
+
+def make_calls(count: int) -> list[CreateCallRequest]:
+    return [
+        CreateCallRequest(
+            ncco=[Talk(text='Hello world')],
+            to=[{'type': 'phone', 'number': f'44770090{i:04}'}],
+            random_from_number=True,
+        )
+        for i in range(count)
+    ]
+
+
+class FakeClock:
+    """A clock that only moves forward when the dispatcher waits for a call to be due,
+    so pacing can be checked without depending on wall-clock time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.waits = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wait(self, campaign: CallCampaign, timeout: float) -> bool:
+        self.waits.append(timeout)
+        self.now += timeout
+        return campaign.cancelled
+
+
+@responses.activate
+def test_create_calls():
+    build_response(
+        path, 'POST', 'https://api.nexmo.com/v1/calls', 'create_call.json', 201
+    )
+    calls = make_calls(5)
+    clock = FakeClock()
+
+    with patch('vonage_voice.dialler.perf_counter', clock), patch.object(
+        CallCampaign, '_wait', autospec=True, side_effect=clock.wait
+    ):
+        with voice.create_calls(calls, cps=20) as campaign:
+            results = list(campaign)
+
+    assert isinstance(campaign, CallCampaign)
+    assert len(results) == 5
+    assert {id(call) for call, _ in results} == {id(call) for call in calls}
+    assert all(isinstance(result, CreateCallResponse) for _, result in results)
+    # The first call is made straight away, and each of the others 1 / cps later
+    assert clock.waits == approx([0.05] * 4)
+
+    stats = campaign.stats()
+    assert isinstance(stats, CampaignStats)
+    assert stats.dialled == stats.succeeded == 5
+    assert stats.failed == 0
+    assert stats.achieved_cps == approx(20)
+    assert 0 <= stats.latency_p50 <= stats.latency_p90 <= stats.latency_p99
+
+
+@responses.activate
+def test_create_calls_errors_yielded():
+    responses.add(
+        responses.POST,
+        'https://api.nexmo.com/v1/calls',
+        status=500,
+        json={'title': 'Internal Server Error'},
+    )
+    build_response(
+        path, 'POST', 'https://api.nexmo.com/v1/calls', 'create_call.json', 201
+    )
+
+    results = [result for _, result in voice.create_calls(make_calls(1), cps=100)]
+    results += [result for _, result in voice.create_calls(make_calls(1), cps=100)]
+
+    assert isinstance(results[0], ServerError)
+    assert isinstance(results[1], CreateCallResponse)
+
+
+def test_create_calls_max_in_flight():
+    lock = Lock()
+    in_flight = [0, 0]
+
+    def create_call(call):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return call
+
+    campaign = CallCampaign(create_call, make_calls(10), cps=1000, max_in_flight=2)
+
+    assert len(list(campaign)) == 10
+    assert in_flight[1] == 2
+
+
+def test_create_calls_cancel():
+    campaign = CallCampaign(lambda call: call, make_calls(100), cps=50, max_in_flight=5)
+
+    next(campaign)
+    campaign.cancel()
+    remaining = list(campaign)
+
+    assert campaign.cancelled
+    assert 1 + len(remaining) == campaign.stats().dialled < 100
+
+
+@responses.activate
+def test_create_calls_invalid_request():
+    build_response(
+        path, 'POST', 'https://api.nexmo.com/v1/calls', 'create_call.json', 201
+    )
+    campaign = voice.create_calls(make_calls(2) + [{'to': 'not a call'}], cps=1000)
+
+    results = []
+    with raises(ValidationError):
+        for result in campaign:
+            results.append(result)
+    # Calls before the invalid request are still made, and their results yielded
+    assert len(results) == 2
@@ -0,0 +1,123 @@
+import json
+from os.path import abspath
+
+import responses
+from pydantic_core import to_json
+from pytest import raises
+from responses.matchers import json_params_matcher
+from vonage_http_client.http_client import HttpClient
+from vonage_voice.errors import NccoActionError
+from vonage_voice.models.ncco import Record, Talk
+from vonage_voice.ncco_compiler import CompiledNcco, NccoTemplates, compile_ncco
+from vonage_voice.voice import Voice
+
+from testutils import build_response, get_mock_jwt_auth
+
+path = abspath(__file__)
+
+voice = Voice(HttpClient(get_mock_jwt_auth()))
+
+
+def test_compile_static_ncco():
+    ncco = [
+        Talk(text='Hello world', language='en-GB'),
+        Record(eventUrl=['https://example.com/events']),
+    ]
+    compiled = compile_ncco(ncco)
+
+    assert compiled.slots == ()
+    assert compiled.render() == to_json(ncco, by_alias=True, exclude_none=True)
+    assert bytes(compiled) == compiled.render()
+
+
+def test_render_slots():
+    compiled = compile_ncco(
+        [
+            Talk(text='Hello {{ name }}, {{name}}!'),
+            Record(eventUrl=['https://example.com/events?caller={{caller|url}}']),
+        ]
+    )
+    assert compiled.slots == ('name', 'caller')
+
+    ncco = json.loads(compiled.render(name='"Bob"', caller='+44 7700&900000'))
+    assert ncco[0] == {'text': 'Hello "Bob", "Bob"!', 'action': 'talk'}
+    assert ncco[1]['eventUrl'] == [
+        'https://example.com/events?caller=%2B44%207700%26900000'
+    ]
+
+
+def test_render_slot_errors():
+    compiled = compile_ncco([Talk(text='Hello {{name}}')])
+
+    with raises(NccoActionError) as e:
+        compiled.render()
+    assert e.match('No value was given for the NCCO slots: name.')
+
+    with raises(NccoActionError) as e:
+        compiled.render(name='Bob', other='value')
+    assert e.match('The NCCO has no slots named: other.')
+
+    with raises(NccoActionError) as e:
+        compile_ncco([Talk(text='Hello {{name|upper}}')])
+    assert e.match('Unknown NCCO slot filter "upper"')
+
+
+def test_bind():
+    compiled = compile_ncco([Talk(text='{{greeting}} {{name}}')])
+    bound = compiled.bind(greeting='Hi')
+
+    assert bound.slots == ('name',)
+    assert json.loads(bound.render(name='Ana'))[0]['text'] == 'Hi Ana'
+    assert compiled.slots == ('greeting', 'name')
+
+
+def test_ncco_templates():
+    templates = NccoTemplates(max_templates=2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return [Talk(text='Hello {{name}}')]
+
+    first = templates.get('welcome', build)
+    assert isinstance(first, CompiledNcco)
+    assert templates.get('welcome', build) is first
+    assert len(builds) == 1
+
+    templates.get('other', lambda: [Talk(text='Other')])
+    templates.get('third', lambda: [Talk(text='Third')])
+    templates.get('welcome', build)
+    assert len(builds) == 2
+
+    templates.clear()
+    templates.get('welcome', build)
+    assert len(builds) == 3
+
+
+@responses.activate
+def test_transfer_call_compiled_ncco():
+    uuid = 'e154eb57-2962-41e7-baf4-90f63e25e439'
+    build_response(
+        path,
+        'PUT',
+        f'https://api.nexmo.com/v1/calls/{uuid}',
+        status_code=204,
+        match=[
+            json_params_matcher(
+                {
+                    'action': 'transfer',
+                    'destination': {
+                        'type': 'ncco',
+                        'ncco': [{'text': 'Hello Bob', 'action': 'talk'}],
+                    },
+                }
+            )
+        ],
+    )
+    compiled = compile_ncco([Talk(text='Hello {{name}}')])
+
+    voice.transfer_call_ncco(uuid, compiled.bind(name='Bob'))
+    assert voice._http_client.last_response.status_code == 204
+
+    with raises(NccoActionError):
+        voice.transfer_call_ncco(uuid, compiled)
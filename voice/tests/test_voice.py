@@ -3,8 +3,11 @@ from os.path import abspath
 
 import responses
 from pytest import raises
+from requests.exceptions import ConnectionError
 from responses.matchers import json_params_matcher
+from vonage_http_client.errors import NotFoundError, ServerError
 from vonage_http_client.http_client import HttpClient
+from vonage_utils import LazyModelList
 from vonage_voice import (
     AudioStreamOptions,
     CreateCallRequest,
@@ -61,6 +64,26 @@ def test_create_call_basic_ncco():
     assert response.conversation_uuid == 'CON-2be039b2-d0a4-4274-afc8-d7b241c7c044'
 
 
+@responses.activate
+def test_create_call_trusted():
+    build_response(
+        path, 'POST', 'https://api.nexmo.com/v1/calls', 'create_call.json', 201
+    )
+    trusted_voice = Voice(HttpClient(get_mock_jwt_auth(), {'trusted': True}))
+    call = CreateCallRequest(
+        ncco=[Talk(text='Hello world')],
+        to=[{'type': 'phone', 'number': '1234567890'}],
+        random_from_number=True,
+    )
+
+    response = trusted_voice.create_call(call)
+
+    assert json.loads(responses.calls[0].request.body)['ncco'][0]['text'] == 'Hello world'
+    assert type(response) == CreateCallResponse
+    assert response.uuid == '106a581a-34d0-432a-a625-220221fd434f'
+    assert response.conversation_uuid == 'CON-2be039b2-d0a4-4274-afc8-d7b241c7c044'
+
+
 @responses.activate
 def test_create_call_basic_ncco_from_sip():
     build_response(
@@ -211,6 +234,21 @@ def test_list_calls():
     assert calls[2].conversation_uuid == 'CON-2be039b2-d0a4-4274-afc8-d7b241c7c044'
 
 
+@responses.activate
+def test_list_calls_lazy_and_raw():
+    build_response(path, 'GET', 'https://api.nexmo.com/v1/calls', 'list_calls.json', 200)
+    calls, _ = voice.list_calls(response_mode='lazy')
+    assert isinstance(calls, LazyModelList)
+    assert len(calls) == 3
+    assert calls[2].conversation_uuid == 'CON-2be039b2-d0a4-4274-afc8-d7b241c7c044'
+    assert calls[0].from_.number == '9876543210'
+
+    build_response(path, 'GET', 'https://api.nexmo.com/v1/calls', 'list_calls.json', 200)
+    calls, _ = voice.list_calls(response_mode='raw')
+    assert calls[0]['uuid'] == 'e154eb57-2962-41e7-baf4-90f63e25e439'
+    assert calls[0]['from']['number'] == '9876543210'
+
+
 @responses.activate
 def test_list_calls_filter():
     build_response(
@@ -364,6 +402,58 @@ def test_unearmuff():
     assert voice._http_client.last_response.status_code == 204
 
 
+@responses.activate
+def test_hangup_many():
+    uuids = [f'e154eb57-2962-41e7-baf4-90f63e25e43{i}' for i in range(4)]
+    for uuid in uuids[:2]:
+        build_response(
+            path,
+            'PUT',
+            f'https://api.nexmo.com/v1/calls/{uuid}',
+            status_code=204,
+            match=[json_params_matcher({'action': 'hangup'})],
+        )
+    responses.add(
+        responses.PUT,
+        f'https://api.nexmo.com/v1/calls/{uuids[2]}',
+        status=404,
+        json={'title': 'Not Found'},
+    )
+    responses.add(
+        responses.PUT,
+        f'https://api.nexmo.com/v1/calls/{uuids[3]}',
+        body=ConnectionError('Connection reset by peer'),
+    )
+
+    results = voice.hangup_many(uuids + uuids[:1], concurrency=3)
+
+    assert list(results) == uuids
+    assert results[uuids[0]] is None
+    assert results[uuids[1]] is None
+    assert isinstance(results[uuids[2]], NotFoundError)
+    # A connection error on one leg doesn't lose the results for the others
+    assert isinstance(results[uuids[3]], ConnectionError)
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_mute_and_earmuff_many():
+    uuids = [f'e154eb57-2962-41e7-baf4-90f63e25e43{i}' for i in range(4)]
+    for action in ('mute', 'earmuff'):
+        for uuid in uuids:
+            build_response(
+                path,
+                'PUT',
+                f'https://api.nexmo.com/v1/calls/{uuid}',
+                status_code=204,
+                match=[json_params_matcher({'action': action})],
+            )
+
+    assert voice.mute_many(uuids) == dict.fromkeys(uuids)
+    assert voice.earmuff_many(uuids) == dict.fromkeys(uuids)
+    assert voice.mute_many([]) == {}
+
+
 @responses.activate
 def test_play_audio_into_call():
     uuid = 'e154eb57-2962-41e7-baf4-90f63e25e439'
@@ -382,6 +472,24 @@ def test_play_audio_into_call():
     assert response.uuid == uuid
 
 
+@responses.activate
+def test_play_audio_into_calls():
+    uuid = 'e154eb57-2962-41e7-baf4-90f63e25e439'
+    build_response(
+        path,
+        'PUT',
+        f'https://api.nexmo.com/v1/calls/{uuid}/stream',
+        'play_audio_into_call.json',
+    )
+
+    options = AudioStreamOptions(stream_url=['https://example.com/audio'])
+    responses_by_uuid = voice.play_audio_into_calls([uuid], options)
+    assert responses_by_uuid[uuid].message == 'Stream started'
+    assert json.loads(responses.calls[0].request.body) == {
+        'stream_url': ['https://example.com/audio']
+    }
+
+
 @responses.activate
 def test_stop_audio_stream():
     uuid = 'e154eb57-2962-41e7-baf4-90f63e25e439'
@@ -415,6 +523,30 @@ def test_play_tts_into_call():
     assert response.uuid == uuid
 
 
+@responses.activate
+def test_play_tts_into_calls():
+    uuids = [
+        'e154eb57-2962-41e7-baf4-90f63e25e439',
+        'e154eb57-2962-41e7-baf4-90f63e25e430',
+    ]
+    build_response(
+        path,
+        'PUT',
+        f'https://api.nexmo.com/v1/calls/{uuids[0]}/talk',
+        'play_tts_into_call.json',
+    )
+    responses.add(
+        responses.PUT,
+        f'https://api.nexmo.com/v1/calls/{uuids[1]}/talk',
+        status=500,
+        json={'title': 'Internal Server Error'},
+    )
+
+    results = voice.play_tts_into_calls(uuids, TtsStreamOptions(text='Goodbye'))
+    assert results[uuids[0]].message == 'Talk started'
+    assert isinstance(results[uuids[1]], ServerError)
+
+
 @responses.activate
 def test_stop_tts():
     uuid = 'e154eb57-2962-41e7-baf4-90f63e25e439'
@@ -3,7 +3,9 @@ from vonage_utils import VonageError
 from .vonage import (
     Account,
     Application,
+    ApplicationKeyring,
     Auth,
+    ConnectionPool,
     HttpClientOptions,
     Messages,
     NetworkNumberVerification,
@@ -23,7 +25,9 @@ from .vonage import (
 __all__ = [
     'Account',
     'Application',
+    'ApplicationKeyring',
     'Auth',
+    'ConnectionPool',
     'HttpClientOptions',
     'Messages',
     'NetworkSimSwap',
@@ -1 +1 @@
-__version__ = '4.7.2'
+__version__ = '4.8.0'
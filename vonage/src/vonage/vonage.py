@@ -2,7 +2,13 @@ from typing import Optional
 
 from vonage_account.account import Account
 from vonage_application.application import Application
-from vonage_http_client import Auth, HttpClient, HttpClientOptions
+from vonage_http_client import (
+    ApplicationKeyring,
+    Auth,
+    ConnectionPool,
+    HttpClient,
+    HttpClientOptions,
+)
 from vonage_identity_insights import IdentityInsights
 from vonage_messages import Messages
 from vonage_network_number_verification import NetworkNumberVerification
@@ -31,12 +37,19 @@ class Vonage:
     Args:
         auth (Auth): Class dealing with authentication objects and methods.
         http_client_options (HttpClientOptions, optional): Options for the HTTP client.
+        connection_pool (ConnectionPool, optional): A connection pool to share with other
+            `Vonage` instances.
     """
 
     def __init__(
-        self, auth: Auth, http_client_options: Optional[HttpClientOptions] = None
+        self,
+        auth: Auth,
+        http_client_options: Optional[HttpClientOptions] = None,
+        connection_pool: Optional[ConnectionPool] = None,
     ):
-        self._http_client = HttpClient(auth, http_client_options, __version__)
+        self._http_client = HttpClient(
+            auth, http_client_options, __version__, connection_pool
+        )
 
         self.account = Account(self._http_client)
         self.application = Application(self._http_client)
@@ -57,3 +70,20 @@ class Vonage:
     @property
     def http_client(self):
         return self._http_client
+
+    def with_auth(self, auth: Auth) -> 'Vonage':
+        """Creates a `Vonage` instance that uses different credentials but shares this
+        instance's HTTP client options and connection pool, e.g. to call APIs on behalf
+        of a subaccount. Rate limits and stats are kept separately for each instance.
+
+        Args:
+            auth (Auth): The credentials for the new instance to use.
+
+        Returns:
+            Vonage: A `Vonage` instance using `auth`.
+        """
+        return Vonage(
+            auth,
+            self._http_client.http_client_options,
+            self._http_client.connection_pool,
+        )
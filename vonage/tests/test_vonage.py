@@ -1,6 +1,6 @@
 from vonage_http_client.http_client import HttpClient
 
-from vonage.vonage import Auth, Vonage, __version__
+from vonage.vonage import Auth, ConnectionPool, Vonage, __version__
 
 
 def test_create_vonage_class_instance():
@@ -13,3 +13,23 @@ def test_create_vonage_class_instance():
     )
     assert type(vonage.http_client) == HttpClient
     assert f'vonage-python-sdk/{__version__}' in vonage.http_client._user_agent
+
+
+def test_with_auth_shares_connection_pool():
+    vonage = Vonage(
+        Auth(api_key='asdf', api_secret='qwerasdf'),
+        http_client_options={'max_requests_per_second': 10},
+    )
+    subaccount = vonage.with_auth(Auth(api_key='sub', api_secret='subsecret'))
+
+    assert subaccount.http_client.auth.api_key == 'sub'
+    assert subaccount.http_client.connection_pool is vonage.http_client.connection_pool
+    assert subaccount.sms.http_client is subaccount.http_client
+    assert subaccount.http_client.stats is not vonage.http_client.stats
+    assert subaccount.http_client.http_client_options.max_requests_per_second == 10
+
+
+def test_create_vonage_class_instance_with_connection_pool():
+    pool = ConnectionPool(pool_maxsize=50)
+    vonage = Vonage(Auth(api_key='asdf', api_secret='qwerasdf'), connection_pool=pool)
+    assert vonage.http_client.connection_pool is pool
@@ -0,0 +1,106 @@
+"""Compares the memory retained per list item, and the time to build a page, for each
+response mode of high-volume list item types.
+
+Each item type is built from a page of raw items decoded from JSON, as a list method
+would. The memory figures count everything still held once the page is built,
+including the values shared with the decoded JSON.
+
+Run with: `python vonage_utils/benchmarks/bench_compact_records.py`
+"""
+
+import tracemalloc
+from json import dumps, loads
+from time import perf_counter
+
+from vonage_numbers.responses import OwnedNumber
+from vonage_subaccounts.responses import Transfer
+from vonage_users.responses import UserSummary
+from vonage_voice.models.responses import CallInfo
+
+from vonage_utils.response_modes import build_models
+
+ITEMS = 10000
+
+
+def call(i: int) -> dict:
+    return {
+        '_links': {'self': {'href': f'/v1/calls/{i:032x}'}},
+        'conversation_uuid': f'CON-{i:032x}',
+        'direction': 'outbound',
+        'duration': str(i % 600),
+        'end_time': '2024-04-19T01:34:20.000Z',
+        'from': {'number': '9876543210', 'type': 'phone'},
+        'network': '23420',
+        'price': '0.00333333',
+        'rate': '0.10000000',
+        'start_time': '2024-04-19T01:34:18.000Z',
+        'status': 'completed',
+        'to': {'number': f'4477009{i:05d}', 'type': 'phone'},
+        'uuid': f'{i:032x}',
+    }
+
+
+def owned_number(i: int) -> dict:
+    return {
+        'country': 'GB',
+        'msisdn': f'4477009{i:05d}',
+        'type': 'mobile-lvn',
+        'features': ['VOICE', 'SMS'],
+        'voiceCallbackType': 'app',
+        'voiceCallbackValue': '29f769u7-7ce1-46c9-ade3-f2dedee4fr4t',
+        'app_id': '29f769u7-7ce1-46c9-ade3-f2dedee4fr4t',
+    }
+
+
+def transfer(i: int) -> dict:
+    return {
+        'from': 'test_api_key',
+        'to': f'sub{i:05d}',
+        'amount': 0.01 * (i % 100),
+        'reference': f'transfer {i}',
+        'id': f'{i:032x}',
+        'created_at': '2023-12-22T19:41:19.000Z',
+    }
+
+
+def user(i: int) -> dict:
+    return {
+        '_links': {
+            'self': {'href': f'https://api-us-3.vonage.com/v1/users/USR-{i:032x}'}
+        },
+        'id': f'USR-{i:032x}',
+        'name': f'user-{i}',
+    }
+
+
+def measure(page: bytes, model, mode: str) -> tuple[float, float]:
+    tracemalloc.start()
+    result = build_models(loads(page), model, mode)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    start = perf_counter()
+    build_models(loads(page), model, mode)
+    return retained / ITEMS, (perf_counter() - start) * 1e3
+
+
+def main():
+    print(f'{ITEMS} items per page; bytes retained per item and ms to build the page')
+    for model, make_item in (
+        (CallInfo, call),
+        (OwnedNumber, owned_number),
+        (Transfer, transfer),
+        (UserSummary, user),
+    ):
+        page = dumps([make_item(i) for i in range(ITEMS)]).encode()
+        results = [
+            f'{mode} {size:>5.0f} B {elapsed:>5.0f} ms'
+            for mode in ('model', 'compact', 'raw')
+            for size, elapsed in [measure(page, model, mode)]
+        ]
+        print(f'{model.__name__:<12}', ' | '.join(results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Compares formatting a contact list of phone numbers one at a time with
+`format_phone_number` against formatting it as a batch with `format_phone_numbers`.
+
+Run with: `python vonage_utils/benchmarks/bench_format_phone_numbers.py`
+"""
+
+from time import perf_counter
+
+from vonage_utils.errors import InvalidPhoneNumberError
+from vonage_utils.utils import format_phone_number, format_phone_numbers
+
+NUMBERS = 1000000
+
+
+def contact(i: int) -> str:
+    if i % 50 == 0:
+        return 'n/a'
+    if i % 3 == 0:
+        return f'+44 7700 {i % 1000000:06d}'
+    if i % 3 == 1:
+        return f'00 1 (415) 555-{i % 10000:04d}'
+    return f'4477009{i % 100000:05d}'
+
+
+def one_at_a_time(numbers: list[str]) -> list:
+    formatted = []
+    for number in numbers:
+        try:
+            formatted.append(format_phone_number(number))
+        except InvalidPhoneNumberError:
+            formatted.append(None)
+    return formatted
+
+
+def main():
+    numbers = [contact(i) for i in range(NUMBERS)]
+
+    start = perf_counter()
+    expected = one_at_a_time(numbers)
+    single = perf_counter() - start
+
+    start = perf_counter()
+    result = format_phone_numbers(numbers)
+    batch = perf_counter() - start
+
+    assert result.numbers == expected
+    print(f'{NUMBERS} numbers')
+    print(f'format_phone_number:  {single * 1e3:>7.0f} ms')
+    print(f'format_phone_numbers: {batch * 1e3:>7.0f} ms ({single / batch:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,30 @@
 from . import models, types
 from .errors import VonageError
-from .utils import format_phone_number, remove_none_values
+from .response_modes import (
+    CompactRecord,
+    LazyModelList,
+    ResponseMode,
+    compact_record_type,
+)
+from .utils import (
+    FormattedPhoneNumbers,
+    PhoneNumberErrorCode,
+    format_phone_number,
+    format_phone_numbers,
+    remove_none_values,
+)
 
-__all__ = ['VonageError', 'format_phone_number', 'remove_none_values', 'models', 'types']
+__all__ = [
+    'VonageError',
+    'CompactRecord',
+    'LazyModelList',
+    'ResponseMode',
+    'compact_record_type',
+    'FormattedPhoneNumbers',
+    'PhoneNumberErrorCode',
+    'format_phone_number',
+    'format_phone_numbers',
+    'remove_none_values',
+    'models',
+    'types',
+]
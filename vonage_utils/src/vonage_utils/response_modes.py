@@ -0,0 +1,189 @@
+from functools import lru_cache
+from typing import Any, ClassVar, Iterator, Literal, Sequence, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+ResponseMode = Literal['model', 'lazy', 'raw', 'compact']
+"""How the items of a list response are returned:
+
+- 'model': every item is validated into a pydantic model (the default).
+- 'lazy': items are returned in a `LazyModelList`, and each is only validated into a model
+    when it is accessed.
+- 'raw': items are returned as plain dicts, exactly as sent by the API.
+- 'compact': items are returned as frozen, `__slots__`-based `CompactRecord` objects, which
+    use far less memory than models. They hold the API's values without validating them,
+    and can be converted to models with `to_model`.
+"""
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+class LazyModelList(Sequence[ModelT]):
+    """A read-only list of raw response items that are only validated into pydantic models
+    when they are accessed. Each item is validated at most once.
+
+    Args:
+        items (list[dict]): The raw items from a response.
+        model (Type[BaseModel]): The model each item is validated into.
+    """
+
+    __slots__ = ('_items', '_model', '_models')
+
+    def __init__(self, items: list[dict], model: Type[ModelT]):
+        self._items = items
+        self._model = model
+        self._models: list[Union[ModelT, None]] = [None] * len(items)
+
+    @property
+    def raw(self) -> list[dict]:
+        """The raw items, as sent by the API."""
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._models[index]
+        if item is None:
+            item = self._model(**self._items[index])
+            self._models[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[ModelT]:
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LazyModelList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'LazyModelList({self._model.__name__}, {len(self._items)} items)'
+
+
+class CompactRecord:
+    """Base class for frozen, `__slots__`-based records holding the fields of a list item
+    with far less memory than a pydantic model.
+
+    Use `compact_record_type` to get the record type for a model. Values are stored as
+    sent by the API, without validation: nested objects stay as dicts, and fields that a
+    model computes in a validator are None until the record is converted with `to_model`.
+    """
+
+    __slots__ = ()
+    _model: ClassVar[Type[BaseModel]]
+    _fields: ClassVar[tuple[str, ...]]
+    _keys: ClassVar[tuple[str, ...]]
+
+    @classmethod
+    def from_raw(cls, item: dict) -> 'CompactRecord':
+        """Creates a record from a raw item, as sent by the API."""
+        record = object.__new__(cls)
+        for field, key in zip(cls._fields, cls._keys):
+            object.__setattr__(record, field, item.get(key))
+        return record
+
+    def to_raw(self) -> dict:
+        """The record's values keyed as in the API response, without None values."""
+        raw = {}
+        for field, key in zip(self._fields, self._keys):
+            value = getattr(self, field)
+            if value is not None:
+                raw[key] = value
+        return raw
+
+    def to_model(self) -> BaseModel:
+        """Validates the record into the full pydantic model."""
+        return self._model(**self.to_raw())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{f}={getattr(self, f)!r}' for f in self._fields)
+        return f'{type(self).__name__}({values})'
+
+
+@lru_cache(maxsize=None)
+def compact_record_type(model: Type[BaseModel]) -> Type[CompactRecord]:
+    """Gets the `CompactRecord` type for a pydantic model, with one slot per model field.
+
+    Args:
+        model (Type[BaseModel]): The model the records represent.
+
+    Returns:
+        Type[CompactRecord]: The record type, named after the model, e.g.
+            `CompactCallInfo`.
+    """
+    fields, keys = [], []
+    for name, info in model.model_fields.items():
+        fields.append(name)
+        if isinstance(info.validation_alias, str):
+            keys.append(info.validation_alias)
+        else:
+            keys.append(info.alias or name)
+    fields, keys = tuple(fields), tuple(keys)
+    return type(
+        f'Compact{model.__name__}',
+        (CompactRecord,),
+        {'__slots__': fields, '_model': model, '_fields': fields, '_keys': keys},
+    )
+
+
+def detach_items(response: dict, *path: str) -> list[dict]:
+    """Takes the list of items at a path in a response dict and leaves an empty list in
+    its place, so the rest of the response can be validated without building a model for
+    every item.
+
+    Args:
+        response (dict): The response from the API.
+        *path (str): The keys leading to the list of items.
+
+    Returns:
+        list[dict]: The raw items, or an empty list if there are none.
+    """
+    container = response
+    for key in path[:-1]:
+        container = container.get(key)
+        if not isinstance(container, dict):
+            return []
+    items = container.get(path[-1]) or []
+    container[path[-1]] = []
+    return items
+
+
+def build_models(
+    items: list[dict], model: Type[ModelT], response_mode: ResponseMode = 'model'
+) -> Union[list[ModelT], LazyModelList[ModelT], list[dict], list[CompactRecord]]:
+    """Builds the items of a list response according to a response mode.
+
+    Args:
+        items (list[dict]): The raw items from a response.
+        model (Type[BaseModel]): The model each item is validated into.
+        response_mode (ResponseMode, optional): 'model', 'lazy', 'raw' or 'compact'.
+
+    Returns:
+        Union[list[BaseModel], LazyModelList, list[dict], list[CompactRecord]]: A list of
+            models, a `LazyModelList`, the raw items or a list of compact records.
+    """
+    if response_mode == 'raw':
+        return items
+    if response_mode == 'lazy':
+        return LazyModelList(items, model)
+    if response_mode == 'compact':
+        from_raw = compact_record_type(model).from_raw
+        return [from_raw(item) for item in items]
+    return [model(**item) for item in items]
@@ -1,6 +1,10 @@
 from pytest import raises
 from vonage_utils.errors import InvalidPhoneNumberError, InvalidPhoneNumberTypeError
-from vonage_utils.utils import format_phone_number
+from vonage_utils.utils import (
+    PhoneNumberErrorCode,
+    format_phone_number,
+    format_phone_numbers,
+)
 
 
 def test_format_phone_numbers():
@@ -29,3 +33,80 @@ def test_format_phone_number_invalid_format():
     with raises(InvalidPhoneNumberError) as e:
         format_phone_number(number)
     assert e.match('"not a phone number"')
+
+
+def test_format_phone_numbers_batch():
+    numbers = [
+        '+44 7700 900000',
+        1234567890,
+        b'0014155552671',
+        '123',
+        '1234567890123456',
+        ['1234567890'],
+        '+١٢٣٤٥٦٧٨',
+        '12345²67',
+        '447700900000',
+    ]
+    result = format_phone_numbers(numbers)
+
+    assert len(result) == len(numbers)
+    assert result.numbers == [
+        '447700900000',
+        '1234567890',
+        '14155552671',
+        None,
+        None,
+        None,
+        None,
+        None,
+        '447700900000',
+    ]
+    assert result.valid == [True, True, True, False, False, False, False, False, True]
+    assert result.errors == [
+        None,
+        None,
+        None,
+        PhoneNumberErrorCode.TOO_SHORT,
+        PhoneNumberErrorCode.TOO_LONG,
+        PhoneNumberErrorCode.INVALID_TYPE,
+        PhoneNumberErrorCode.INVALID_DIGITS,
+        PhoneNumberErrorCode.INVALID_DIGITS,
+        None,
+    ]
+
+
+def test_format_phone_numbers_matches_format_phone_number():
+    numbers = ['+1 (234) 567-890', '00 447700900000', '0001234567', 'abc', 'a\nb 1234567']
+    result = format_phone_numbers(numbers)
+    for number, formatted in zip(numbers, result.numbers):
+        try:
+            assert format_phone_number(number) == formatted
+        except InvalidPhoneNumberError:
+            assert formatted is None
+
+
+def test_format_phone_numbers_deduplicate():
+    numbers = [
+        '447700900000',
+        '+44 7700 900000',
+        '123',
+        '0044 7700 900000',
+        '14155552671',
+    ]
+    result = format_phone_numbers(numbers, deduplicate=True)
+    assert result.numbers == ['447700900000', None, None, None, '14155552671']
+    assert result.errors == [
+        None,
+        PhoneNumberErrorCode.DUPLICATE,
+        PhoneNumberErrorCode.TOO_SHORT,
+        PhoneNumberErrorCode.DUPLICATE,
+        None,
+    ]
+
+
+def test_format_phone_numbers_large_batch():
+    numbers = (f'+44 7700 {i:06d}' for i in range(70000))
+    result = format_phone_numbers(numbers)
+    assert len(result) == 70000
+    assert all(result.valid)
+    assert result.numbers[69999] == '447700069999'
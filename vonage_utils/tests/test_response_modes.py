@@ -0,0 +1,71 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+from pytest import raises
+from vonage_utils import CompactRecord, LazyModelList, compact_record_type
+from vonage_utils.response_modes import build_models, detach_items
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+ITEMS = [{'id': 1, 'name': 'one'}, {'id': 2, 'name': 'two'}, {'id': 3, 'name': 'three'}]
+
+
+def test_lazy_model_list_validates_on_access():
+    lazy = LazyModelList([dict(item) for item in ITEMS], Item)
+    assert len(lazy) == 3
+    assert lazy._models == [None, None, None]
+
+    assert lazy[1] == Item(id=2, name='two')
+    assert lazy._models[0] is None
+    assert lazy[1] is lazy[1]
+    assert lazy[-1].name == 'three'
+    assert [item.id for item in lazy[:2]] == [1, 2]
+    assert list(lazy) == [Item(**item) for item in ITEMS]
+    assert lazy == [Item(**item) for item in ITEMS]
+    assert lazy.raw == ITEMS
+    assert repr(lazy) == 'LazyModelList(Item, 3 items)'
+
+
+def test_build_models():
+    assert build_models(ITEMS, Item) == [Item(**item) for item in ITEMS]
+    assert isinstance(build_models(ITEMS, Item, 'lazy'), LazyModelList)
+    assert build_models(ITEMS, Item, 'raw') is ITEMS
+
+
+def test_detach_items():
+    response = {'count': 3, '_embedded': {'items': list(ITEMS)}}
+    assert detach_items(response, '_embedded', 'items') == ITEMS
+    assert response == {'count': 3, '_embedded': {'items': []}}
+
+    assert detach_items({'count': 0}, '_embedded', 'items') == []
+
+
+class Call(BaseModel):
+    uuid: str
+    from_: str = Field(..., validation_alias='from')
+    duration: Optional[int] = None
+
+
+def test_compact_records():
+    record_type = compact_record_type(Call)
+    assert record_type is compact_record_type(Call)
+    assert record_type.__name__ == 'CompactCall'
+
+    records = build_models([{'uuid': 'a', 'from': '1234', 'extra': 'x'}], Call, 'compact')
+    record = records[0]
+    assert isinstance(record, CompactRecord)
+    assert not hasattr(record, '__dict__')
+    assert (record.uuid, record.from_, record.duration) == ('a', '1234', None)
+    assert record == record_type.from_raw({'uuid': 'a', 'from': '1234'})
+    assert record.to_raw() == {'uuid': 'a', 'from': '1234'}
+    assert record.to_model() == Call(uuid='a', **{'from': '1234'})
+    assert repr(record) == "CompactCall(uuid='a', from_='1234', duration=None)"
+
+    with raises(AttributeError):
+        record.uuid = 'b'
+    with raises(AttributeError):
+        del record.uuid